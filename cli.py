@@ -1,26 +1,19 @@
 #!/usr/bin/env python3
+import argparse
 import os
-import sys
 import modules.io.IO as IO
-import modules.physics.evaluators
 import modules.render as rnr
-import modules.rules as csr
-from modules.io.datalogger import DataLogger
 from modules.io.latex import generate_latex_rep
-from modules.utils.constants import RHO_S
+from modules.pipeline import Evaluation
 from modules.utils.logger import Logger
 
 
-def evaluate_condition(hsm1, hsm2, bsp1, bsp2, ship, condition: dict[str, str], logger):
-    for case in (hsm1, hsm2, bsp1, bsp2):
-        csr.loading_cases_eval(ship, case, condition, logger)
-    Logger.info(' Pressure offloading to plates concluded. Evaluating plating thickness...')
-    Logger.info(' Evaluating Local Scantlings of stiffened plates...')
-    for case in (hsm1, hsm2, bsp1, bsp2):
-        csr.net_scantling(ship, case, condition['Dynamics'])
+def log_progress(stage: str, done: int, total: int, message: str):
+    if message:
+        Logger.info(f' {message}')
 
 
-def main(filepath, ship_plots, pressure_plots, export_to_TeX):
+def main(filepath, ship_plots, pressure_plots, export_to_TeX, recipes_path=None, screen=False, checkpoint=None):
     print(r"""
        ____  ____    _      __  __ ____  ____    
       / ___||  _ \  / \    |  \/  / ___||  _ \  
@@ -36,60 +29,48 @@ def main(filepath, ship_plots, pressure_plots, export_to_TeX):
     under Common Structural Rules 2022 Version.
     """)
 
-    # import geometry data
-    ship = IO.load_ship(filepath)
-    logger = DataLogger(ship)
-    logger.load_data()
+    # import geometry data, and the loading recipes if any (pipeline.RECIPES by default)
+    recipes = IO.load_recipes(recipes_path) if recipes_path is not None else None
+    evaluation = None
+    if checkpoint is not None and os.path.exists(checkpoint):
+        evaluation = Evaluation.resume(checkpoint, progress=log_progress, checkpoint=checkpoint)
+        if evaluation.filepath is None or os.path.realpath(evaluation.filepath) != os.path.realpath(filepath):
+            # the checkpoint of another envelope, which the fresh evaluation replaces
+            Logger.warning(f'The checkpoint {checkpoint} is of {evaluation.filepath}, not of {filepath}. '
+                           f'Starting afresh...')
+            evaluation = None
+        else:
+            Logger.info(f' Resuming from {checkpoint} after the stages: {", ".join(evaluation.outputs)}')
+            if recipes is not None:
+                evaluation.recipes = recipes
+    if evaluation is None:
+        evaluation = Evaluation(filepath, recipes=recipes, progress=log_progress, checkpoint=checkpoint)
+    evaluation.request('ship')
+    ship, logger = evaluation.ship, evaluation.logger
     Logger.success(f' The ship at location {filepath} has been successfully loaded.')
     if ship_plots:
         rnr.lines_plot(ship)
         for i in ('id', 'tag', 'thickness', 'material'):
             rnr.contour_plot(ship, key=i)
         rnr.block_plot(ship)
+    if screen:
+        # the hull girder checks of the net section alone, no pressure is evaluated
+        for key, (value, required) in evaluation.request('section properties')['section properties'].items():
+            Logger.info(f' {key} : {value:0.5g} {">=" if value >= required else "<"} {required:0.5g} by the rules')
+        return evaluation
     # calculate pressure distribution
-    Logger.info(' Evaluating Corrosion Reduction for stiffened plates...')
-    csr.corrosion_assign(ship, offload=True)
-    Logger.info(' Proceeding to calculating the Specified Static and Dynamic Cases..')
-    modules.physics.evaluators.static_total_eval(ship, 16, RHO_S)
-    hsm1, hsm2 = modules.physics.evaluators.dynamic_total_eval(ship, 16, 'HSM')
-    bsp1, bsp2 = modules.physics.evaluators.dynamic_total_eval(ship, 16, 'BSP')
-    logger.load_conds([x.cond for x in (hsm1, hsm2, bsp1, bsp2)])
+    evaluation.evaluate_loads()
     if pressure_plots:
-        rnr.pressure_plot(ship, 'HSM-1', 'SEA,ATM', path='./essay/HSM1_Shell.pdf')
-        rnr.pressure_plot(ship, 'STATIC', 'SEA,ATM', path='./essay/STATIC_Shell.pdf')
-        rnr.pressure_plot(ship, 'Normals', 'SEA', True, path='./essay/NORMALS.png')
-        rnr.pressure_plot(ship, 'HSM-2', 'SEA,ATM', path='./essay/HSM2_Shell.pdf')
-        rnr.pressure_plot(ship, 'BSP-1P', 'SEA,ATM', path='./essay/BSP1_Shell.pdf')
-        rnr.pressure_plot(ship, 'BSP-2P', 'SEA,ATM', path='./essay/BSP2_Shell.pdf')
+        rnr.export_figures(("pressure", rnr.pressure_data(ship, *args), path, {}) for *args, path in (
+            ('HSM-1', 'SEA,ATM', False, './essay/HSM1_Shell.pdf'),
+            ('STATIC', 'SEA,ATM', False, './essay/STATIC_Shell.pdf'),
+            ('Normals', 'SEA', True, './essay/NORMALS.png'),
+            ('HSM-2', 'SEA,ATM', False, './essay/HSM2_Shell.pdf'),
+            ('BSP-1P', 'SEA,ATM', False, './essay/BSP1_Shell.pdf'),
+            ('BSP-2P', 'SEA,ATM', False, './essay/BSP2_Shell.pdf'),
+        ))
 
-    Logger.info('Evaluating Stiffened Plates Slenderness Requirements...')
-    ship.evaluate_beff()
-    csr.buckling_evaluator(ship)
-
-    Logger.info('Static and Dynamic cases successfully evaluated. Proceeding to plating calculations..')
-    # calculation Recipes
-    flc = {
-        'Dynamics': 'S+D',
-        'max value': 'DC',
-        'skip value': 'LC,WB,OIL,FW,VOID'
-    }
-    wb = {
-        'Dynamics': 'S+D',
-        'max value': '',
-        'skip value': 'DC,LC,OIL,FW,VOID'
-    }
-
-    Logger.info(f'Evaluating Full Load Condition...')
-    evaluate_condition(hsm1, hsm2, bsp1, bsp2, ship, flc, logger)
-
-    Logger.info(f'Evaluating Water Ballast Condition...')
-    evaluate_condition(hsm1, hsm2, bsp1, bsp2, ship, wb, logger)
-
-    Logger.info('Evaluating the Sections Moments and Checking with the Rules...')
-    csr.ship_scantlings(ship)
-
-    Logger.info('Evaluating Corrosion Addition for stiffened plates...')
-    csr.corrosion_assign(ship, offload=False)
+    evaluation.evaluate_scantlings()
 
     if ship_plots:
         for i in ('tag', 'thickness'):
@@ -101,8 +82,17 @@ def main(filepath, ship_plots, pressure_plots, export_to_TeX):
         Logger.info('Generating LaTeX Report Data to /out.json file...')
         generate_latex_rep(logger, path='./essay/', standalone=False)
         Logger.success('Program terminated successfully!')
+    return evaluation
 
 
 if __name__ == "__main__":
     # Single Step Manual Design evaluation
-    main(os.path.expanduser(sys.argv[1]), False, False, False)
+    parser = argparse.ArgumentParser(description='CSR evaluation of a ship envelope.')
+    parser.add_argument('envelope', help='ship envelope (JSON)')
+    parser.add_argument('recipes', nargs='?', default=None, help='loading recipes (JSON), pipeline.RECIPES by default')
+    parser.add_argument('--screen', action='store_true', help='only the In50/Zn50 checks of the net section')
+    parser.add_argument('--checkpoint', default=None,
+                        help='save the evaluation here after every stage, and resume from it when it exists')
+    args = parser.parse_args()
+    main(os.path.expanduser(args.envelope), False, False, False,
+         os.path.expanduser(args.recipes) if args.recipes else None, args.screen, args.checkpoint)
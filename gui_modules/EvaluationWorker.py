@@ -0,0 +1,117 @@
+import threading
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+
+from modules.pipeline import Evaluation, EvaluationCancelled
+from modules.utils.logger import Logger
+
+
+class WorkerSignals(QObject):
+    """
+    QRunnable is not a QObject, so its signals live here. They are queued to the receivers' (UI) thread.
+    """
+    progress = Signal(str, int, int, str)  # stage, done, total, message
+    finished = Signal(object)  # the finished Evaluation
+    cancelled = Signal()
+    failed = Signal(str)
+
+
+class EvaluationWorker(QRunnable):
+    """
+    Runs the ship loading and, if evaluate is set, the whole CSR pipeline off the UI thread.
+    Progress is streamed per stage and per load case; cancel() stops the run at the next step.
+    """
+
+    def __init__(self, filepath: str = None, ship=None, evaluate=True):
+        super().__init__()
+        self.filepath = filepath
+        self.ship = ship
+        self.evaluate = evaluate
+        self.signals = WorkerSignals()
+        self._cancel = threading.Event()
+        # the service keeps a reference until the worker reports back
+        self.setAutoDelete(False)
+
+    def cancel(self):
+        self._cancel.set()
+
+    def run(self):
+        evaluation = Evaluation(self.filepath, ship=self.ship, progress=self.signals.progress.emit,
+                                is_cancelled=self._cancel.is_set)
+        try:
+            evaluation.load()
+            if self.evaluate:
+                evaluation.evaluate_loads()
+                evaluation.evaluate_scantlings()
+            evaluation.tabulate()
+        except EvaluationCancelled as e:
+            Logger.warning(str(e))
+            self.signals.cancelled.emit()
+            return
+        except (Exception, SystemExit) as e:
+            # the rules quit() on invalid designs, that must not take the GUI down with the worker thread
+            self.signals.failed.emit(f'{type(e).__name__}: {e}')
+            return
+        self.signals.finished.emit(evaluation)
+
+
+class EvaluationService(QObject):
+    """
+    Starts EvaluationWorkers on the global QThreadPool, one at a time, and relays their signals.
+    """
+    progress = Signal(str, int, int, str)
+    finished = Signal(object)
+    cancelled = Signal()
+    failed = Signal(str)
+
+    def __init__(self, parent=None, pool: QThreadPool = None):
+        super().__init__(parent)
+        self.pool = pool or QThreadPool.globalInstance()
+        self.worker: EvaluationWorker | None = None
+
+    @property
+    def running(self) -> bool:
+        return self.worker is not None
+
+    def start(self, filepath: str = None, ship=None, evaluate=True) -> EvaluationWorker:
+        self.cancel()
+        worker = EvaluationWorker(filepath, ship, evaluate)
+        # bound slots of this (UI thread) object, so the worker's signals are queued to the UI thread
+        worker.signals.progress.connect(self._progress)
+        worker.signals.finished.connect(self._finished)
+        worker.signals.cancelled.connect(self._cancelled)
+        worker.signals.failed.connect(self._failed)
+        self.worker = worker
+        self.pool.start(worker)
+        return worker
+
+    def cancel(self):
+        if self.worker is not None:
+            self.worker.cancel()
+
+    def _current(self, done=False) -> bool:
+        # a cancelled run may still report after its replacement was started
+        current = self.worker is not None and self.sender() is self.worker.signals
+        if current and done:
+            self.worker = None
+        return current
+
+    @Slot(str, int, int, str)
+    def _progress(self, stage, done, total, message):
+        if self._current():
+            self.progress.emit(stage, done, total, message)
+
+    @Slot(object)
+    def _finished(self, evaluation):
+        if self._current(done=True):
+            self.finished.emit(evaluation)
+
+    @Slot()
+    def _cancelled(self):
+        if self._current(done=True):
+            self.cancelled.emit()
+
+    @Slot(str)
+    def _failed(self, message):
+        if self._current(done=True):
+            self.failed.emit(message)
@@ -1,15 +1,17 @@
+import copy
 from functools import partial
 
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (QLabel, QPushButton, QVBoxLayout, QStackedLayout, QMainWindow)
-from PySide6.QtWidgets import (QWidget, QFileDialog)
+from PySide6.QtWidgets import (QWidget, QFileDialog, QProgressBar)
 
 from gui_modules.PlotRenderWidget import DiagramPanel
 from gui_modules.TableWidget import TablesPanel
-from gui_modules.ToolBarActions import ExitAction, LoadAction, SaveAction, AboutAction
+from gui_modules.EvaluationWorker import EvaluationService
+from gui_modules.ToolBarActions import ExitAction, LoadAction, SaveAction, AboutAction, EvaluateAction, CancelAction
+from modules.pipeline import Evaluation
 from modules.utils.logger import Logger
 import modules.io.IO as IO
-from modules.io.datalogger import DataLogger
     
 class AuxWindow(QWidget):
     """
@@ -53,13 +55,23 @@ class MainWindow(QMainWindow):
         self.setCentralWidget(self.canvas)
         # Create Auxiliary windows
         self.about_win = AuxWindow([QLabel(title, alignment=Qt.AlignCenter)], "About")
-        self.load_save_window(0)
+        # Loading and evaluation run off the UI thread
+        self.service = EvaluationService(self)
+        self.service.progress.connect(self.show_progress)
+        self.service.finished.connect(self.evaluation_finished)
+        self.service.cancelled.connect(partial(self.evaluation_stopped, 'Evaluation cancelled'))
+        self.service.failed.connect(self.evaluation_failed)
         # Main Menu bar
         self.menu = self.menuBar()
         self.menu_file = self.menu.addMenu('File')
         self.menu_file.addAction(ExitAction(self))
         self.menu_file.addAction(LoadAction(self, partial(self.load_save_window, 0)))
         self.menu_file.addAction(SaveAction(self, partial(self.load_save_window, 1)))
+        self.menu_run = self.menu.addMenu('Run')
+        self.evaluate_action = EvaluateAction(self, self.evaluate)
+        self.cancel_action = CancelAction(self, self.service.cancel)
+        self.menu_run.addAction(self.evaluate_action)
+        self.menu_run.addAction(self.cancel_action)
         # self.menu_about = self.menu.addMenu('About')
         self.menu.addAction(
             AboutAction(self, partial(self.show_new_window, self.about_win)))
@@ -79,6 +91,12 @@ class MainWindow(QMainWindow):
         layout.addWidget(self.button)
         self.setLayout(layout)
         self.button.clicked.connect(self.say_hello)
+        # Progress of the running evaluation
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setMaximumWidth(240)
+        self.progress_bar.hide()
+        self.statusBar().addPermanentWidget(self.progress_bar)
+        self.load_save_window(0)
         # self.fig.set_canvas(self.canvas)
         # self._ax = self.canvas.figure.add_subplot()
         # self._ax = ax
@@ -101,11 +119,8 @@ class MainWindow(QMainWindow):
             data = LoadFileDialog(mode=mode).getOpenFileName(self, 'Load', '.', "Project Files (*.json)")
             if data[0] != '':
                 if data[0][-5:] == '.json':
-                    self.ship = IO.load_ship(data[0])
-                    self.data_logger = DataLogger(self.ship)
-                    self.data_logger.create_tabular_data()
+                    self.run_service(filepath=data[0], evaluate=False)
                     self.setWindowTitle(f'SDA MSD ver.:0.1 {data[0]}')
-                    print(self.ship.LBP)
                 else:
                     Logger.warning('Ship data files are .json files')
             elif data[0] == '' and self.ship is None:
@@ -116,3 +131,42 @@ class MainWindow(QMainWindow):
             data = LoadFileDialog(mode=mode).getOpenFileName(self, "Save", '.', "Project Files (*.json)")
             if data[0] != '':
                 IO.ship_save(self.ship, data[0][:-5] + '_new.json')
+
+    def run_service(self, **kwargs):
+        self.evaluate_action.setEnabled(False)
+        self.cancel_action.setEnabled(True)
+        self.progress_bar.setValue(0)
+        self.progress_bar.show()
+        self.service.start(**kwargs)
+
+    def evaluate(self):
+        if self.ship is None:
+            Logger.warning('Load a ship before evaluating it')
+            return
+        # the pipeline mutates the ship on the worker, the one on display is only replaced once it has finished
+        self.run_service(ship=copy.deepcopy(self.ship), evaluate=True)
+
+    def show_progress(self, stage: str, done: int, total: int, message: str):
+        self.progress_bar.setFormat(f'{stage}: %p%')
+        self.progress_bar.setRange(0, max(total, 1))
+        self.progress_bar.setValue(done)
+        if message:
+            self.statusBar().showMessage(message)
+
+    def evaluation_finished(self, evaluation: Evaluation):
+        self.ship = evaluation.ship
+        self.data_logger = evaluation.logger
+        self.table.set_data_logger(self.data_logger)
+        # an evaluation works on a copy of the displayed ship, a loaded ship is a new one
+        self.graph.set_ship(self.ship, evaluated='scantlings' in evaluation.outputs)
+        self.evaluation_stopped('Ready')
+
+    def evaluation_failed(self, message: str):
+        Logger.warning(f'Evaluation failed: {message}')
+        self.evaluation_stopped(f'Evaluation failed: {message}')
+
+    def evaluation_stopped(self, message: str):
+        self.evaluate_action.setEnabled(True)
+        self.cancel_action.setEnabled(False)
+        self.progress_bar.hide()
+        self.statusBar().showMessage(message)
@@ -1,6 +1,6 @@
-import enum
 from functools import partial
 
+import numpy as np
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QComboBox
 from matplotlib.backends.backend_qtagg import FigureCanvas
 from matplotlib.figure import Figure
@@ -9,45 +9,83 @@ import modules.render as rnr
 from modules.baseclass.ship import Ship
 
 
-class RendererS(enum.Enum):
-    OutlinePlot = rnr.lines_plot
-    BlocksPlot = rnr.block_plot
-    PressPlot = rnr.pressure_plot
-    ThickPlot = partial(rnr.contour_plot, key='thickness')
-    SpacePlot = partial(rnr.contour_plot, key='spacing')
-    MatPlot = partial(rnr.contour_plot, key='material')
-    TagPlot = partial(rnr.contour_plot, key='tag')
-    IdPlot = partial(rnr.contour_plot, key='id')
-
-
-TEXTS = {
-    'Outline Plot': RendererS.OutlinePlot,
-    'Blocks Plot': RendererS.BlocksPlot,
-    'Pressure Plot': RendererS.PressPlot,
-    'Thickness Plot': RendererS.ThickPlot.value,
-    'Stiffener Spacing Plot': RendererS.SpacePlot.value,
-    'Plating Material Plot': RendererS.MatPlot.value,
-    'Plating Tag Plot': RendererS.TagPlot.value,
-    'Plating Id Plot': RendererS.IdPlot.value
+def _same(a, b) -> bool:
+    """
+    Deep comparison of two render payloads.
+    """
+    if isinstance(a, dict):
+        return isinstance(b, dict) and a.keys() == b.keys() and all(_same(a[i], b[i]) for i in a)
+    if isinstance(a, (list, tuple)):
+        return isinstance(b, (list, tuple)) and len(a) == len(b) and all(_same(i, j) for i, j in zip(a, b))
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        return np.array_equal(a, b)
+    return a == b
+
+
+def unchanged(ax, previous, data) -> bool:
+    # plots that do not follow the evaluation are kept as long as their payload is the same
+    return _same(previous, data)
+
+
+# text -> (payload, drawer, in place update of the drawn payload; None to always redraw)
+PLOTS = {
+    'Outline Plot': (rnr.outline_data, rnr.draw_outline, unchanged),
+    'Blocks Plot': (rnr.block_data, rnr.draw_blocks, unchanged),
+    'Pressure Plot': (partial(rnr.pressure_data, pressure_index='STATIC', block_types='SEA,ATM'),
+                      rnr.draw_pressure, None),
+    'Thickness Plot': (partial(rnr.contour_data, key='thickness'), rnr.draw_contour, rnr.recolor_contour),
+    'Stiffener Spacing Plot': (partial(rnr.contour_data, key='spacing'), rnr.draw_contour, rnr.recolor_contour),
+    'Plating Material Plot': (partial(rnr.contour_data, key='material'), rnr.draw_contour, rnr.recolor_contour),
+    'Plating Tag Plot': (partial(rnr.contour_data, key='tag'), rnr.draw_contour, rnr.recolor_contour),
+    'Plating Id Plot': (partial(rnr.contour_data, key='id'), rnr.draw_contour, rnr.recolor_contour),
 }
 
 
+class PlotView:
+    """
+    The artists of a plot type, drawn once on their own axes of the panel's figure and hidden while another
+    plot is shown. background holds the rendered figure for blitting, dirty marks a view that is behind the ship.
+    """
+
+    def __init__(self, fig: Figure, payload, drawer):
+        before = set(fig.axes)
+        self.ax = fig.add_subplot()
+        drawer(payload, fig=fig, ax=self.ax)
+        # the main axes together with their colour bars
+        self.axes = [i for i in fig.axes if i not in before]
+        self.payload = payload
+        self.background = None
+        self.dirty = False
+
+    def set_visible(self, visible: bool):
+        for ax in self.axes:
+            ax.set_visible(visible)
+
+    def remove(self):
+        for ax in self.axes:
+            ax.remove()
+
+
 class DiagramPanel(QWidget):
     """
     The panel to be imported in the main window that will also handle the
-    transition between the different plots
+    transition between the different plots. Every plot is drawn the first time it is shown and then swapped
+    in and out of the figure; after an evaluation the drawn collections are only recoloured.
     """
 
     def __init__(self, ship: Ship, parent: QWidget | None = ..., **kwargs) -> None:
         super().__init__(parent)
         self.ship = ship
+        self.views: dict[str, PlotView] = {}
+        self.current: str | None = None
         # Instantiate the Dropdown menu
         self.dropDown = QComboBox()
-        self.dropDown.addItems(TEXTS.keys())
+        self.dropDown.addItems(PLOTS.keys())
         self.dropDown.currentTextChanged.connect(self.update_plot)
         self.fig = Figure(figsize=(6.4, 4.8))
         self.fig_canvas = FigureCanvas(self.fig)
-        # self.fig_canvas = MplCanvas(self)
+        self.fig_canvas.mpl_connect('draw_event', self._capture)
+        self.fig_canvas.mpl_connect('resize_event', self._invalidate)
 
         layout = QVBoxLayout()
         layout.addWidget(self.fig_canvas)
@@ -55,11 +93,57 @@ class DiagramPanel(QWidget):
         self.setLayout(layout)
         self.update_plot('Outline Plot')
 
+    def set_ship(self, ship: Ship, evaluated: bool = False):
+        """
+        A new ship drops every drawn plot. The same ship, or an evaluated copy of the displayed one, only marks
+        them for an update, so that their drawn artists get recoloured.
+        """
+        if ship is not self.ship and not evaluated:
+            self.clear()
+        else:
+            for view in self.views.values():
+                view.dirty = True
+        self.ship = ship
+        self.update_plot(self.dropDown.currentText())
+
+    def clear(self):
+        for view in self.views.values():
+            view.remove()
+        self.views.clear()
+        self.current = None
+
+    def view(self, text: str) -> PlotView:
+        payload_f, drawer, update = PLOTS[text]
+        view = self.views.get(text)
+        if view is not None and view.dirty:
+            payload = payload_f(self.ship)
+            if update is not None and update(view.ax, view.payload, payload):
+                view.payload, view.dirty, view.background = payload, False, None
+            else:
+                view.remove()
+                view = self.views[text] = PlotView(self.fig, payload, drawer)
+        elif view is None:
+            view = self.views[text] = PlotView(self.fig, payload_f(self.ship), drawer)
+        return view
+
     def update_plot(self, text, **kwargs):
-        print(text)
-        plot = TEXTS[text]
-        # Reset the figure 
-        self.fig.clear()
-        self._ax = self.fig_canvas.figure.add_subplot()
-        plot(self.ship, fig=self.fig, ax=self._ax, **kwargs)
-        self.fig_canvas.draw()
+        if self.ship is None:
+            return
+        view = self.view(text)
+        for other in self.views.values():
+            other.set_visible(other is view)
+        self.current = text
+        if view.background is None:
+            # the draw event stores the background for the next time
+            self.fig_canvas.draw()
+        else:
+            self.fig_canvas.restore_region(view.background)
+            self.fig_canvas.blit(self.fig.bbox)
+
+    def _capture(self, event):
+        if self.current in self.views:
+            self.views[self.current].background = self.fig_canvas.copy_from_bbox(self.fig.bbox)
+
+    def _invalidate(self, event):
+        for view in self.views.values():
+            view.background = None
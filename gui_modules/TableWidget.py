@@ -1,64 +1,180 @@
-from typing import Optional
-from PySide6.QtWidgets import (QTableWidget, QTableWidgetItem, QItemDelegate)
+from PySide6.QtWidgets import (QTableView, QLineEdit)
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QComboBox, QStackedLayout)
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
 from modules.utils.logger import Logger
 from modules.io.datalogger import DataLogger
 
+# (panel name, DataLogger rows attribute, DataLogger header attribute)
+TABLES = (
+    # ('Pressures Table', 'Press_D', 'Press_Header'),
+    ('Plating Table', 'Plate_D', 'Plate_Header'),
+    ('Stiffeners Table', 'Stiff_D', 'Stiff_Header'),
+    ('Stiffened Plates Table', 'St_Pl_D', 'St_Pl_Header'),
+    ('Ordinary Section Table', 'PrimS_D', 'PrimS_Header'),
+)
+
+
+class DataLoggerTableModel(QAbstractTableModel):
+    """
+    Read only model over one of the DataLogger's row lists. Cells are formatted only when the view asks for them.
+    Group annotation rows (plain strings) are shown in the first column.
+    """
+
+    def __init__(self, data_logger: DataLogger, rows: str, header: str, parent=None):
+        super().__init__(parent)
+        self.data_logger = data_logger
+        self.rows_attr = rows
+        self.header_attr = header
+        self.header = list(getattr(data_logger, header))
+        self._rows = list(getattr(data_logger, rows))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.header)
+
+    def value(self, row: int, column: int):
+        line = self._rows[row]
+        if isinstance(line, str):
+            return line if column == 0 else None
+        return line[column] if column < len(line) else None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            val = self.value(index.row(), index.column())
+            return None if val is None else str(val)
+        if role == Qt.UserRole:
+            # raw value, used for sorting
+            return self.value(index.row(), index.column())
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and section < len(self.header):
+            return self.header[section]
+        return super().headerData(section, orientation, role)
+
+    def refresh(self, data_logger: DataLogger | None = None):
+        """
+        Re-reads the rows of the DataLogger, or of the one that replaces it (every evaluation returns a new one).
+        Only the rows that changed are signalled to the views, a full reset is only issued when the row count
+        or the header changes.
+        """
+        if data_logger is not None:
+            self.data_logger = data_logger
+        rows = list(getattr(self.data_logger, self.rows_attr))
+        header = list(getattr(self.data_logger, self.header_attr))
+        if len(rows) != len(self._rows) or header != self.header:
+            self.beginResetModel()
+            self._rows, self.header = rows, header
+            self.endResetModel()
+            return
+
+        changed = [i for i, (old, new) in enumerate(zip(self._rows, rows)) if old is not new and old != new]
+        self._rows = rows
+        last = self.columnCount() - 1
+        # signal contiguous runs of changed rows at once
+        start = None
+        for n, i in enumerate(changed):
+            if start is None:
+                start = i
+            if n + 1 == len(changed) or changed[n + 1] != i + 1:
+                self.dataChanged.emit(self.index(start, 0), self.index(i, last))
+                start = None
+
+
+class TableFilterProxy(QSortFilterProxyModel):
+    """
+    Sorts on the raw values of the DataLoggerTableModel and filters rows on any column's text.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setSortRole(Qt.UserRole)
+        self.setFilterKeyColumn(-1)
+        self.setFilterCaseSensitivity(Qt.CaseInsensitive)
+
+    def lessThan(self, left, right):
+        a, b = left.data(Qt.UserRole), right.data(Qt.UserRole)
+        try:
+            return a < b
+        except TypeError:
+            # mixed types (numbers, 'Not Evaluated', group rows) fall back to their text
+            return str(a) < str(b)
+
+
+class Table(QTableView):
+    def __init__(self, model: DataLoggerTableModel, parent=None):
+        super(Table, self).__init__(parent)
+        self.source = model
+        self.proxy = TableFilterProxy(self)
+        self.proxy.setSourceModel(model)
+        self.setModel(self.proxy)
+        self.setSortingEnabled(True)
+        # keep the DataLogger's order until the user asks for a sort
+        self.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+
+    def set_filter(self, text: str):
+        self.proxy.setFilterFixedString(text)
 
-class AlignDelegate(QItemDelegate):
-    # https://stackoverflow.com/questions/46772790/pyside-align-text-in-a-table-cells
-    def paint(self, painter, option, index):
-        option.displayAlignment = Qt.AlignCenter
-        # option.
-        QItemDelegate.paint(self, painter, option, index)
 
 class TablesPanel(QWidget):
+    """
+    The tables are built the first time they are shown, each one is a view over the DataLogger rows.
+    """
+
     def __init__(self, data_logger: DataLogger, parent: QWidget | None = ...) -> None:
         super().__init__(parent)
         self.data_logger = data_logger
-        # multiple tables instantiation
-        # self.Press_Table = Table(self.data_logger.Press_D, self.data_logger.Press_Header )
-        self.Plate_Table = Table(self.data_logger.Plate_D, self.data_logger.Plate_Header )
-        self.Stiff_Table = Table(self.data_logger.Stiff_D, self.data_logger.Stiff_Header )
-        self.St_Pl_Table = Table(self.data_logger.St_Pl_D, self.data_logger.St_Pl_Header )
-        self.PrimS_Table = Table(self.data_logger.PrimS_D, self.data_logger.PrimS_Header )
+        self.tables: dict[int, Table] = {}
         main_layout = QVBoxLayout()
         self.table_layout = QStackedLayout()
-        # self.table_layout.addWidget(self.Press_Table)
-        self.table_layout.addWidget(self.Plate_Table)
-        self.table_layout.addWidget(self.Stiff_Table)
-        self.table_layout.addWidget(self.St_Pl_Table)
-        self.table_layout.addWidget(self.PrimS_Table)
-        self.panels_names = [
-                            # 'Pressures Table',
-                            'Plating Table',
-                            'Stiffeners Table',
-                            'Stiffened Plates Table',
-                            'Ordinary Section Table']
+        self.placeholders = [QWidget() for _ in TABLES]
+        for i in self.placeholders:
+            self.table_layout.addWidget(i)
+        self.panels_names = [i[0] for i in TABLES]
+        self.filter = QLineEdit()
+        self.filter.setPlaceholderText('Filter rows...')
+        self.filter.textChanged.connect(self.filter_table)
         self.dropDown = QComboBox()
         self.dropDown.addItems(self.panels_names)
         self.dropDown.currentIndexChanged.connect(self.switch_table)
+        main_layout.addWidget(self.filter)
         main_layout.addLayout(self.table_layout)
         main_layout.addWidget(self.dropDown)
         self.setLayout(main_layout)
+        self.switch_table(0)
+
+    def table(self, index: int) -> Table:
+        if index not in self.tables:
+            _, rows, header = TABLES[index]
+            table = Table(DataLoggerTableModel(self.data_logger, rows, header), self)
+            self.table_layout.replaceWidget(self.placeholders[index], table)
+            self.placeholders[index].deleteLater()
+            self.placeholders[index] = table
+            self.tables[index] = table
+        return self.tables[index]
+
+    def set_data_logger(self, data_logger: DataLogger):
+        """
+        Points the built tables to the DataLogger of an evaluation; their models are kept and only the rows
+        that differ from the ones shown are updated.
+        """
+        self.data_logger = data_logger
+        for table in self.tables.values():
+            table.source.refresh(data_logger)
+        self.switch_table(self.dropDown.currentIndex())
 
     def switch_table(self, index: int):
-        self.table_layout.setCurrentIndex(index)
-
-class Table(QTableWidget):
-    def __init__(self,data,header,parent=None):
-        super(Table,self).__init__(parent)
-        self.horizontalHeader()
-        self.populate_table(data,header)
-
-    def populate_table(self,data,header):
-        self.setRowCount((len(data)))
-        self.setColumnCount(len(data[1]))
-        self.setHorizontalHeaderLabels(header)
-        for i, cell in enumerate(data):
-            if isinstance(cell, list) or isinstance(cell, tuple):
-                [self.setItem(i,j,QTableWidgetItem(str(item))) for j, item in enumerate(cell)]
-            elif isinstance(cell, str):
-                self.setItem(i,0,QTableWidgetItem(cell))
-        self.setItemDelegate(AlignDelegate())
\ No newline at end of file
+        if self.data_logger is None:
+            return
+        table = self.table(index)
+        table.set_filter(self.filter.text())
+        self.table_layout.setCurrentWidget(table)
+
+    def filter_table(self, text: str):
+        self.table(self.dropDown.currentIndex()).set_filter(text)
@@ -33,3 +33,20 @@ class AboutAction(QAction):
         super().__init__(parent)
         self.setText('About')
         self.triggered.connect(f)
+
+
+class EvaluateAction(QAction):
+    def __init__(self, parent, f):
+        super().__init__(parent)
+        self.setText('Evaluate')
+        self.setShortcut(QKeySequence(Qt.CTRL | Qt.Key_E))
+        self.triggered.connect(f)
+
+
+class CancelAction(QAction):
+    def __init__(self, parent, f):
+        super().__init__(parent)
+        self.setText('Cancel Evaluation')
+        self.setShortcut(QKeySequence(Qt.Key_Escape))
+        self.setEnabled(False)
+        self.triggered.connect(f)
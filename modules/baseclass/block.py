@@ -2,7 +2,7 @@ import math
 
 from modules.baseclass.stiff_plate import StiffPlate
 from modules.utils.decorators import auto_str
-from modules.utils.operations import d2r, linespace, normals_2d
+from modules.utils.operations import d2r
 from modules.utils.logger import Logger
 
 
@@ -23,15 +23,11 @@ class Block:
     ------------------------------------------
     In order to properly calculate the Pressure Distributions the normal Vectors need to be properly evaluated.
     Is considered that the Global Positive Direction is upwards of Keel (z = 0) towards the Main Deck.
-    However, the local positive axis are outwards for the internal Tanks and inwards for
-    the SEA and ATMosphere Blocks. So, pay attention to the way the plates are inserted and blocks are evaluated.
-    It would be preferable to have a counterclockwise plate definition order for shell plates and a clockwise order
-    for internal plates. Also, use the minus before each plate id at the input file to address the block's boundary direction on the specified plate.
-    For example, a shell plate at Draught has a certain orientation that is uniform with the SEA block
-    (the stiffeners (and normals) are facing inwards) while the WB block requires a different direction
-    (normals facing outwards). For this purpose, the id in the WB block would be
-    -id.
-    !!! BE CAREFUL THAT A CLOSED SMOOTH GEOMETRY IS CREATED !!! Verify the block appropriate set up using the
+    The Ship orders and orients the plates of every block's boundary from their end points (topology.py), so the
+    block lies on the right-hand side of its boundary (clockwise) and its normals point into it; the order and the
+    signs of the ids in the input file do not matter. A plate may end on the face of another (a T-junction), any
+    other gap, an unclosed boundary or a plate bounding more than two blocks is reported when the ship is built.
+    Verify the block appropriate set up using the
     *block_plot(ship)* and *pressure_plot(ship,'Null','<block tag>')* rendering methods.
 
         Args:
@@ -61,7 +57,7 @@ class Block:
 
         self.coords = []
         self.pressure_coords = []
-        self.plates_indices = []  # Holds data for the plate's id at a certain grid point
+        self.spans = {}  # plate id -> (start, stop, forward) view of the plate's mesh in the pressure grid
         self.CG = []
 
         self.eta = []  # Evaluates the normal vectors of each block
@@ -72,25 +68,22 @@ class Block:
             self.Kc = None
 
     def Kc_eval(self, start, end, stiff_plate_type):
-        if self.Kc is not None:
-            try:
-                kc = lambda a: math.cos(a) ** 2 + (1 - math.sin(d2r(self.payload['psi']))) * math.sin(a) ** 2
-            except KeyError:
-                Logger.error(f'The required \'psi\' value is missing in the payload declaration.')
-            if stiff_plate_type not in (3, 5, 4):
-                dx = end[0] - start[0]
-                dy = end[1] - start[1]
-                alpha = math.atan2(dy, dx)
-                self.Kc.append(kc(alpha))
-            else:
-                self.Kc.append(0)
-        else:
-            pass
-
-    def get_coords(self, stiff_plates: list[StiffPlate]):
+        try:
+            kc = lambda a: math.cos(a) ** 2 + (1 - math.sin(d2r(self.payload['psi']))) * math.sin(a) ** 2
+        except KeyError:
+            Logger.error(f'The required \'psi\' value is missing in the payload declaration.')
+        if stiff_plate_type not in (3, 5, 4):
+            dx = end[0] - start[0]
+            dy = end[1] - start[1]
+            alpha = math.atan2(dy, dx)
+            return kc(alpha)
+        return 0
+
+    def get_coords(self, stiff_plates: list[StiffPlate], grid: dict = None):
         """
         Get the coordinates of the block from its list of plates. TO BE CALLED AFTER THE BLOCKS ARE VALIDATED!!!
-        If the block is not calculated correctly then you need to change the id order in the save file.
+        The Ship's validation orders and orients the list of plates (topology.py) beforehand.
+        grid holds the Plate.mesh() arguments.
         """
         # for i in self.list_plates_id:
         Dx = 0.1
@@ -112,8 +105,6 @@ class Block:
                         N = j.plate.length // Dx  # Weight the points relative to plate length
                         if start not in self.coords:
                             self.coords.append(start)
-                            self.Kc_eval(start, end, j.tag)
-                            self.plates_indices.append(-1)  # Null id
                             Mx += N * start[0] - start_p[0]
                             My += N * start[1] - start_p[1]
                             A += N * 1
@@ -127,66 +118,52 @@ class Block:
                                     r_ = range(len(X) - 2, 0, -1)
                                 for i in r_:
                                     self.coords.append((X[i], Y[i]))
-                                    self.Kc_eval(start, end, j.tag)
-                                    self.plates_indices.append(j.id)
                                     Mx += N * X[i] / s - start_p[0]
                                     My += N * Y[i] / s - start_p[1]
                                     A += N * 1 / s
                             else:
                                 self.coords.append(end)
-                                self.Kc_eval(start, end, j.tag)
-                                self.plates_indices.append(j.id)
                                 Mx += N * end[0] - start_p[0]
                                 My += N * end[1] - start_p[1]
                                 A += N * 1
                     elif len(self.coords) == 0:
                         # c is not incremented to re-parse the first plate and register its end point
                         self.coords.append(start)
-                        self.Kc_eval(start, end, j.tag)
-                        # self.plates_indices.append(j.id)
                         start_p = start
                         A += j.plate.length // Dx
 
                     break
 
         self.CG = [Mx / A, My / A] if not self.symmetrical else [0, My / A]
-        self.calculate_pressure_grid(10)
+        self.calculate_pressure_grid(stiff_plates, **(grid or {}))
         # self.calculate_CG()
 
-    def calculate_pressure_grid(self, resolution: int):
+    def calculate_pressure_grid(self, stiff_plates: list[StiffPlate], resolution: int = 10, spacing: float = None,
+                                levels=()):
         """
         Create a 1D computational mesh to calculate the loads pressure distributions.
         Simply calculating with the geometric coordinates does not hold enough precision.
-        The pressure coordinates are calculated on a standard Ds between two points using linear interpolation.
+        The block is evaluated on the sampling meshes of its boundary plates (Plate.mesh()), which it shares with
+        the block on the other side of each plate: the pressure coordinates are the plates' meshes in the block's
+        order and direction, every plate with its own end points, normals and Kc. spans is the block's view of
+        each plate's mesh, so the two sides of a plate are evaluated on the very same points.
         """
+        plates = {i.id: i for i in stiff_plates}
+        self.pressure_coords, self.eta, self.spans = [], [], {}
         K = []
-        P = []
-        temp = linespace(1, resolution, 1)
-        for i in range(len(self.coords) - 1):
-            # eliminate duplicate entries -> no problems with normal vectors
-            if self.coords[i] not in self.pressure_coords:
-                self.pressure_coords.append(self.coords[i])
-                if self.Kc is not None:
-                    K.append(self.Kc[i])
-            dy = self.coords[i + 1][1] - self.coords[i][1]
-            dx = self.coords[i + 1][0] - self.coords[i][0]
-            span = math.sqrt(dy ** 2 + dx ** 2)
-            phi = math.atan2(dy, dx)
-            for j in temp:
-                self.pressure_coords.append((self.coords[i][0] + span / resolution * j * math.cos(phi),
-                                             self.coords[i][1] + span / resolution * j * math.sin(phi)))
-                P.append(self.plates_indices[i])
-                if self.Kc is not None:
-                    K.append(self.Kc[i])
-            self.pressure_coords.append(self.coords[i + 1])
-            P.append(self.plates_indices[i])
+        for _id in self.list_plates_id:
+            st_pl = plates[abs(_id)]
+            points, normals = st_pl.plate.mesh(resolution, spacing, levels)
+            forward = _id >= 0
+            start = len(self.pressure_coords)
+            self.pressure_coords.extend(points if forward else points[::-1])
+            self.eta.extend(normals if forward else [(-x, -y) for x, y in normals[::-1]])
             if self.Kc is not None:
-                K.append(self.Kc[i + 1])
+                K.extend([self.Kc_eval(st_pl.plate.start, st_pl.plate.end, st_pl.tag)] * len(points))
+            self.spans[st_pl.id] = (start, len(self.pressure_coords), forward)
 
-        self.plates_indices = P
         if self.Kc is not None:
             self.Kc = K
-        self.eta = normals_2d(self.pressure_coords)
 
     def render_data(self):
         X = [i[0] for i in self.coords]
@@ -214,28 +191,23 @@ class Block:
         return X, Y, P
 
     def pressure_over_plate(self, stiff_plate: StiffPlate, pressure_index):
-        start = True
-        x0, x1 = 0, 0
-        if (stiff_plate.id in self.list_plates_id) or (-stiff_plate.id in self.list_plates_id):
-            for i, val in enumerate(self.plates_indices):
-                if val == stiff_plate.id and start:
-                    x0 = i
-                    start = False
-                elif val != stiff_plate.id and not start:
-                    x1 = i - 1
-                    break
-                elif i == len(self.plates_indices) - 1:
-                    x1 = i
+        """
+        The (x, y, eta x, eta y, P) of the block over the plate's mesh, in the plate's own direction whichever the
+        block's, i.e. point by point the same as the other side's.
+        """
+        if stiff_plate.id in self.spans:
+            start, stop, forward = self.spans[stiff_plate.id]
+            indices = range(start, stop) if forward else range(stop - 1, start - 1, -1)
             try:
-                return [(*self.pressure_coords[i], *self.eta[i], self.Pressure[pressure_index][i]) for i in
-                        range(x0, x1 + 1, 1)]
+                P = self.Pressure[pressure_index]
             except KeyError:
                 # known and expected scenario, thus no need for warning spam
                 if self.space_type != 'ATM' and pressure_index != 'STATIC':
                     Logger.warning(
                         f'{pressure_index} is not calculated '
                         f'for block {self}. !Returning zeros as pressure!')
-                return [(*self.pressure_coords[i], *self.eta[i], 0) for i in range(x0, x1 + 1, 1)]
+                return [(*self.pressure_coords[i], *self.eta[i], 0) for i in indices]
+            return [(*self.pressure_coords[i], *self.eta[i], P[i]) for i in indices]
 
         Logger.warning(
             f'Requesting pressure over plate {stiff_plate} '
@@ -1,7 +1,6 @@
 import math
 
 import numpy as np
-from matplotlib import pyplot as plt
 
 from modules.utils.decorators import auto_str
 from modules.utils.logger import Logger
@@ -31,7 +30,11 @@ class Plate:
     The plate class is the bottom plate (no pun intended) class that is responsible for all geometry elements.
     Initializing a plate item requires the start and end point coordinates in meters, the plate's thickness in mm,
     and the plate's chosen material.
+    Bilge plates are quarter circles; their discretisation is cached per plate and ARC_RESOLUTION sets the
+    number of sampled points (override it on the class or on a single plate). The pressure sampling mesh of the
+    plate (mesh()) is cached alike, for the blocks on either side of the plate to share it.
     """
+    ARC_RESOLUTION = 10
 
     def __init__(
             self, start: tuple, end: tuple, thickness: float, material: str, tag: str
@@ -53,6 +56,8 @@ class Plate:
             thickness = 1
         self.thickness = thickness * 1e-3  # convert mm to m
         self.material = material
+        self._arc = None  # (key, theta, X, Y) of the cached bilge discretisation
+        self._mesh = None  # (key, points, normals) of the cached pressure sampling mesh
         self.net_thickness = self.thickness
         # Calculations' Data Output
         self.cor_thickness = -1e-3 if self.tag != 6 else 0
@@ -112,10 +117,13 @@ class Plate:
                                 + (l * math.sin(a + math.pi / 2)) ** 2
                                 )
         else:
+            # quarter annulus around the mean radius, taken about its own centroid
             r = l / math.pi * 2
-            Ixx = 1 / 16 * math.pi * (r ** 4 - (r - self.thickness) ** 4)
-            Iyy = 1 / 16 * math.pi * (r ** 4 - (r - self.thickness) ** 4)
-            pass
+            ri, ro = r - b / 2, r + b / 2
+            area = math.pi / 4 * (ro ** 2 - ri ** 2)
+            c = 4 * (ro ** 3 - ri ** 3) / (3 * math.pi * (ro ** 2 - ri ** 2))
+            Ixx = math.pi / 16 * (ro ** 4 - ri ** 4) - area * c ** 2
+            Iyy = Ixx
         return Ixx, Iyy
 
     def calc_CoA(self):
@@ -125,23 +133,94 @@ class Plate:
                     self.start[1] + self.length / 2 * math.sin(self.angle)
             )
         else:
-            r = self.length / math.pi * 2
-            if 0 < self.angle < math.pi / 2:  # 1st quarter
-                startx = self.start[0]
-                starty = self.end[1]
-                return startx + (2 * r / math.pi), starty - (2 * r / math.pi)
-            elif 0 < self.angle < math.pi:  # 2nd quarter
-                startx = self.end[0]
-                starty = self.start[1]
-                return startx + (2 * r / math.pi), starty + (2 * r / math.pi)
-            elif 0 > self.angle > -math.pi / 2:
-                startx = self.end[0]
-                starty = self.start[1]
-                return startx - (2 * r / math.pi), starty - (2 * r / math.pi)
-            elif 0 > self.angle > -math.pi:
-                startx = self.start[0]
-                starty = self.end[1]
-                return startx - (2 * r / math.pi), starty + (2 * r / math.pi)
+            cx, cy, r, start, end = self.arc_params()
+            mid = (start + end) / 2
+            # centroid of a quarter circle arc lies 2r/pi off the centre on both axes
+            d = 2 * r / math.pi
+            return cx + math.copysign(d, math.cos(mid)), cy + math.copysign(d, math.sin(mid))
+
+    def arc_params(self):
+        """
+        Returns the bilge arc parametrisation (centre x, centre y, radius, start angle, end angle).
+        The angles always run counter-clockwise, regardless of the plate's direction.
+        """
+        if 0 < self.angle < math.pi / 2:  # 1st quarter
+            return self.start[0], self.end[1], abs(self.end[0] - self.start[0]), -math.pi / 2, 0
+        elif 0 < self.angle < math.pi:  # 2nd quarter
+            return self.end[0], self.start[1], abs(self.end[0] - self.start[0]), 0, math.pi / 2
+        elif 0 > self.angle > -math.pi / 2:
+            return self.end[0], self.start[1], abs(self.end[0] - self.start[0]), -math.pi, -math.pi / 2
+        elif 0 > self.angle > -math.pi:
+            return self.start[0], self.end[1], abs(self.end[0] - self.start[0]), math.pi / 2, math.pi
+
+    def arc_point(self, theta):
+        cx, cy, r = self.arc_params()[:3]
+        return cx + r * math.cos(theta), cy + r * math.sin(theta)
+
+    def arc_angle(self, point):
+        """
+        Angle of a point on the bilge arc, kept inside the arc's own [start, end] range.
+        """
+        cx, cy, _, start, end = self.arc_params()
+        theta = math.atan2(point[1] - cy, point[0] - cx)
+        if theta > end + 1e-9:
+            theta -= 2 * math.pi
+        elif theta < start - 1e-9:
+            theta += 2 * math.pi
+        return theta
+
+    def arc_data(self):
+        """
+        Cached discretisation of the bilge arc. It is rebuilt only when the end points or the resolution change.
+        """
+        key = (*self.start, *self.end, self.ARC_RESOLUTION)
+        if self._arc is None or self._arc[0] != key:
+            cx, cy, r, start, end = self.arc_params()
+            theta = np.linspace(start, end, num=self.ARC_RESOLUTION)
+            self._arc = (key, theta, cx + np.cos(theta) * r, cy + np.sin(theta) * r)
+        return self._arc[1:]
+
+    def mesh(self, resolution: int = 10, spacing: float = None, levels=()):
+        """
+        Cached pressure sampling mesh of the plate, from its start to its end: the points and their face normals
+        in the plate's direction (radial on a bilge, outwards for a counter-clockwise one). The plate gets
+        resolution intervals, or with a spacing [m] as many equal intervals of its length as it needs to keep to
+        it. The levels (z) the plate crosses are mesh points too, as the pressures kink there (i.e. the waterline).
+        """
+        key = (*self.start, *self.end, resolution, spacing, *levels)
+        if self._mesh is None or self._mesh[0] != key:
+            # the tolerance keeps lengths that are a multiple of the spacing from an extra interval, and every
+            # plate keeps a point inside it
+            n = resolution if spacing is None else max(2, math.ceil(self.length / spacing - 1e-9))
+            if self.tag == 4:
+                cx, cy, r = self.arc_params()[:3]
+                t0, t1 = self.arc_angle(self.start), self.arc_angle(self.end)
+                thetas = [t0 + (t1 - t0) * j / n for j in range(1, n)]
+                for z in levels:
+                    if abs(z - cy) < r:
+                        dx = math.sqrt(r ** 2 - (z - cy) ** 2)
+                        for t in (self.arc_angle((cx - dx, z)), self.arc_angle((cx + dx, z))):
+                            if min(t0, t1) + 1e-6 / r < t < max(t0, t1) - 1e-6 / r and \
+                                    all(abs(t - k) > 1e-6 / r for k in thetas):
+                                thetas.append(t)
+                thetas.sort(reverse=t1 < t0)
+                sign = 1 if t1 > t0 else -1
+                points = [tuple(self.start), *(self.arc_point(t) for t in thetas), tuple(self.end)]
+                normals = [(sign * math.cos(t), sign * math.sin(t)) for t in (t0, *thetas, t1)]
+            else:
+                dy = self.end[1] - self.start[1]
+                # distances of the mesh points along the plate
+                ds = [self.length / n * j for j in range(1, n)]
+                for z in levels:
+                    d = (z - self.start[1]) / dy * self.length if dy != 0 else -1
+                    if 1e-6 < d < self.length - 1e-6 and all(abs(d - k) > 1e-6 for k in ds):
+                        ds.append(d)
+                cos, sin = math.cos(self.angle), math.sin(self.angle)
+                points = [tuple(self.start), *((self.start[0] + d * cos, self.start[1] + d * sin) for d in sorted(ds)),
+                          tuple(self.end)]
+                normals = [(sin, -cos)] * len(points)
+            self._mesh = (key, points, normals)
+        return self._mesh[1:]
 
     def render(self, r_m="w"):
         """
@@ -149,6 +228,8 @@ class Plate:
         r_m is the render mode. \'w\' stands for simple line plot
         It also returns a tuple containing significant geometrical properties. (meybe change later)
         """
+        from matplotlib import pyplot as plt  # debug helper only, keep matplotlib off the import path
+
         X, Y = self.render_data()[:2]
         if r_m == "w":
             plt.plot(X, Y, color="b")
@@ -174,31 +255,7 @@ class Plate:
                 _PLACE_[self.tag],
             ]
         else:
-            if 0 < self.angle < math.pi / 2:
-                start = -math.pi / 2
-                end = 0
-                startx = self.start[0]
-                starty = self.end[1]
-            elif 0 < self.angle < math.pi:
-                start = 0
-                end = math.pi / 2
-                startx = self.end[0]
-                starty = self.start[1]
-            elif 0 > self.angle > -math.pi / 2:
-                start = -math.pi
-                end = -math.pi / 2
-                startx = self.end[0]
-                starty = self.start[1]
-            elif 0 > self.angle > -math.pi:
-                start = math.pi / 2
-                end = math.pi
-                startx = self.start[0]
-                starty = self.end[1]
-
-            lin = np.linspace(start, end, num=10)
-            r = self.end[0] - self.start[0]
-            X = startx + np.cos(lin) * abs(r)
-            Y = starty + np.sin(lin) * abs(r)
+            X, Y = self.arc_data()[1:]
             out = [X, Y, self.thickness, self.material, _PLACE_[self.tag]]
 
         return out
@@ -244,6 +301,10 @@ class Plate:
         """
         Evaluates the normal vectors of the plate face. Useful in Pressure offloading
         """
+        if self.tag == 4:
+            # the arc is sampled counter-clockwise, so the face normals are the outward radial directions
+            theta = self.arc_data()[0]
+            return [[math.cos(i), math.sin(i)] for i in theta]
         X, Y = self.render_data()[:2]
         geom = [[X[i], Y[i]] for i in range(len(X))]
         return normals_2d(geom)
@@ -3,7 +3,8 @@ from modules.baseclass.block import Block
 from modules.baseclass.subblocks.atm_sur_block import AtmSur
 from modules.baseclass.subblocks.sea_sur_block import SeaSur
 from modules.baseclass.stiff_plate import StiffPlate
-from modules.utils.constants import LOADS
+from modules.topology import Topology
+from modules.utils.constants import LOADS, PRESSURE_GRID_SPACING
 from modules.utils.decorators import auto_str
 from modules.utils.logger import Logger
 
@@ -26,6 +27,8 @@ class Ship:
         DWT (float): _description_
         stiff_plates (list[StiffPlate]): _description_
         blocks (list[Block]): _description_
+        pressure_grid (dict): The Block.calculate_pressure_grid() arguments of the blocks, a PRESSURE_GRID_SPACING
+            grid refined at the design and scantling waterlines by default
     """
     def __init__(self,
                  LBP: float,
@@ -40,7 +43,8 @@ class Ship:
                  Cm: float,
                  DWT: float,  # PSM_spacing,
                  stiff_plates: list[StiffPlate],
-                 blocks: list[Block]):
+                 blocks: list[Block],
+                 pressure_grid: dict = None):
         self.symmetrical = True  # Checks that implies symmetry. For the time being is arbitrary constant
         self.LBP = LBP
         self.Lsc = Lsc  # Rule Length
@@ -64,9 +68,12 @@ class Ship:
         self.moments_still()
         # Array to hold all of the stiffened plates
         self.stiff_plates = stiff_plates
-        self.blocks = self.validate_blocks(blocks)
+        self.blocks = blocks
         self.evaluate_sea_n_air()
-        [(i.get_coords(self.stiff_plates), i.CG.insert(0, self.Lsc / 2)) for i in
+        self.blocks = self.validate_blocks(self.blocks)
+        self.pressure_grid = {'spacing': PRESSURE_GRID_SPACING, 'levels': (self.T, self.Tsc)} \
+            if pressure_grid is None else pressure_grid
+        [(i.get_coords(self.stiff_plates, self.pressure_grid), i.CG.insert(0, self.Lsc / 2)) for i in
          self.blocks]  # bit of a cringe solution that saves time
         self.yo, self.xo, self.cross_section_area = self.calc_CoA()
         self.Ixx, self.Iyy = self.Calculate_I(n50=False)
@@ -107,14 +114,16 @@ class Ship:
         [plate.L_eff() for plate in self.stiff_plates]  # b effective evaluation
 
     def validate_blocks(self, blocks: list[Block]):
-        # The blocks are already constructed but we need to validate their responding plates' existence
-        ids = [i.id for i in self.stiff_plates]
+        """
+        Orders and orients the plates of the blocks' boundaries (topology.py) and reports all of their problems at
+        once, before any block is evaluated.
+        """
+        problems = Topology(self.stiff_plates).validate(blocks)
+        if problems:
+            Logger.error(f"ship.validate_blocks: The blocks' boundaries have {len(problems)} problem(s). "
+                         f"Program Terminates\n" + "\n".join(problems))
+            quit()
         for i in blocks:
-            for j in i.list_plates_id:
-                if (abs(j) not in ids):
-                    Logger.error(
-                        f"ship.validate_blocks: The block: {repr(i)} has as boundaries non-existent plates.Program Terminates")
-                    quit()
             self.block_properties(i)
         return blocks
 
@@ -236,7 +245,7 @@ class Ship:
         self.data += text
 
     def map_members(self):
-        v = vars(self)
+        v = dict(vars(self))  # a copy, the rounded values must not leak into the ship
         v["kappa"] = f"{self.kappa: 0.3g}"
         v["Mwh"] = round(self.Mwh, 2)
         v["Mws"] = round(self.Mws, 2)
@@ -1,12 +1,10 @@
 import math
 
-from matplotlib import pyplot as plt
-
 from modules.baseclass.plate import Plate
 from modules.baseclass.stiffener import Stiffener
 from modules.utils.decorators import auto_str
 from modules.utils.logger import Logger
-from modules.utils.operations import linespace
+from modules.utils.operations import linespace, polyline_projection
 
 
 @auto_str
@@ -165,6 +163,8 @@ class StiffPlate:
         return Ixx, Iyy
 
     def render(self, r_m="w_b"):
+        from matplotlib import pyplot as plt  # debug helper only, keep matplotlib off the import path
+
         plt.axis("square")
         self.plate.render(r_m=r_m)
         [i.render() for i in self.stiffeners]
@@ -180,14 +180,13 @@ class StiffPlate:
                 "(classes.py) stiff_plate/local_P: Pressures are not currently calculated for girders and bulkheads..."
             )
             quit()
-        min_r = 1e5
-        index = 0
-        for i, data in enumerate(self.Pressure[key]):
-            radius = math.sqrt((data[0] - point[0]) ** 2 + (data[1] - point[1]) ** 2)
-            if min_r > radius:
-                index = i
-                min_r = radius
-        return self.Pressure[key][index][-1]
+        # the pressure is linear between the grid points, so it is interpolated on the grid segment nearest
+        # to the point rather than taken at the nearest grid point
+        pressure = self.Pressure[key]
+        if len(pressure) == 1:
+            return pressure[0][-1]
+        i, t = polyline_projection(pressure, point)
+        return pressure[i][-1] + t * (pressure[i + 1][-1] - pressure[i][-1])
 
     def update(self):
         self.plate.update()
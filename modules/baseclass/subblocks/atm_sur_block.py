@@ -10,8 +10,8 @@ class AtmSur(Block):
         super().__init__("ATM", True, 'VOID', list_plates_id)
         self.space_type = "ATM"
 
-    def get_coords(self, stiff_plates: list[StiffPlate]):
-        super().get_coords(stiff_plates)
+    def get_coords(self, stiff_plates: list[StiffPlate], grid: dict = None):
+        super().get_coords(stiff_plates, grid)
         # add a buffer zone for atmosphere of 2 m
         if len(self.coords) == 0:
             Logger.error("WEATHER DECK Boundary plates are missing!. The program terminates...")
@@ -10,8 +10,8 @@ class SeaSur(Block):
         super().__init__("SEA", True, 'VOID', list_plates_id)
         self.space_type = "SEA"
 
-    def get_coords(self, stiff_plates: list[StiffPlate]):
-        super().get_coords(stiff_plates)
+    def get_coords(self, stiff_plates: list[StiffPlate], grid: dict = None):
+        super().get_coords(stiff_plates, grid)
         # add a buffer zone for sea of 2 m
         if len(self.coords) == 0:
             Logger.error("SEA Boundary plates are missing!. The program terminates...")
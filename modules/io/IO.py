@@ -1,5 +1,7 @@
 import json
 
+import numpy as np
+
 from modules.baseclass.block import Block
 from modules.baseclass.stiff_plate import StiffPlate
 from modules.baseclass.stiffener import Stiffener
@@ -10,165 +12,440 @@ from modules.utils.logger import Logger
 from modules.utils.operations import set_diff
 
 
+PARTICULARS = ('LBP', 'Lsc', 'B', 'T', 'Tmin', 'Tsc', 'D', 'Cb', 'Cp', 'Cm', 'DWT')
+STIFFENER_DIMS = 4  # widest stiffener definition (lw, bw, lf, bf)
+RECIPE_KEYS = ('Dynamics', 'max value', 'skip value')
+
+
 def plate_save(plate: Plate):
-    # Save data to JSON format
-    return json.dumps(plate.save_data())
+    return plate.save_data()
 
 
 def stiff_save(stiff: Stiffener):
-    # Save data to JSON format
     dim = []
     for i in stiff.plates:
         dim.append(i.length * 1e3)
         dim.append(i.thickness * 1e3)
 
-    return json.dumps({'type': stiff.type, 'dimensions': dim, 'material': stiff.plates[0].material})
+    return {'type': stiff.type, 'dimensions': dim, 'material': stiff.plates[0].material}
 
 
 def stiff_pl_save(stiff_plate: StiffPlate):
-    save = ""
-    save += '{"id":' + str(stiff_plate.id) + ',"plate":' + plate_save(stiff_plate.plate) + ","
-    if len(stiff_plate.stiffeners) != 0:
-        save += '"stiffeners":' + stiff_save(stiff_plate.stiffeners[0]) + ","
-    else:
-        save += '"stiffeners": {},'
-
-    save += '"spacing":' + json.dumps(stiff_plate.spacing * 1e3) + ","
-    save += '"PSM_spacing":' + json.dumps(stiff_plate.PSM_spacing) + ","
-    save += '"skip":' + json.dumps(stiff_plate.skip) + ","
-    save += '"s_pad":' + json.dumps(stiff_plate.s_pad * 1e3) + ","
-    save += '"e_pad":' + json.dumps(stiff_plate.e_pad * 1e3)
-    if stiff_plate.null: save += "," + '"null":' + json.dumps(stiff_plate.null)
-    return save + "}"
+    save = {
+        'id': stiff_plate.id,
+        'plate': plate_save(stiff_plate.plate),
+        'stiffeners': stiff_save(stiff_plate.stiffeners[0]) if len(stiff_plate.stiffeners) != 0 else {},
+        'spacing': stiff_plate.spacing * 1e3,
+        'PSM_spacing': stiff_plate.PSM_spacing,
+        'skip': stiff_plate.skip,
+        's_pad': stiff_plate.s_pad * 1e3,
+        'e_pad': stiff_plate.e_pad * 1e3,
+    }
+    if stiff_plate.null:
+        save['null'] = stiff_plate.null
+    return save
 
 
 def blocks_save(block: Block):
-    save = ""
-    save += '{"name":"' + block.name + '","symmetrical":' + json.dumps(
-        block.symmetrical) + ',"type":"' + block.space_type + '","ids":' + json.dumps(block.list_plates_id) + "}"
-    return save
+    return {'name': block.name, 'symmetrical': block.symmetrical, 'type': block.space_type,
+            'ids': block.list_plates_id}
+
+
+def saved_blocks(ship: Ship):
+    # the SEA and ATM blocks are generated by the Ship itself
+    return [i for i in ship.blocks if i.space_type not in ("SEA", "ATM")]
 
 
 def section_save(ship: Ship):
-    save = '"geometry":[\n'
-    for i in ship.stiff_plates[:-1]:
-        save += stiff_pl_save(i) + ',\n'
-    save += stiff_pl_save(ship.stiff_plates[-1]) + '\n]'
-    # Added Blocks feature
-    save += ',\n"blocks":[\n'
-    for i in ship.blocks:
-        if (i.space_type != "SEA") and (i.space_type != "ATM"):
-            save += blocks_save(i) + ',\n'
-    save = save[:-2] + '\n]'
+    return {
+        'geometry': [stiff_pl_save(i) for i in ship.stiff_plates],
+        'blocks': [blocks_save(i) for i in saved_blocks(ship)],
+    }
 
-    return save
 
+def ship_to_dict(ship: Ship):
+    return {**{tag: getattr(ship, tag) for tag in PARTICULARS}, **section_save(ship)}
 
-def ship_save(ship: Ship, filename: str):
-    save = '{"LBP":' + str(ship.LBP) + ',\n'
-    save += '"Lsc":' + str(ship.Lsc) + ',\n'
-    save += '"B":' + str(ship.B) + ',\n'
-    save += '"T":' + str(ship.T) + ',\n'
-    save += '"Tmin":' + str(ship.Tmin) + ',\n'
-    save += '"Tsc":' + str(ship.Tsc) + ',\n'
-    save += '"D":' + str(ship.D) + ',\n'
-    save += '"Cb":' + str(ship.Cb) + ',\n'
-    save += '"Cp":' + str(ship.Cp) + ',\n'
-    save += '"Cm":' + str(ship.Cm) + ',\n'
-    save += '"DWT":' + str(ship.DWT) + ',\n'
-    save += section_save(ship) + "\n}"
 
-    with open(filename, 'w') as file:
-        file.write(save)
+def ship_save(ship: Ship, filename: str, binary: bool | None = None):
+    """
+    Saves the ship envelope. The JSON is written entry by entry straight to the file handle,
+    one stiffened plate or block per line. A filename ending in .npz (or binary=True) selects the
+    compact columnar format instead, which load_ship reads back as well.
+    """
+    if binary or (binary is None and filename.endswith('.npz')):
+        ship_save_npz(ship, filename)
+        return
 
+    encode = json.JSONEncoder().encode
+    with open(filename, 'w') as file:
+        file.write('{')
+        file.write(',\n'.join(f'"{tag}":{encode(getattr(ship, tag))}' for tag in PARTICULARS))
+        for key, entries in (('geometry', (stiff_pl_save(i) for i in ship.stiff_plates)),
+                             ('blocks', (blocks_save(i) for i in saved_blocks(ship)))):
+            file.write(f',\n"{key}":[')
+            for n, entry in enumerate(entries):
+                file.write(',\n' if n else '\n')
+                file.write(encode(entry))
+            file.write('\n]')
+        file.write('\n}')
+
+
+def ship_save_npz(ship: Ship, filename: str):
+    """
+    Columnar binary variant of ship_save. Each geometry field is stored as one numpy array,
+    stiffener dimensions are NaN padded and the block id lists are flattened with offsets.
+    """
+    geometry = [stiff_pl_save(i) for i in ship.stiff_plates]
+    blocks = [blocks_save(i) for i in saved_blocks(ship)]
+
+    dims = np.full((len(geometry), STIFFENER_DIMS), np.nan)
+    for n, entry in enumerate(geometry):
+        d = entry['stiffeners'].get('dimensions', [])
+        dims[n, :len(d)] = d
+
+    def column(key, dtype=None):
+        return np.array([i[key] for i in geometry], dtype=dtype)
+
+    def plate_column(index, dtype=None):
+        return np.array([i['plate'][index] for i in geometry], dtype=dtype)
+
+    ids = [i['ids'] for i in blocks]
+    np.savez_compressed(
+        filename,
+        particulars=np.array([getattr(ship, tag) for tag in PARTICULARS], dtype=float),
+        id=column('id', int),
+        start=plate_column(0, float).reshape(-1, 2),
+        end=plate_column(1, float).reshape(-1, 2),
+        thickness=plate_column(2, float),
+        material=plate_column(3, str),
+        tag=plate_column(4, str),
+        st_type=np.array([i['stiffeners'].get('type', '') for i in geometry], dtype=str),
+        st_dims=dims,
+        st_material=np.array([i['stiffeners'].get('material', '') for i in geometry], dtype=str),
+        spacing=column('spacing', float),
+        PSM_spacing=column('PSM_spacing', float),
+        skip=column('skip', int),
+        s_pad=column('s_pad', float),
+        e_pad=column('e_pad', float),
+        null=np.array([i.get('null', False) for i in geometry], dtype=bool),
+        block_name=np.array([i['name'] for i in blocks], dtype=str),
+        block_symmetrical=np.array([i['symmetrical'] for i in blocks], dtype=bool),
+        block_type=np.array([i['type'] for i in blocks], dtype=str),
+        block_ids=np.array([j for i in ids for j in i], dtype=int),
+        block_offsets=np.cumsum([0, *map(len, ids)], dtype=int),
+    )
+
+
+def _npz_items(npz):
+    """
+    Yields the (key, value) pairs of a .npz envelope in the same shape as the JSON one,
+    the geometry entries are rebuilt lazily so that they go through the same validation.
+    """
+    for tag, val in zip(PARTICULARS, npz['particulars'].tolist()):
+        yield tag, val
+
+    def geometry():
+        cols = {key: npz[key].tolist() for key in (
+            'id', 'start', 'end', 'thickness', 'material', 'tag', 'st_type', 'st_material', 'spacing',
+            'PSM_spacing', 'skip', 's_pad', 'e_pad', 'null')}
+        dims = npz['st_dims']
+        for n, _id in enumerate(cols['id']):
+            st_dims = dims[n][~np.isnan(dims[n])].tolist()
+            entry = {
+                'id': _id,
+                'plate': [cols['start'][n], cols['end'][n], cols['thickness'][n], cols['material'][n],
+                          cols['tag'][n]],
+                'stiffeners': {'type': cols['st_type'][n], 'dimensions': st_dims,
+                               'material': cols['st_material'][n]} if cols['st_type'][n] else {},
+            }
+            for key in ('spacing', 'PSM_spacing', 'skip', 's_pad', 'e_pad'):
+                entry[key] = cols[key][n]
+            if cols['null'][n]:
+                entry['null'] = True
+            yield entry
+
+    yield 'geometry', geometry()
+    offsets = npz['block_offsets'].tolist()
+    ids = npz['block_ids'].tolist()
+    yield 'blocks', [
+        {'name': name, 'symmetrical': sym, 'type': _type, 'ids': ids[offsets[n]:offsets[n + 1]]}
+        for n, (name, sym, _type) in enumerate(zip(npz['block_name'].tolist(), npz['block_symmetrical'].tolist(),
+                                                   npz['block_type'].tolist()))
+    ]
+
+
+STREAM_CHUNK_SIZE = 1 << 16  # characters read from the envelope file per refill
+
+
+class _JSONStream:
+    """
+    Minimal pull parser over a text file handle. Only the top level object is walked by hand,
+    every value below it is decoded by the stdlib decoder from a sliding buffer, so the file is
+    never held in memory as a whole and large arrays can be consumed one element at a time.
+    """
+    WHITESPACE = ' \t\n\r'
+    DELIMITERS = WHITESPACE + ',:]}'
+
+    def __init__(self, file, chunk_size=STREAM_CHUNK_SIZE):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        data = self.file.read(self.chunk_size)
+        if not data:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in self.WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf) or not self._fill():
+                return self.buf[self.pos] if self.pos < len(self.buf) else ''
+
+    def expect(self, *chars: str) -> str:
+        c = self.peek()
+        if c not in chars:
+            raise json.JSONDecodeError(f"Expecting one of {chars}", self.buf, self.pos)
+        self.pos += 1
+        return c
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                val, end = self.decoder.raw_decode(self.buf, self.pos)
+                # a number cut by the buffer (i.e. '15.' of '15.3') may continue in the next chunk
+                if self.eof or (end < len(self.buf) and self.buf[end] in self.DELIMITERS):
+                    self.pos = end
+                    return val
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._fill()
+
+    def items(self, stream_keys=()):
+        """
+        Yields the (key, value) pairs of the top level object. The values of stream_keys that are
+        arrays are yielded as generators of their elements, which must be consumed before advancing.
+        """
+        self.expect('{')
+        if self.peek() == '}':
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(':')
+            if key in stream_keys and self.peek() == '[':
+                self.pos += 1
+                elements = self._elements()
+                yield key, elements
+                for _ in elements:  # drain whatever the consumer left behind
+                    pass
+            else:
+                yield key, self.value()
+            if self.expect(',', '}') == '}':
+                return
+
+    def _elements(self):
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.expect(',', ']') == ']':
+                return
+
+
+def load_ship(filename, chunk_size=STREAM_CHUNK_SIZE, pressure_grid: dict = None):
+    """
+    Streams the envelope file and builds the Ship. The geometry array is parsed, validated and
+    turned into StiffPlates element by element; every validation problem is reported at once.
+    Binary envelopes written by ship_save_npz are recognised by their .npz extension.
+    pressure_grid is passed on to the Ship, None for its default grid.
+    """
+    if str(filename).endswith('.npz'):
+        with np.load(filename, allow_pickle=False) as npz:
+            return build_ship(_npz_items(npz), pressure_grid)
 
-def load_ship(filename):
     with open(filename, 'r') as file:
-        data = json.loads(file.read())
-    tags = ['LBP', 'Lsc', 'B', 'T', 'Tmin', 'Tsc', 'D', 'Cb', 'Cp', 'Cm', 'DWT']
-
-    sd = set_diff(tags + ["geometry", "blocks"], data.keys())
+        return build_ship(_JSONStream(file, chunk_size).items(stream_keys=('geometry',)), pressure_grid)
+
+
+def parse_ship(data: dict, pressure_grid: dict = None):
+    """
+    Same as load_ship for an envelope that is already decoded (i.e. received over the wire).
+    """
+    return build_ship(data.items(), pressure_grid)
+
+
+def build_ship(entries, pressure_grid: dict = None):
+    errors = []
+    particulars = {}
+    stiff_plates = None
+    blocks = None
+    for key, value in entries:
+        if key == 'geometry':
+            stiff_plates = geometry_parser(value, errors=errors)
+        elif key == 'blocks':
+            blocks = blocks_parser(value, errors=errors)
+        elif key in PARTICULARS:
+            particulars[key] = value
+
+    sd = set_diff(particulars.keys(), PARTICULARS)
+    sd |= {key for key, val in (('geometry', stiff_plates), ('blocks', blocks)) if val is None}
     if sd:
-        Logger.error(
-            f"The input file is not appropriately formatted, and it is missing crucial data. "
-            f"Keys {sd} are missing."
-        )
+        errors.insert(0, f"The input file is not appropriately formatted, and it is missing crucial data. "
+                         f"Keys {sd} are missing.")
+    elif not blocks:
+        errors.append("Check your input file, no blocks are defined.")
+    if errors:
+        _report(errors)
+        return None
 
-    particulars = []
-    for tag in tags:
-        particulars.append(data[tag])
+    return Ship(*(particulars[tag] for tag in PARTICULARS), stiff_plates=stiff_plates, blocks=blocks,
+                pressure_grid=pressure_grid)
 
-    stiff_plates = geometry_parser(data['geometry'])
 
-    blocks = blocks_parser(data['blocks'])
-    if not blocks:
-        Logger.error("Check your input file")
+def _report(errors: list[str]):
+    Logger.error(f"Loading the ship envelope failed with {len(errors)} error(s):\n" + "\n".join(errors))
 
-    return Ship(*particulars, stiff_plates=stiff_plates, blocks=blocks)
 
-
-def geometry_parser(geo_t: list):
+def geometry_parser(geo_t, errors: list[str] | None = None):
+    """
+    Builds the StiffPlates of an iterable of geometry entries in a single pass.
+    If an errors list is passed the problems are appended to it, otherwise they are reported here.
+    """
+    report = errors is None
+    errors = [] if errors is None else errors
     out = []
-    temp_id = []
-    for i in geo_t:
-        if len(i['plate']) < 5:
-            Logger.error(f'Plate has no correct format.')
-
-        if i['plate'][0] == i['plate'][1]:
-            Logger.error(f'Plate :{i["plate"]} You cannot enter a plate with no length!')
-
-        if i['plate'][3] not in MATERIALS:
-            Logger.error(f'Plate :{i["plate"]} Your plate has a no documented material !')
-
-        t = i['plate'][2] if i['plate'][2] != 0 else 0.1
-        tmp_p = Plate(i['plate'][0], i['plate'][1], t, i['plate'][3], i['plate'][4])
-        if i['plate'][4] != 'Bilge' and 'stiffeners' in i and len(i['stiffeners']) != 0:
-            tmp_d = i['stiffeners']["dimensions"]
-            # extra dimensions than the first N required are omitted
-            if len(tmp_d) >= 2 and i['stiffeners']["type"] == 'fb':
-                dims = {'lw': tmp_d[0], 'bw': tmp_d[1]}
-            # extra dimensions than the first N required are omitted
-            elif len(tmp_d) >= 4 and i['stiffeners']["type"] in ('g', 'tb'):
-                dims = {'lw': tmp_d[0], 'bw': tmp_d[1], 'lf': tmp_d[2], 'bf': tmp_d[3]}
-            else:
-                Logger.error(
-                    "You input a stiffener type that has less dims than needed",
-                    i['stiffeners']
-                )
-            tmp_s = {
-                'type': i['stiffeners']['type'], 'material': i['stiffeners']['material'],
-                'dimensions': dims
-            }
-        elif i['plate'][4] == 'Bilge' or len(i['stiffeners']) == 0:
-            tmp_s = {}
-        else:
-            Logger.error('Error loading stiffeners.')
-        if i['id'] is int:
-            Logger.error(f'Id is not an integer')
-        if i['id'] in temp_id:
-            Logger.error(
-                f'There was an overlap between the '
-                f'ids of two stiffened plates. \nCONFLICTING ID : ' + str(i['id']))
-        if 'null' in i:
-            null = i['null']
-        else:
-            null = False
-        tmp = StiffPlate(i['id'], tmp_p, i['spacing'], i['s_pad'], i['e_pad'], tmp_s, i['skip'],
-                         i['PSM_spacing'], null=null)
-        out.append(tmp)
-        temp_id.append(i['id'])
-
+    seen_ids = set()
+    for n, i in enumerate(geo_t):
+        try:
+            tmp = _stiff_plate_entry(i, seen_ids, errors)
+        except (KeyError, IndexError, TypeError) as e:
+            errors.append(f'Geometry entry #{n} (id: {i.get("id") if isinstance(i, dict) else "?"}) '
+                          f'is malformed: {e!r}')
+            continue
+        if tmp is not None:
+            out.append(tmp)
+
+    if report and errors:
+        _report(errors)
     return out
 
 
-def blocks_parser(blocks_t: list):
+def _stiff_plate_entry(i: dict, seen_ids: set, errors: list[str]):
+    """
+    Validates a single geometry entry and returns its StiffPlate or None if it has errors.
+    """
+    n_errors = len(errors)
+    if not isinstance(i['id'], int):
+        errors.append(f'Id {i["id"]!r} is not an integer')
+    elif i['id'] in seen_ids:
+        errors.append(f'There was an overlap between the '
+                      f'ids of two stiffened plates. CONFLICTING ID : ' + str(i['id']))
+    seen_ids.add(i['id'])
+
+    if len(i['plate']) < 5:
+        errors.append(f'Plate {i["id"]}: Plate has no correct format.')
+        return None
+    start, end, thickness, material, tag = i['plate'][:5]
+    if start == end:
+        errors.append(f'Plate {i["id"]}: {i["plate"]} You cannot enter a plate with no length!')
+    if material not in MATERIALS:
+        errors.append(f'Plate {i["id"]}: {i["plate"]} Your plate has a no documented material !')
+    if tag == 'Bilge' and abs(end[0] - start[0]) != abs(end[1] - start[1]):
+        errors.append(f'Plate {i["id"]}: {i["plate"]} The only bilge type supported is quarter circle.')
+
+    tmp_s = {}
+    if tag != 'Bilge' and len(i.get('stiffeners', {})) != 0:
+        dims = stiffener_dims(i['stiffeners'])
+        if dims is None:
+            errors.append(f'Plate {i["id"]}: You input a stiffener type that has less dims than needed '
+                          f'{i["stiffeners"]}')
+            dims = {}
+        tmp_s = {
+            'type': i['stiffeners']['type'], 'material': i['stiffeners']['material'],
+            'dimensions': dims
+        }
+
+    if len(errors) != n_errors:
+        return None
+
+    t = thickness if thickness != 0 else 0.1
+    tmp_p = Plate(start, end, t, material, tag)
+    return StiffPlate(i['id'], tmp_p, i['spacing'], i['s_pad'], i['e_pad'], tmp_s, i['skip'],
+                      i['PSM_spacing'], null=i.get('null', False))
+
+
+def stiffener_dims(stiffener: dict) -> dict | None:
+    """
+    The Stiffener dimensions dict of a stiffener entry, None if it has fewer dimensions than its type needs.
+    """
+    dims = stiffener["dimensions"]
+    # extra dimensions than the first N required are omitted
+    if len(dims) >= 2 and stiffener["type"] == 'fb':
+        return {'lw': dims[0], 'bw': dims[1]}
+    if len(dims) >= 4 and stiffener["type"] in ('g', 'tb'):
+        return {'lw': dims[0], 'bw': dims[1], 'lf': dims[2], 'bf': dims[3]}
+    return None
+
+
+def blocks_parser(blocks_t: list, errors: list[str] | None = None):
     required_keys = ["name", "symmetrical", "type", "ids"]
+    report = errors is None
+    errors = [] if errors is None else errors
     out = []
     for block in blocks_t:
-        if set_diff(required_keys, block):
-            Logger.error("Loading block {block} has resulted in an error.")
+        missing = set_diff(block, required_keys)
+        if missing:
+            errors.append(f"Loading block {block} has resulted in an error. Keys {missing} are missing.")
+            continue
 
         tmp = Block(block['name'], block['symmetrical'], block['type'], block['ids'])
         out.append(tmp)
 
+    if report and errors:
+        _report(errors)
     return out
+
+
+def load_recipes(filename):
+    """
+    Loads a JSON file of loading recipes, {name: {'Dynamics', 'max value', 'skip value'}} as pipeline.RECIPES.
+    Every validation problem is reported at once, None is returned on errors.
+    """
+    with open(filename, 'r') as file:
+        return recipes_parser(json.load(file))
+
+
+def recipes_parser(recipes) -> dict | None:
+    errors = []
+    if not isinstance(recipes, dict) or not recipes:
+        errors.append("The recipes have to be a non empty object of {name: recipe}.")
+    else:
+        for name, recipe in recipes.items():
+            if not isinstance(recipe, dict):
+                errors.append(f"Recipe {name} is not an object.")
+                continue
+            missing = set_diff(recipe, RECIPE_KEYS)
+            if missing:
+                errors.append(f"Recipe {name} has resulted in an error. Keys {missing} are missing.")
+            elif not all(isinstance(recipe[key], str) for key in RECIPE_KEYS):
+                errors.append(f"Recipe {name} has resulted in an error. Keys {RECIPE_KEYS} have to be strings.")
+            elif 'S' not in recipe['Dynamics'] and 'D' not in recipe['Dynamics']:
+                errors.append(f"Recipe {name} has resulted in an error. 'Dynamics' has to be 'S', 'D' or 'S+D', "
+                              f"got {recipe['Dynamics']}.")
+    if errors:
+        Logger.error(f"Loading the recipes failed with {len(errors)} error(s):\n" + "\n".join(errors))
+        return None
+    return {name: {key: recipe[key] for key in RECIPE_KEYS} for name, recipe in recipes.items()}
@@ -93,6 +93,22 @@ class DataCell:
                      round((stif.CoA[1] - stiff_plate.CoA[1]) ** 2 * 1e6 * self.s_A_n50, 2),
                      round(stif.n50_Ixx_c * 1e12 + (stif.CoA[1] - stiff_plate.CoA[1]) ** 2 * 1e6 * self.s_A_n50, 2)])
         self.pressure_append(stiff_plate)
+        self.state = DataCell.signature(stiff_plate)
+
+    @staticmethod
+    def signature(stiff_plate: StiffPlate) -> tuple:
+        """
+        Summary of every StiffPlate quantity a DataCell reports. Cells are only rebuilt when it changes.
+        """
+        key_f = lambda x: abs(x[-1])
+        plates = (stiff_plate.plate, *[j for i in stiff_plate.stiffeners for j in i.plates])
+        return (
+            tuple((i.length, i.thickness, i.net_thickness, i.net_thickness_calc, i.net_thickness_empi,
+                   i.net_thickness_buck, i.cor_thickness, i.n50_thickness, i.n50_Ixx_c, *i.CoA) for i in plates),
+            stiff_plate.spacing, stiff_plate.n50_area, stiff_plate.n50_Ixx_c, tuple(stiff_plate.CoA),
+            tuple(i.Z_rule for i in stiff_plate.stiffeners),
+            tuple((i, max(p, key=key_f)[-1]) for i, p in stiff_plate.Pressure.items() if len(p) != 0),
+        )
 
     def update(self, stiff_plate: StiffPlate):
         # Primary stresses 
@@ -150,6 +166,16 @@ class DataCell:
                      round((stif.CoA[1] - stiff_plate.CoA[1]) ** 2 * 1e6 * self.s_A_n50, 2),
                      round(stif.n50_Ixx_c * 1e12 + (stif.CoA[1] - stiff_plate.CoA[1]) ** 2 * 1e6 * self.s_A_n50, 2)])
         self.pressure_append(stiff_plate)
+        # the cell reports the plate as it is now, so load_data() must not rebuild it
+        self.state = DataCell.signature(stiff_plate)
+
+    def merge_pressure(self, pressure: dict):
+        """
+        Keeps the maximum (absolute) pressure of each EDW between this cell and a previous cell's Pressure.
+        """
+        for i, val in pressure.items():
+            if i not in self.Pressure or abs(self.Pressure[i]) < abs(val):
+                self.Pressure[i] = val
 
     def pressure_append(self, stiff_plate: StiffPlate):
         """
@@ -1,3 +1,5 @@
+import hashlib
+
 import numpy as np
 
 from modules.baseclass.stiff_plate import StiffPlate
@@ -7,13 +9,24 @@ from modules.io.templates import TemplateFactory
 from modules.utils.decorators import auto_str
 from modules.utils.logger import Logger
 
-condition_template = TemplateFactory.get_latex_template("longtable", "conditions.tex")
-pressure_longtable_template = TemplateFactory.get_latex_template("longtable", "tabular_pressure.tex")
-plating_longtable_template = TemplateFactory.get_latex_template("longtable", "tabular_plating.tex")
-stiffeners_longtable_template = TemplateFactory.get_latex_template("longtable", "tabular_stiffeners.tex")
-stiffened_plates_longtable_template = TemplateFactory.get_latex_template("longtable", "tabular_stiffened_plates.tex")
-ordinary_stiffeners_longtable_template = TemplateFactory.get_latex_template("longtable", "tabular_ordinary_stiffeners.tex")
-Logger.debug("Done loading datalogger.py templates.")
+condition_template = TemplateFactory.get_lazy_latex_template("longtable", "conditions.tex")
+pressure_longtable_template = TemplateFactory.get_lazy_latex_template("longtable", "tabular_pressure.tex")
+plating_longtable_template = TemplateFactory.get_lazy_latex_template("longtable", "tabular_plating.tex")
+stiffeners_longtable_template = TemplateFactory.get_lazy_latex_template("longtable", "tabular_stiffeners.tex")
+stiffened_plates_longtable_template = TemplateFactory.get_lazy_latex_template("longtable", "tabular_stiffened_plates.tex")
+ordinary_stiffeners_longtable_template = TemplateFactory.get_lazy_latex_template("longtable", "tabular_ordinary_stiffeners.tex")
+SPLIT = "\x00"  # stands in for the table rows when a template is split around them
+
+
+def max_p(l):
+    # the value of maximum magnitude, skipping the non evaluated ('-') entries
+    max_ = None
+    for i in l:
+        if isinstance(i, str): continue
+        if max_ is None or abs(max_) < abs(i): max_ = i
+    if max_ is None:
+        return 'Not Evaluated'
+    return max_
 
 
 @auto_str
@@ -25,10 +38,12 @@ class DataLogger:
 
     TODO : Utilize the Datalogger for the Data Tables in the GUI as a Singleton
     """
+    TABLES = ('pressure', 'plating', 'stiffeners', 'stiffened_plates', 'ordinary_stiffeners')
 
     def __init__(self, ship: Ship):
         self.conds = []  # EDWs that were documented
-        self.Cells = []
+        self.cells: dict[int, DataCell] = {}  # DataCell of every non-null stiffened plate by id, in id order
+        self._rows = {}  # cached table rows by plate id
         self.Press_D = []
         self.Press_Header = []
         self.Plate_D = []
@@ -50,15 +65,30 @@ class DataLogger:
         self.ship = ship
         self.load_data()
 
+    @property
+    def Cells(self) -> list[DataCell]:
+        return list(self.cells.values())
+
     def load_data(self):
-        def plate_name(cell: DataCell):
-            return int(cell.name[6:])
+        """
+        Syncs the cells with the ship's stiffened plates. Only the cells of new or changed plates are rebuilt;
+        a rebuilt cell keeps the pressure maxima logged so far.
+        """
+        plates = {st_pl.id: st_pl for st_pl in self.ship.stiff_plates if not st_pl.null}
+        for _id in set(self.cells) - set(plates):
+            del self.cells[_id]
 
-        self.Cells = []  # may be slow for performance but it is meant to be called 1-2 times per main run
-        for st_pl in self.ship.stiff_plates:
-            if st_pl.null: continue
-            self.Cells.append(DataCell(st_pl))
-        self.Cells.sort(key=plate_name)
+        added = False
+        for _id, st_pl in plates.items():
+            cell = self.cells.get(_id)
+            if cell is None:
+                self.cells[_id] = DataCell(st_pl)
+                added = True
+            elif cell.state != DataCell.signature(st_pl):
+                self.cells[_id] = DataCell(st_pl)
+                self.cells[_id].merge_pressure(cell.Pressure)
+        if added:
+            self.cells = dict(sorted(self.cells.items()))
 
     def load_conds(self, _conds: list[str]):
         """Load the physics conditions evaluated
@@ -72,10 +102,9 @@ class DataLogger:
                             'Max Pressure [kN/$m^2$]']
 
     def update_stiff_plate(self, stiff_plate: StiffPlate):
-        for cell in self.Cells:
-            if cell.id == stiff_plate.id:
-                cell.update(stiff_plate)
-                break
+        cell = self.cells.get(stiff_plate.id)
+        if cell is not None:
+            cell.update(stiff_plate)
 
     def create_tabular_data(self, dump=False):
         """
@@ -94,74 +123,28 @@ class DataLogger:
                     & Ixx,c [mm^4] & Area*(x_{CoA}*10^3)^2 [mm^4] & ixx,pl [mm^4]
         """
 
-        def max_p(l):
-            max_ = -1e8
-            for i in l:
-                try:
-                    if abs(max_) < abs(i): max_ = i
-                except TypeError:
-                    continue
-            if max_ == -1e8:
-                return 'Not Evaluated'
-            return max_
-
         # reset tables
         self.Press_D = []
         self.Plate_D = []
         self.Stiff_D = []
         self.St_Pl_D = []
         self.PrimS_D = []
-        # load/update data 
+        # load/update data
         self.load_data()
+        self._rows = {i: self._rows[i] for i in self._rows if i in self.cells}
         _ship = self.ship  # ugly solution to an even uglier problem
+        tables = (self.Press_D, self.Plate_D, self.St_Pl_D, self.Stiff_D, self.PrimS_D)
 
-        for i, cell in enumerate(self.Cells):
-            p = []
+        previous_tag = None
+        for cell in self.cells.values():
+            if cell.tag != previous_tag:
+                # Plate Group Initial or Shift to new group ( Annotation Purpose only !)
+                for table in tables:
+                    table.append(cell.tag)
+                previous_tag = cell.tag
+            for table, rows in zip(tables, self.cell_rows(cell)):
+                table.extend(rows)
 
-            for cond in self.conds:
-                if cond in cell.Pressure:
-                    p.append(round(cell.Pressure[cond], 2))
-                else:
-                    p.append('-')
-
-            if len(self.Plate_D) == 0:
-                # Plate Group Initial ( Annotation Purpose only !)
-                self.Press_D.append(cell.tag)
-                self.Plate_D.append(cell.tag)
-                self.Stiff_D.append(cell.tag)
-                self.St_Pl_D.append(cell.tag)
-                self.PrimS_D.append(cell.tag)
-            else:
-                # Shift to new group ( Annotation Purpose only !)
-                if self.Cells[i - 1].tag != cell.tag:
-                    self.Press_D.append(cell.tag)
-                    self.Plate_D.append(cell.tag)
-                    self.Stiff_D.append(cell.tag)
-                    self.St_Pl_D.append(cell.tag)
-                    self.PrimS_D.append(cell.tag)
-            # Pressure Table
-            self.Press_D.append([cell.name, cell.breadth, cell.CoA, *p, max_p(p)])
-            # Plating Table
-            self.Plate_D.append([cell.name, cell.plate_material, cell.breadth_eff, cell.spacing, cell.CoA, max_p(p),
-                                 cell.p_calc_t, cell.p_empi_t, cell.p_corr_t, cell.p_net_t, cell.p_tn50_c,
-                                 cell.p_thick])
-            # Stiffened Plate Table
-            self.St_Pl_D.append([cell.name, 'Main Plate', *cell.Area_Data[0]])
-            for j in range(1, len(cell.Area_Data)): self.St_Pl_D.append(
-                [cell.name, f'Stiffener : {j}', *cell.Area_Data[j]])
-            self.St_Pl_D.append(
-                [cell.name, 'Total St. Plate Sums:', cell.Area, cell.CoA, [round(x * cell.Area, 2) for x in cell.CoA],
-                 '', '', cell.Ixx_c])
-            # Stiffeners Table
-            if cell.N_st != '-':
-                tmp = [cell.name, cell.stiffener_material, cell.type, cell.Zc, cell.Zrule]
-                for j in range(len(cell.s_empi_t)):
-                    tmp.append([cell.heights[j], cell.s_calc_t[j], cell.s_empi_t[j],
-                                cell.s_buck_t[j], cell.s_corr_t[j], cell.s_net_t[j], cell.s_tn50_c[j], cell.s_thick[j]])
-                self.Stiff_D.append(tmp)
-            self.PrimS_D.append([cell.name, cell.Area, cell.CoA, [round(x * cell.Area, 2) for x in cell.CoA],
-                                 cell.Ixx_c, cell.Area * (cell.CoA[1] - _ship.yo) ** 2,
-                                 cell.Ixx_c + cell.Area * (cell.CoA[1] - _ship.yo) ** 2])
         self.PrimS_D.append(['Total Sums :', _ship.cross_section_area * 1e6, (_ship.xo, _ship.yo),
                              (round(_ship.xo * _ship.cross_section_area * 1e6, 2),
                               round(_ship.yo * _ship.cross_section_area * 1e6, 2)), ' ', ' ',
@@ -169,58 +152,82 @@ class DataLogger:
         if dump:
             return self.Press_D, self.Plate_D, self.Stiff_D, self.St_Pl_D, self.PrimS_D
 
+    def cell_rows(self, cell: DataCell):
+        """
+        The (pressure, plating, stiffened plates, stiffeners, ordinary stiffeners) rows of a cell.
+        They are cached and only rebuilt when the cell, the documented conditions or the neutral axis change.
+        """
+        key = (cell.state, tuple(cell.Pressure.items()), tuple(self.conds), self.ship.yo)
+        cached = self._rows.get(cell.id)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        p = [round(cell.Pressure[cond], 2) if cond in cell.Pressure else '-' for cond in self.conds]
+        St_Pl = [[cell.name, 'Main Plate', *cell.Area_Data[0]]]
+        St_Pl.extend([cell.name, f'Stiffener : {j}', *cell.Area_Data[j]] for j in range(1, len(cell.Area_Data)))
+        St_Pl.append([cell.name, 'Total St. Plate Sums:', cell.Area, cell.CoA,
+                      [round(x * cell.Area, 2) for x in cell.CoA], '', '', cell.Ixx_c])
+        Stiff = []
+        if cell.N_st != '-':
+            tmp = [cell.name, cell.stiffener_material, cell.type, cell.Zc, cell.Zrule]
+            for j in range(len(cell.s_empi_t)):
+                tmp.append([cell.heights[j], cell.s_calc_t[j], cell.s_empi_t[j],
+                            cell.s_buck_t[j], cell.s_corr_t[j], cell.s_net_t[j], cell.s_tn50_c[j], cell.s_thick[j]])
+            Stiff.append(tmp)
+        yo = self.ship.yo
+        rows = (
+            [[cell.name, cell.breadth, cell.CoA, *p, max_p(p)]],
+            [[cell.name, cell.plate_material, cell.breadth_eff, cell.spacing, cell.CoA, max_p(p),
+              cell.p_calc_t, cell.p_empi_t, cell.p_corr_t, cell.p_net_t, cell.p_tn50_c, cell.p_thick]],
+            St_Pl,
+            Stiff,
+            [[cell.name, cell.Area, cell.CoA, [round(x * cell.Area, 2) for x in cell.CoA],
+              cell.Ixx_c, cell.Area * (cell.CoA[1] - yo) ** 2, cell.Ixx_c + cell.Area * (cell.CoA[1] - yo) ** 2]],
+        )
+        self._rows[cell.id] = (key, rows)
+        return rows
+
     @staticmethod
     def tabular(data, clmns):
+        return ''.join(DataLogger.tabular_rows(data, clmns))
+
+    @staticmethod
+    def tabular_rows(data, clmns):
+        """
+        Yields the LaTeX longtable rows of data one by one, so they can be joined or streamed to a file.
+        """
         endl = '\\tabularnewline\\hline\n'
-        out = ""
         for line in data:
-            _bold = False
             if isinstance(line, list):
                 # Stiffeners Data
                 if isinstance(line[-1], list) and len(line[-1]) > 2:
                     s = -1  # slice
                     if isinstance(line[-2], list) and len(line[-2]) > 2:
                         s = -2
-                    c = 0
                     if s == -2:
-                        for elem in line[:s]:
-                            elem = DataLogger.f(elem)
-                            c += 1
-                            out += '\\multirow{' + str(abs(s)) + '}{*}{' + str(elem) + ' } & '
-                        out += ' Web & '
-                        for elem in line[-2]:
-                            elem = DataLogger.f(elem)
-                            out += f' {elem} &'
-                        out = out[:-1] + '\\tabularnewline\\cline{6-14}\n' + ' &' * c + ' Flange & '
-                        for elem in line[-1]:
-                            elem = DataLogger.f(elem)
-                            out += f' {elem} &'
-                    elif s == -1:
-                        for elem in line[:s]:
-                            elem = DataLogger.f(elem)
-                            c += 1
-                            out += elem + ' & '
-                        out += ' Web & '
-                        for elem in line[-1]:
-                            elem = DataLogger.f(elem)
-                            out += f' {elem} &'
+                        cells = ['\\multirow{' + str(abs(s)) + '}{*}{' + str(DataLogger.f(elem)) + ' } & '
+                                 for elem in line[:s]]
+                        web = ''.join(f' {DataLogger.f(elem)} &' for elem in line[-2])
+                        flange = ''.join(f' {DataLogger.f(elem)} &' for elem in line[-1])
+                        row = (''.join(cells) + ' Web & ' + web[:-1] + '\\tabularnewline\\cline{6-14}\n'
+                               + ' &' * len(cells) + ' Flange & ' + flange)
+                    else:
+                        cells = [DataLogger.f(elem) + ' & ' for elem in line[:s]]
+                        row = ''.join(cells) + ' Web & ' + ''.join(f' {DataLogger.f(elem)} &' for elem in line[-1])
                 else:
                     # Stiffened Plate Data
                     total_in_col0 = isinstance(line[0], str) and 'Total' in line[0]
                     total_in_col1 = isinstance(line[1], str) and 'Total' in line[1]
-                    if total_in_col0 or total_in_col1:
-                        _bold = True
-                        out += '\\hline\n'
-
-                    for elem in line:
-                        elem = DataLogger.bold(DataLogger.f(elem)) if _bold else DataLogger.f(elem)
-                        out += f' {elem} &'
-                out = out[:-1] + endl
+                    _bold = total_in_col0 or total_in_col1
+                    cells = ''.join(
+                        f' {DataLogger.bold(DataLogger.f(elem)) if _bold else DataLogger.f(elem)} &' for elem in line)
+                    row = ('\\hline\n' if _bold else '') + cells
+                row = row[:-1] + endl
                 if line[1] == 'Total St. Plate':  # Stiffened Plate Data
-                    out = out[:-1] + '\\hline\n'
+                    row = row[:-1] + '\\hline\n'
+                yield row
             elif isinstance(line, str):
-                out += '\\multicolumn{' + str(clmns) + '}{l}{' + line + '}' + endl
-        return out
+                yield '\\multicolumn{' + str(clmns) + '}{l}{' + line + '}' + endl
 
     @staticmethod
     def bold(a):
@@ -240,42 +247,65 @@ class DataLogger:
         else:
             Logger.warning(f'Variable {a} of {type(a)} is not supported. Thus f() will return value None.')
 
-    def get_tabular_pressure_data(self) -> str:
-        assert self.Press_D
-        clm_pres = 4 + len(self.conds)
-        conds_str_list = list(map(lambda o: str(o), self.conds))
-        conditions = TemplateFactory.substitute_template_values(condition_template, conds_str_list, separator="")
-        data = DataLogger.tabular(self.Press_D, clm_pres)
-        out = pressure_longtable_template.substitute(clm_pres=clm_pres, conditions=conditions, data=data)
+    def longtable(self, table: str):
+        """
+        Returns the rows, the column count and the template substitutions of one of the TABLES.
+        """
+        if table == 'pressure':
+            assert self.Press_D
+            clm_pres = 4 + len(self.conds)
+            conds = [{'condition': str(o)} for o in self.conds]
+            conditions = TemplateFactory.substitute_template_values(condition_template, conds, separator="")
+            return self.Press_D, clm_pres, pressure_longtable_template, {'clm_pres': clm_pres, 'conditions': conditions}
+        if table == 'plating':
+            assert self.Plate_D
+            # FIXME for some reason this is set as 12, however the matching template has "8" columns
+            #  while everything else ALSO has 8 columns in both the file & the appropriate call
+            return self.Plate_D, 12, plating_longtable_template, {}
+        if table == 'stiffeners':
+            assert self.Stiff_D
+            return self.Stiff_D, 14, stiffeners_longtable_template, {}
+        if table == 'stiffened_plates':
+            assert self.St_Pl_D
+            return self.St_Pl_D, 8, stiffened_plates_longtable_template, {}
+        if table == 'ordinary_stiffeners':
+            assert self.PrimS_D
+            return self.PrimS_D, 8, ordinary_stiffeners_longtable_template, {}
+        Logger.error(f"Unknown table {table}. The tables are {DataLogger.TABLES}")
+
+    def tabular_hash(self, table: str) -> str:
+        """
+        Content hash of a table's rows, used to skip regenerating unchanged report fragments.
+        """
+        rows, clmns, _, kwargs = self.longtable(table)
+        return hashlib.sha1(repr((rows, clmns, kwargs)).encode()).hexdigest()
+
+    def tabular_chunks(self, table: str):
+        """
+        Yields the LaTeX longtable of the table piece by piece: the template head, each row and the template tail.
+        """
+        rows, clmns, template, kwargs = self.longtable(table)
+        head, tail = template.substitute(data=SPLIT, **kwargs).split(SPLIT)
+        yield head
+        yield from DataLogger.tabular_rows(rows, clmns)
+        yield tail
+
+    def get_tabular_data(self, table: str) -> str:
+        out = ''.join(self.tabular_chunks(table))
         Logger.debug(out)
         return out
 
+    def get_tabular_pressure_data(self) -> str:
+        return self.get_tabular_data('pressure')
+
     def get_tabular_plating_data(self) -> str:
-        assert self.Plate_D
-        # FIXME for some reason this is set as 12, however the matching template has "8" columns
-        #  while everything else ALSO has 8 columns in both the file & the appropriate call
-        data = DataLogger.tabular(self.Plate_D, 12)
-        out = plating_longtable_template.substitute(data=data)
-        Logger.debug(out)
-        return out
+        return self.get_tabular_data('plating')
 
     def get_tabular_stiffeners_data(self) -> str:
-        assert self.Stiff_D
-        data = DataLogger.tabular(self.Stiff_D, 14)
-        out = stiffeners_longtable_template.substitute(data=data)
-        Logger.debug(out)
-        return out
+        return self.get_tabular_data('stiffeners')
 
     def get_tabular_stiffened_plates_data(self) -> str:
-        assert self.St_Pl_D
-        data = DataLogger.tabular(self.St_Pl_D, 8)
-        out = stiffened_plates_longtable_template.substitute(data=data)
-        Logger.debug(out)
-        return out
+        return self.get_tabular_data('stiffened_plates')
 
     def get_tabular_ordinary_stiffeners_data(self) -> str:
-        assert self.PrimS_D
-        data = DataLogger.tabular(self.PrimS_D, 8)
-        out = ordinary_stiffeners_longtable_template.substitute(data=data)
-        Logger.debug(out)
-        return out
+        return self.get_tabular_data('ordinary_stiffeners')
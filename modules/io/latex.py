@@ -1,38 +1,62 @@
+import hashlib
+import json
+import os
+from functools import partial
 from typing import Iterable
 
-import modules.render as rnr
-from modules.io.datalogger import DataLogger
+from modules.io.datalogger import DataLogger, SPLIT
 from modules.io.templates import TemplateFactory
 from modules.utils.logger import Logger
 
-preamble_template = TemplateFactory.get_latex_template("report", "preamble.tex")
-particulars_data_template = TemplateFactory.get_latex_template("chapters", "particulars.tex")
-figure_template = TemplateFactory.get_latex_template("report", "figure.tex")
-pressure_data_template = TemplateFactory.get_latex_template("chapters", "pressure_data.tex")
-plating_data_template = TemplateFactory.get_latex_template("chapters", "plating_data.tex")
-stiffeners_data_template = TemplateFactory.get_latex_template("chapters", "stiffeners_data.tex")
-stiffened_data_template = TemplateFactory.get_latex_template("chapters", "stiffened_data.tex")
-stiffened_ordinary_data_template = TemplateFactory.get_latex_template("chapters", "stiffened_ordinary_data.tex")
-content_template = TemplateFactory.get_latex_template("report", "content.tex")
-Logger.debug("Done loading latex.py templates.")
+preamble_template = TemplateFactory.get_lazy_latex_template("report", "preamble.tex")
+particulars_data_template = TemplateFactory.get_lazy_latex_template("chapters", "particulars.tex")
+figure_template = TemplateFactory.get_lazy_latex_template("report", "figure.tex")
+pressure_data_template = TemplateFactory.get_lazy_latex_template("chapters", "pressure_data.tex")
+plating_data_template = TemplateFactory.get_lazy_latex_template("chapters", "plating_data.tex")
+stiffeners_data_template = TemplateFactory.get_lazy_latex_template("chapters", "stiffeners_data.tex")
+stiffened_data_template = TemplateFactory.get_lazy_latex_template("chapters", "stiffened_data.tex")
+stiffened_ordinary_data_template = TemplateFactory.get_lazy_latex_template("chapters", "stiffened_ordinary_data.tex")
+content_template = TemplateFactory.get_lazy_latex_template("report", "content.tex")
+FRAGMENTS = ("particulars", "figures", "pressure", "plates", "stiffeners", "stiffened_plates", "ordinary_section")
+
+
+FRAGMENTS_DIR = "tabs"
+FRAGMENT_HASHES = "fragments.json"  # content hash of every fragment written in FRAGMENTS_DIR
 
 
 def generate_latex_rep(data: DataLogger, path='./', standalone=True):
-    out = latex_output(data, embeddable=not standalone, figs=('id_plt.pdf', 'tag_plt.pdf', 'PSM_plt.pdf'))
+    import modules.render as rnr  # plotting is only needed when a report is actually generated
+
+    figs = ('id_plt.pdf', 'tag_plt.pdf', 'PSM_plt.pdf')
+    data.create_tabular_data()
+    rewritten = write_latex_fragments(data, path, figs)
+    Logger.debug(f"Rewritten report fragments: {rewritten}")
     with open(path + 'tabs.tex', 'w') as file:
-        file.write(out)
-    rnr.contour_plot(data.ship, key="id", path=path + 'id_plt.pdf', cmap='jet')
-    rnr.contour_plot(data.ship, key="spacing", path=path + 'PSM_plt.pdf', cmap='jet')
-    rnr.contour_plot(data.ship, key="tag", path=path + 'tag_plt.pdf', cmap='jet')
+        file.write(latex_document(embeddable=not standalone))
+    rnr.export_figures(
+        ("contour", rnr.contour_data(data.ship, key), path + fig, {"cmap": "jet"})
+        for key, fig in (("id", 'id_plt.pdf'), ("spacing", 'PSM_plt.pdf'), ("tag", 'tag_plt.pdf'))
+    )
 
 
-def latex_output(data_logger: DataLogger, embeddable=True, figs: Iterable = ()) -> str:
+def _hash(*items) -> str:
+    return hashlib.sha1(repr(items).encode()).hexdigest()
+
+
+def _chapter_chunks(data_logger: DataLogger, table: str, chapter, values: dict):
+    head, tail = chapter.substitute(data=SPLIT, **values).split(SPLIT)
+    yield head
+    yield from data_logger.tabular_chunks(table)
+    yield tail
+
+
+def report_fragments(data_logger: DataLogger, figs: Iterable = ()):
     """
-    Generates a latex document.
-    :param embeddable: If True, returns an embeddable LaTeX string.
-    :param figs: Iterable of figures to embed in the document.
+    Yields the (name, content hash, chunks) of every report fragment in document order.
+    chunks() returns the fragment's text piece by piece; the tables are hashed on their rows, so an
+    unchanged table is neither formatted nor written again.
+    TO BE USED after data_logger.create_tabular_data().
     """
-    data_logger.create_tabular_data()
     disclaimer = ""
     if data_logger.ship.symmetrical:
         disclaimer = (
@@ -41,23 +65,67 @@ def latex_output(data_logger: DataLogger, embeddable=True, figs: Iterable = ())
         )
 
     particulars = particulars_data_template.substitute(data_logger.ship.map_members())
-    figures = TemplateFactory.substitute_template_values(figure_template, list(map(lambda o: str(o), figs)))
-    pressure = pressure_data_template.substitute(data=data_logger.get_tabular_pressure_data())
-    plates = plating_data_template.substitute(data=data_logger.get_tabular_plating_data())
-    stiffeners = stiffeners_data_template.substitute(data=data_logger.get_tabular_stiffeners_data())
-    stiffened_plates = stiffened_data_template.substitute(data=data_logger.get_tabular_stiffened_plates_data())
-    ordinary_section = stiffened_ordinary_data_template.substitute(
-        disclaimer=disclaimer,
-        data=data_logger.get_tabular_ordinary_stiffeners_data()
-    )
+    figures = TemplateFactory.substitute_template_values(figure_template, [{"figure": str(o)} for o in figs])
+    yield "particulars", _hash(particulars), lambda: (particulars,)
+    yield "figures", _hash(figures), lambda: (figures,)
+    for name, table, chapter, values in (
+            ("pressure", "pressure", pressure_data_template, {}),
+            ("plates", "plating", plating_data_template, {}),
+            ("stiffeners", "stiffeners", stiffeners_data_template, {}),
+            ("stiffened_plates", "stiffened_plates", stiffened_data_template, {}),
+            ("ordinary_section", "ordinary_stiffeners", stiffened_ordinary_data_template, {"disclaimer": disclaimer}),
+    ):
+        yield (name, _hash(data_logger.tabular_hash(table), values),
+               partial(_chapter_chunks, data_logger, table, chapter, values))
+
+
+def write_latex_fragments(data_logger: DataLogger, path='./', figs: Iterable = ()) -> list[str]:
+    """
+    Streams every report fragment to its own .tex file under path/FRAGMENTS_DIR. A fragment is only rewritten
+    when its content hash changed since the last call. Returns the names of the rewritten fragments.
+    """
+    folder = os.path.join(path, FRAGMENTS_DIR)
+    os.makedirs(folder, exist_ok=True)
+    manifest = os.path.join(folder, FRAGMENT_HASHES)
+    try:
+        with open(manifest) as file:
+            hashes = json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        hashes = {}
+
+    rewritten = []
+    for name, digest, chunks in report_fragments(data_logger, figs):
+        fragment = os.path.join(folder, name + ".tex")
+        if hashes.get(name) == digest and os.path.exists(fragment):
+            continue
+        with open(fragment, "w") as file:
+            file.writelines(chunks())
+        hashes[name] = digest
+        rewritten.append(name)
+
+    with open(manifest, "w") as file:
+        json.dump(hashes, file, indent=1)
+    return rewritten
+
+
+def latex_document(embeddable=True) -> str:
+    """
+    The report body that includes the fragments written by write_latex_fragments.
+    :param embeddable: If True, returns an embeddable LaTeX string.
+    """
+    content = content_template.substitute({name: f"\\input{{{FRAGMENTS_DIR}/{name}}}" for name in FRAGMENTS})
+    return content if embeddable else preamble_template.substitute(content=content)
+
+
+def latex_output(data_logger: DataLogger, embeddable=True, figs: Iterable = ()) -> str:
+    """
+    Generates a latex document.
+    :param embeddable: If True, returns an embeddable LaTeX string.
+    :param figs: Iterable of figures to embed in the document.
+    """
+    data_logger.create_tabular_data()
     content = content_template.substitute(
-        particulars=particulars,
-        figures=figures,
-        pressure=pressure,
-        plates=plates,
-        stiffeners=stiffeners,
-        stiffened_plates=stiffened_plates,
-        ordinary_section=ordinary_section
+        {name: "".join(chunks()) for name, _, chunks in report_fragments(data_logger, figs)}
     )
 
     if embeddable:
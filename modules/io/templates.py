@@ -9,6 +9,29 @@ class LatexTemplate(Template):
     delimiter = "^^^"
 
 
+class LazyLatexTemplate:
+    """
+    Stand-in for a LatexTemplate that reads its resource file on first use.
+    Lets modules declare their templates at import time without paying for the file I/O.
+    """
+
+    def __init__(self, *path: str):
+        self.path = path
+        self._template: LatexTemplate | None = None
+
+    @property
+    def template(self) -> LatexTemplate:
+        if self._template is None:
+            self._template = TemplateFactory.get_latex_template(*self.path)
+        return self._template
+
+    def substitute(self, *args, **kwargs) -> str:
+        return self.template.substitute(*args, **kwargs)
+
+    def safe_substitute(self, *args, **kwargs) -> str:
+        return self.template.safe_substitute(*args, **kwargs)
+
+
 # noinspection PyCallingNonCallable
 class TemplateFactory:
 
@@ -39,6 +62,13 @@ class TemplateFactory:
         with Resource("templates", "latex", *path) as tex:
             return LatexTemplate(tex.handle.read())
 
+    @staticmethod
+    def get_lazy_latex_template(*path: str) -> LazyLatexTemplate:
+        """
+        Same as get_latex_template, but the file is only read when the template is first substituted.
+        """
+        return LazyLatexTemplate(*path)
+
     @staticmethod
     def substitute_template_values[T: Template](template: T, values: Iterable, separator: str = "\n") -> str:
         """
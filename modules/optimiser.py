@@ -0,0 +1,333 @@
+import copy
+import time
+
+import numpy as np
+
+import modules.io.IO as IO
+from modules.pipeline import Evaluation, THICKNESS_TOLERANCE
+from modules.section import SectionModel
+from modules.utils.logger import Logger, silenced
+
+# Steel weight optimiser of the ordinary section. The plate thicknesses move on a GRID and the stiffeners of every
+# evaluated stiffened plate are picked from a catalog of profiles, given like the envelope's stiffener entries
+# ({'type', 'dimensions', 'material'}; without a material the stiffened plate's own is kept).
+#
+# Candidates are screened with the SectionModel, the n50 hull girder properties in closed form, against the local
+# requirements (net thicknesses, Z) the rules gave for earlier designs. The chosen design is verified by the full
+# rules on the pressure distributions evaluated once for the envelope; a violation teaches the requirement tables
+# and the search is repeated.
+
+GRID = 0.5  # [mm]
+
+
+def on_grid(thickness):
+    """
+    The gross thickness [m] rounded up to the GRID.
+    """
+    # the rounding keeps values that already are on the grid from climbing a step
+    return np.ceil(np.round(np.asarray(thickness) * 1e3 / GRID, 6)) * GRID * 1e-3
+
+
+def required(plate) -> float:
+    """
+    Net thickness [m] the rules ask of a plate.
+    """
+    return max(plate.net_thickness_calc, plate.net_thickness_empi, plate.net_thickness_buck)
+
+
+class Optimiser:
+    """
+    Searches the plate thicknesses (on the GRID) and catalog stiffeners of the evaluated stiffened plates for the
+    lightest section that passes the rules, and collects the Pareto set of steel area against section margin.
+
+    The search is greedy: it starts from the lightest design that meets the local requirements and adds the
+    thickness step or profile upgrade of best margin gain per steel area, screening every possible move of every
+    step with the SectionModel, until max_margin or max_steps is reached.
+    """
+
+    def __init__(self, envelope: dict, catalog: list[dict], recipes: dict = None, target: float = 0.0,
+                 max_margin: float = 0.5, max_steps: int = 500, max_iterations: int = 8, quiet: bool = True):
+        self.envelope = envelope
+        self.catalog = catalog
+        self.recipes = recipes
+        self.target = target
+        self.max_margin = max_margin
+        self.max_steps = max_steps
+        self.max_iterations = max_iterations
+        self.quiet = quiet
+        if not catalog:
+            Logger.error('(optimiser.py) Optimiser: The profile catalog is empty.')
+        ship = IO.parse_ship(envelope)
+        if ship is None:
+            Logger.error('(optimiser.py) Optimiser: The envelope could not be loaded.')
+        # the pressures depend on the geometry and the blocks only, they are evaluated once
+        with silenced(quiet):
+            self.warm = Evaluation(ship=ship, recipes=recipes).load().evaluate_loads()
+        self.model = SectionModel(self.warm.ship, catalog)
+        self.position = {i['id']: n for n, i in enumerate(envelope['geometry'])}
+
+        n, k = len(self.model.ids), len(catalog)
+        # maxima of the local requirements [m] over the rule runs, per stiffened plate and profile
+        self.plate_rule = np.zeros((n, k))
+        self.web_rule = np.zeros((n, k))
+        self.flange_rule = np.zeros((n, k))
+        self.Z_rule = np.zeros((n, k))
+        self.broken = np.zeros(k, dtype=bool)  # profiles the rules could not evaluate
+        self.candidates = 0
+        self.rule_runs = 0
+        self.design = None  # (thickness, profile) the last run() settled on
+
+    # ----------------------------------------------- designs -----------------------------------------------
+    def initial(self):
+        """
+        The envelope's plate thicknesses, the profiles are set by the survey.
+        """
+        return self.model.thickness.copy(), np.zeros(len(self.model.ids), dtype=int)
+
+    def envelope_of(self, thickness, profile) -> dict:
+        envelope = copy.deepcopy(self.envelope)
+        for j, id_ in enumerate(self.model.ids):
+            if not self.model.free[j]:
+                continue
+            entry = envelope['geometry'][self.position[id_]]
+            entry['plate'][2] = float(thickness[j] * 1e3)
+            if self.model.profiled[j]:
+                stiffener = dict(self.catalog[profile[j]])
+                stiffener.setdefault('material', entry['stiffeners']['material'])
+                entry['stiffeners'] = stiffener
+        return envelope
+
+    def evaluate(self, thickness, profile) -> Evaluation | None:
+        """
+        The full rules on the design, None if they fail on it.
+        """
+        self.rule_runs += 1
+        try:
+            with silenced(self.quiet):
+                ship = IO.parse_ship(self.envelope_of(thickness, profile))
+                return Evaluation(ship=ship, recipes=self.recipes).load().reuse_loads(self.warm).evaluate_scantlings()
+        except (Exception, SystemExit) as e:
+            # the rules quit() on designs they cannot evaluate
+            Logger.warning(f'(optimiser.py) Optimiser: The rules failed on a design: {type(e).__name__}: {e}')
+            return None
+
+    def learn(self, evaluation: Evaluation, profile):
+        """
+        Raises the requirement tables to the ones the rules gave for the evaluated design.
+        """
+        stiff_plates = {i.id: i for i in evaluation.ship.stiff_plates}
+        for j, id_ in enumerate(self.model.ids):
+            if not self.model.free[j]:
+                continue
+            st_pl = stiff_plates[id_]
+            columns = profile[j] if self.model.profiled[j] else slice(None)
+            self.plate_rule[j, columns] = np.maximum(self.plate_rule[j, columns], required(st_pl.plate))
+            if self.model.profiled[j]:
+                stiffener = st_pl.stiffeners[0]
+                self.web_rule[j, columns] = max(self.web_rule[j, columns], required(stiffener.plates[0]))
+                if len(stiffener.plates) > 1:
+                    self.flange_rule[j, columns] = max(self.flange_rule[j, columns], required(stiffener.plates[1]))
+                self.Z_rule[j, columns] = max(self.Z_rule[j, columns], stiffener.Z_rule)
+
+    def survey(self):
+        """
+        Runs the rules once per catalog profile, every stiffened plate carrying it, on the envelope's thicknesses.
+        """
+        thickness, profile = self.initial()
+        for p in range(len(self.catalog)):
+            profile[:] = p
+            evaluation = self.evaluate(thickness, profile)
+            if evaluation is None:
+                self.broken[p] = True
+                continue
+            self.learn(evaluation, profile)
+
+    def feasible(self):
+        """
+        (n, k) mask of the profiles that meet the stiffener requirements of each stiffened plate.
+        """
+        model = self.model
+        ok = ((model.web >= self.web_rule - THICKNESS_TOLERANCE)
+              & (model.flange >= self.flange_rule - THICKNESS_TOLERANCE)
+              & (model.Z >= self.Z_rule) & ~self.broken)
+        return ok | ~model.profiled[:, None]
+
+    def minimum(self):
+        """
+        (n, k) lightest gross plate thicknesses [m] that meet the plate requirements; the fixed plates keep theirs.
+        """
+        model = self.model
+        t = on_grid(self.plate_rule + model.cor[:, None])
+        return np.where(model.free[:, None], t, model.thickness[:, None])
+
+    def violations(self, evaluation: Evaluation, thickness, profile) -> list[str]:
+        """
+        The requirements of the full rules the design does not meet.
+        """
+        model = self.model
+        out = []
+        stiff_plates = {i.id: i for i in evaluation.ship.stiff_plates}
+        for j, id_ in enumerate(model.ids):
+            if not model.free[j]:
+                continue
+            st_pl = stiff_plates[id_]
+            if thickness[j] - model.cor[j] < required(st_pl.plate) - THICKNESS_TOLERANCE:
+                out.append(f'{id_}: plate net thickness')
+            if model.profiled[j]:
+                p, stiffener = profile[j], st_pl.stiffeners[0]
+                if model.web[j, p] < required(stiffener.plates[0]) - THICKNESS_TOLERANCE:
+                    out.append(f'{id_}: stiffener web net thickness')
+                flange = stiffener.plates[1] if len(stiffener.plates) > 1 else None
+                if flange is not None and model.flange[j, p] < required(flange) - THICKNESS_TOLERANCE:
+                    out.append(f'{id_}: stiffener flange net thickness')
+                if model.Z[j, p] < stiffener.Z_rule:
+                    out.append(f'{id_}: stiffener Z')
+        out += [f'section {key}' for key, (value, rule) in evaluation.section.items() if value < rule]
+        return out
+
+    # ------------------------------------------------ search ------------------------------------------------
+    def start(self):
+        """
+        The lightest design that meets the local requirement tables.
+        """
+        model = self.model
+        t_min, feasible = self.minimum(), self.feasible()
+        weight = np.where(feasible, model.length[:, None] * t_min + model.profile_area, np.inf)
+        profile = np.argmin(weight, axis=1)
+        for j in np.flatnonzero(model.profiled & ~feasible.any(axis=1)):
+            Logger.warning(f'(optimiser.py) Optimiser: No catalog profile meets the requirements of stiffened plate '
+                           f'{model.ids[j]}, using the one of largest Z.')
+            profile[j] = np.argmax(np.where(self.broken, -np.inf, model.Z[j]))
+        rows = np.arange(len(model.ids))
+        return t_min[rows, profile], profile
+
+    def moves(self, thickness, profile):
+        """
+        Every single plate change of a design: a GRID step of a free plate, the next heavier feasible profile of a
+        stiffened plate (with its plate at the profile's minimum). Returns (index, thickness, profile) arrays.
+        """
+        model = self.model
+        free = np.flatnonzero(model.free)
+        index, t, p = [free], [thickness[free] + GRID * 1e-3], [profile[free]]
+        t_min, feasible = self.minimum(), self.feasible()
+        for j in np.flatnonzero(model.profiled):
+            heavier = feasible[j] & (model.profile_area[j] > model.profile_area[j, profile[j]])
+            if heavier.any():
+                k = np.flatnonzero(heavier)[np.argmin(model.profile_area[j, heavier])]
+                index.append([j]), t.append([max(thickness[j], t_min[j, k])]), p.append([k])
+        return np.concatenate(index), np.concatenate(t), np.concatenate(p).astype(int)
+
+    def search(self):
+        """
+        Greedy descent from start(). Returns the screened candidates as (areas, margins, designs), designs being a
+        list of (thickness, profile) per candidate.
+        """
+        model = self.model
+        thickness, profile = self.start()
+        rows = np.arange(len(model.ids))
+        q, a, m, w = model.terms(rows, thickness, profile)
+        areas, margins, designs = [], [], []
+
+        margin = float(model.margin(q.sum(), a.sum(), m.sum()))
+        areas.append(model.area(w.sum())), margins.append(margin), designs.append((thickness, profile))
+        self.candidates += 1
+        for _ in range(self.max_steps):
+            if margin >= self.max_margin:
+                break
+            index, t, p = self.moves(thickness, profile)
+            if len(index) == 0:
+                break
+            nq, na, nm, nw = model.terms(index, t, p)
+            # O(1) update of the sums per move
+            cq, ca, cm = q.sum() - q[index] + nq, a.sum() - a[index] + na, m.sum() - m[index] + nm
+            cw = model.area(w.sum() - w[index] + nw)
+            cmargin = model.margin(cq, ca, cm)
+            self.candidates += len(index)
+            for n, j in enumerate(index):
+                t_n, p_n = thickness.copy(), profile.copy()
+                t_n[j], p_n[j] = t[n], p[n]
+                designs.append((t_n, p_n))
+            areas.extend(cw), margins.extend(cmargin)
+
+            gain = (cmargin - margin) / np.maximum(cw - model.area(w.sum()), 1e-12)
+            best = int(np.argmax(gain))
+            if cmargin[best] <= margin:
+                break
+            thickness, profile = designs[-len(index) + best]
+            q, a, m, w = model.terms(rows, thickness, profile)
+            margin = float(cmargin[best])
+        return np.array(areas), np.array(margins), designs
+
+    @staticmethod
+    def pareto(areas, margins) -> list[int]:
+        """
+        Indices of the candidates no other one beats in both steel area and margin, by increasing area.
+        """
+        order = np.lexsort((-margins, areas))
+        front, best = [], -np.inf
+        for i in order:
+            if margins[i] > best:
+                front.append(int(i))
+                best = margins[i]
+        return front
+
+    # ------------------------------------------------ report ------------------------------------------------
+    def describe(self, thickness, profile) -> dict:
+        model = self.model
+        q, a, m, w = model.totals(thickness, profile)
+        plates = []
+        for j, id_ in enumerate(model.ids):
+            if not model.free[j]:
+                continue
+            entry = {'id': id_, 'thickness': round(float(thickness[j] * 1e3), 6)}
+            if model.profiled[j]:
+                entry['profile'] = int(profile[j])
+            plates.append(entry)
+        return {
+            'area': float(model.area(w)),
+            'margin': float(model.margin(q, a, m)),
+            'checks': {key: float(value) for key, value in model.checks(q, a, m).items()},
+            'plates': plates,
+        }
+
+    def run(self) -> dict:
+        """
+        Survey, then search and verify until the rules accept the lightest design with margin >= target.
+        """
+        start = time.perf_counter()
+        self.survey()
+        verified, violations, design, front = False, [], None, []
+        iterations = 0
+        for iterations in range(1, self.max_iterations + 1):
+            areas, margins, designs = self.search()
+            front = self.pareto(areas, margins)
+            adequate = [i for i in front if margins[i] >= self.target]
+            design = designs[adequate[0] if adequate else front[-1]]
+            evaluation = self.evaluate(*design)
+            if evaluation is None:
+                violations = ['the rules failed on the design']
+                break
+            violations = self.violations(evaluation, *design)
+            if not violations:
+                verified = bool(adequate)
+                break
+            self.learn(evaluation, design[1])
+        seconds = time.perf_counter() - start
+
+        self.design = design
+        report = {
+            'verified': verified,
+            'violations': violations,
+            'iterations': iterations,
+            'candidates': self.candidates,
+            'rule_runs': self.rule_runs,
+            'seconds': seconds,
+            'candidates_per_minute': self.candidates / seconds * 60,
+            'catalog': self.catalog,
+            'best': self.describe(*design),
+            'pareto': [self.describe(*designs[i]) for i in front],
+        }
+        Logger.info(f'(optimiser.py) Optimiser: {self.candidates} candidates and {self.rule_runs} rule runs in '
+                    f'{seconds:.1f} s, best steel area {report["best"]["area"]:.5g} m^2 with margin '
+                    f'{report["best"]["margin"]:.3g} ({"verified" if verified else "NOT verified"})')
+        return report
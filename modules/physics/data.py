@@ -100,8 +100,9 @@ class Data:
         self.Cwv, self.Cqw, self.Cwh, self.Cwt, self.Cxs, self.Cxp, self.Cxg, self.Cys, self.Cyr, self.Cyg, self.Czh, self.Czr, self.Czp = self.Combination_Factors()
         # Bending Moments and Shear Forces calculation
         self.Mwv_lc, self.Qwv_lc, self.Mwh_lc, self.Mws = self.moments_eval()  # maybe later add torsional calculations
-        self.sigma = lambda y, z: 1e-3 * (
-                (self.Mwv_lc + self.Mws) / self.Ixx * (z - self.yn) - self.Mwh_lc / self.Iyy * y)
+
+    def sigma(self, y, z):
+        return 1e-3 * ((self.Mwv_lc + self.Mws) / self.Ixx * (z - self.yn) - self.Mwh_lc / self.Iyy * y)
 
     def external_loadsC(self):
         '''
@@ -118,7 +119,11 @@ class Data:
         '''
         return self.fxL, self.fps, self.fb, self.ft, self.rho, self.LBP, self.B, self.Cw, self.Lsc, self.Tlc, self.D
 
-    def Combination_Factors(self):
+    def Combination_Factors(self, cond: str = None):
+        """
+        Combination factors of the condition (this case's by default), the -2 variants are the -1 ones negated.
+        """
+        cond = self.cond if cond is None else cond
 
         # C = ['Cwv','Cqw','Cwh','Cwt','Cxs','Cxp','Cxg','Cys','Cyr','Cyg','Czh','Czr','Czp']
         HSM_1 = [-1, -self.fps, 0, 0, 0.3 - 0.2 * self.ft, -0.7, 0.6, 0, 0, 0, 0.5 * self.ft - 0.15, 0, 0.7]
@@ -139,13 +144,13 @@ class Data:
         MAP = {'HSM': HSM_1, 'HSA': HSA_1, 'FSM': FSM_1, 'BSR': BSR_1P, 'BSP': BSP_1P, 'OSA': OSA_1P, 'OST': OST_1P}
 
         try:
-            RES = MAP[self.cond[:3]]
-            if '_2' in self.cond:
+            RES = MAP[cond[:3]]
+            if '-2' in cond:
                 RES = [-1 * i for i in RES]
             return RES
         except KeyError:
             Logger.error(
-                f"PhysicsData/Combination_Factors: {self.cond} is not a valid Dynamic Condition abbreviation.",
+                f"PhysicsData/Combination_Factors: {cond} is not a valid Dynamic Condition abbreviation.",
                 die=False
             )
             Logger.error("Invalid condition to study. Enter an appropriate Condition out of :", die=False)
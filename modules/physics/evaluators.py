@@ -1,12 +1,16 @@
 from modules.baseclass.ship import Ship
 from modules.physics.data import Data
 from modules.physics.environmental import block_hydrostatic_pressure
-from modules.physics.internal import dynamic_dry_cargo_pressure, dynamic_liquid_pressure, void_pressure, \
-    static_dry_cargo_pressure, static_liquid_pressure
+from modules.physics.internal import void_pressure, static_dry_cargo_pressure, static_liquid_pressure
+from modules.physics.superposition import UnitResponses, LIQUID_SPACES
 from modules.utils.logger import Logger
 
 
-def dynamic_total_eval(ship: Ship, Tlc: float, case: str):
+def dynamic_total_eval(ship: Ship, Tlc: float, case: str, responses: UnitResponses = None):
+    """
+    The pressures of the two EDWs of the dynamic case. The unit responses of the draught do not depend on the EDW,
+    the callers build them once per draught and pass them to every case.
+    """
     if case in ('BSR', 'BSP', 'OSA', 'OST'):
         _1, _2 = '-1P', '-2P'
     elif case in ('HSM', 'HSA', 'FSM'):
@@ -19,6 +23,10 @@ def dynamic_total_eval(ship: Ship, Tlc: float, case: str):
 
     case_1 = Data(Tlc, ship, case + _1)
     case_2 = Data(Tlc, ship, case + _2)
+    # the dry cargo and liquid pressures of both cases in one go, by superposition of their unit responses
+    if responses is None:
+        responses = UnitResponses(ship, case_1)
+    responses.evaluate((case_1.cond, case_2.cond))
     for c in (case_1, case_2):
         for i in ship.blocks:
             args = lambda x: (i, x)
@@ -27,10 +35,8 @@ def dynamic_total_eval(ship: Ship, Tlc: float, case: str):
                 F = c.wave_pressure
 
                 args = lambda x: (x.external_loadsC(), '1' in x.cond, i)
-            elif i.space_type == 'DC':
-                F = dynamic_dry_cargo_pressure
-            elif i.space_type in ('WB', 'LC', 'OIL', 'FW'):
-                F = dynamic_liquid_pressure
+            elif i.space_type == 'DC' or i.space_type in LIQUID_SPACES:
+                F = lambda block, x: block.Pressure[x.cond]
             elif i.space_type == 'VOID':
                 F = void_pressure
 
@@ -0,0 +1,124 @@
+import math
+
+import numpy as np
+
+from modules.baseclass.block import Block
+from modules.baseclass.ship import Ship
+from modules.physics.data import Data
+from modules.utils.constants import G
+from modules.utils.logger import Logger
+from modules.utils.operations import d2r
+
+# Linear superposition of the dynamic pressures of the dry cargo and liquid blocks. The accelerations of
+# Data.accel_eval() are linear in the combination factors Cxs..Czp, and the dynamic internal pressures (CSR Part 1
+# Chapter 4 Section 6) are linear in the accelerations, so every block keeps its pressure field per unit combination
+# factor and the pressures of any Equivalent Design Wave (EDW) are a matrix product with the EDW's combination
+# factors. The reference point of the liquid pressures depends on the accelerations and is picked per EDW, out of the
+# same unit fields.
+
+# the combination factors of the accelerations, in the order of Data.Combination_Factors()
+ACCELERATION_FACTORS = ('Cxs', 'Cxp', 'Cxg', 'Cys', 'Cyr', 'Cyg', 'Czh', 'Czr', 'Czp')
+EDW = ('HSM-1', 'HSM-2', 'HSA-1', 'HSA-2', 'FSM-1', 'FSM-2', 'BSR-1P', 'BSR-2P', 'BSP-1P', 'BSP-2P',
+       'OST-1P', 'OST-2P', 'OSA-1P', 'OSA-2P')
+LIQUID_SPACES = ('WB', 'LC', 'OIL', 'FW')
+
+
+def acceleration_basis(case: Data, point) -> np.ndarray:
+    """
+    (3, 9) accelerations [ax, ay, az] at the point per unit ACCELERATION_FACTORS. Data.accel_eval() is the
+    product of the basis with the case's combination factors.
+    """
+    R = min((case.D / 4 + case.Tlc / 2, case.D / 2))
+    x, y, z = point
+    basis = np.zeros((3, len(ACCELERATION_FACTORS)))
+    basis[0, 0:3] = case.a_surge, case.a_pitch * (z - R), -G * math.sin(d2r(case.phi))
+    basis[1, 3:6] = case.a_sway, -case.a_roll * (z - R), G * math.sin(d2r(case.theta))
+    basis[2, 6:9] = case.a_heave, case.a_roll * y, -case.a_pitch * (x - 0.45 * case.Lsc)
+    return basis
+
+
+class BlockResponse:
+    """
+    Unit pressure fields of a block, (points, ACCELERATION_FACTORS) arrays:
+    W  the pressures over fb rho, of the liquids bar the part of their reference point
+    V  the V_j of the reference point evaluation of the liquids, bar the (g (zj - zG)) part of gravity
+    """
+
+    def __init__(self, block: Block, case: Data):
+        self.block = block
+        self.liquid = block.space_type in LIQUID_SPACES
+        basis = acceleration_basis(case, block.CG)
+        # every point of the section is at x = Lsc fxL
+        x = case.Lsc * case.fxL
+        coords = np.array(block.pressure_coords, dtype=float)
+        self.y, self.z = coords[:, 0], coords[:, 1]
+        xg, yg, zg = block.CG
+
+        if self.liquid:
+            self.rho = max(block.payload['rho'], 1.025)
+            # strength assessment only
+            self.full_l, self.full_t = (0.62, 0.67) if block.space_type == 'LC' else (1.0, 1.0)
+            self.V = (x - xg) * basis[0] + np.outer(self.y - yg, basis[1]) + np.outer(self.z - zg, basis[2])
+            self.gravity = G * (self.z - zg)
+            # the reference point is at x0 = xG
+            self.W = self.full_l * (xg - x) * basis[0] - self.full_t * np.outer(self.y, basis[1]) - \
+                np.outer(self.z, basis[2])
+            self.basis = basis
+        else:
+            self.rho = block.payload['rho'] if (block.payload['rho'] >= 1.0) else 1.0
+            zc = block.pressure_coords[0][1]
+            below = self.z <= zc
+            # the dry cargo pressures are evaluated at the CG's x, where the ax term vanishes
+            W = 0.25 * np.outer(yg - self.y, basis[1]) + np.outer(np.array(block.Kc, dtype=float) * (zc - self.z),
+                                                                  basis[2])
+            self.W = np.where(below[:, None], W, 0.0)
+
+    def pressures(self, fb: np.ndarray, factors: np.ndarray) -> np.ndarray:
+        """
+        (EDWs, points) pressures for the fb (EDWs,) and (EDWs, ACCELERATION_FACTORS) combination factors.
+        """
+        P = factors @ self.W.T
+        if self.liquid:
+            ref = np.argmax(factors @ self.V.T + self.gravity, axis=1)
+            _, ay, az = self.basis @ factors.T
+            P += (self.full_t * ay * self.y[ref] + az * self.z[ref])[:, None]
+        return fb[:, None] * self.rho * P
+
+
+class UnitResponses:
+    """
+    The unit pressure fields of the dry cargo and liquid blocks of a ship, for the motions and draught of case.
+    They are computed once, every EDW costs a matrix product per block thereafter.
+    """
+
+    def __init__(self, ship: Ship, case: Data):
+        self.case = case
+        self.responses = [BlockResponse(i, case) for i in ship.blocks
+                          if i.space_type == 'DC' or i.space_type in LIQUID_SPACES]
+
+    def factors(self, conds) -> tuple[np.ndarray, np.ndarray]:
+        """
+        fb (EDWs,) and the (EDWs, ACCELERATION_FACTORS) combination factors of the conditions.
+        """
+        fb = []
+        for cond in conds:
+            if cond not in self.case.fbeta:
+                Logger.error(f'(superposition.py) UnitResponses/factors: {cond} is not a valid Dynamic Condition '
+                             f'abbreviation. The available conditions are : {", ".join(self.case.fbeta)}.')
+            fb.append(self.case.fbeta[cond])
+        factors = [self.case.Combination_Factors(cond)[4:] for cond in conds]
+        return np.array(fb, dtype=float), np.array(factors, dtype=float).reshape(len(conds), -1)
+
+    def evaluate(self, conds=EDW) -> dict[str, dict[Block, list]]:
+        """
+        Evaluates the pressures of the blocks for the conditions, stores them in block.Pressure[cond] as the
+        other pressure functions do and returns them as {cond: {block: pressures}}.
+        """
+        conds = list(conds)
+        fb, factors = self.factors(conds)
+        out = {cond: {} for cond in conds}
+        for response in self.responses:
+            for cond, P in zip(conds, response.pressures(fb, factors).tolist()):
+                response.block.Pressure[cond] = P
+                out[cond][response.block] = P
+        return out
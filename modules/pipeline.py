@@ -0,0 +1,348 @@
+import copy
+import os
+import pickle
+
+import modules.io.IO as IO
+import modules.physics.evaluators as evaluators
+import modules.rules as csr
+from modules.baseclass.plate import _PLACE_
+from modules.baseclass.ship import Ship
+from modules.io.datalogger import DataLogger
+from modules.physics.data import Data
+from modules.physics.superposition import EDW, UnitResponses
+from modules.utils.constants import RHO_S
+from modules.utils.logger import Logger
+
+# calculation Recipes
+FLC = {
+    'Dynamics': 'S+D',
+    'max value': 'DC',
+    'skip value': 'LC,WB,OIL,FW,VOID'
+}
+WB = {
+    'Dynamics': 'S+D',
+    'max value': '',
+    'skip value': 'DC,LC,OIL,FW,VOID'
+}
+RECIPES = {
+    'Full Load Condition': FLC,
+    'Water Ballast Condition': WB,
+}
+DYNAMIC_CASES = ('HSM', 'BSP')
+# The stages of an evaluation, name: (the stages it needs, Evaluation method). The load cases capture the section
+# properties, so they come after the corrosion reduction and before the effective breadths of the slenderness.
+STAGES = {
+    'ship': ((), '_load'),
+    'corrosion': (('ship',), '_corrosion'),
+    'section properties': (('corrosion',), '_section_screen'),
+    'static': (('corrosion',), '_static'),
+    **{case: (('corrosion',), '_dynamic') for case in DYNAMIC_CASES},
+    'pressures': (('static', *DYNAMIC_CASES), '_plate_pressures'),
+    'slenderness': (DYNAMIC_CASES, '_slenderness'),
+    'scantlings': (('slenderness', 'pressures'), '_scantlings'),
+    'hull girder': (('scantlings',), '_hull_girder'),
+    'report': (('hull girder',), '_tabulate'),
+}
+# the state of an evaluation that its checkpoints keep
+CHECKPOINTED = ('filepath', 'recipes', 'ship', 'logger', 'cases', 'pressures', 'section', 'outputs')
+LOADING_DRAUGHT = 16
+# [m], rounding slack of the thickness verdicts
+THICKNESS_TOLERANCE = 1e-9
+
+
+class EvaluationCancelled(Exception):
+    pass
+
+
+def _no_progress(stage: str, done: int, total: int, message: str):
+    pass
+
+
+def _not_cancelled() -> bool:
+    return False
+
+
+class Evaluation:
+    """
+    The CSR scantling evaluation of a ship envelope, as the graph of STAGES. Requesting stages runs the ones they
+    need that have not run yet, and nothing else; the CLI's methods below request the stages one after the other.
+    Every stage reports progress(stage, done, total, message) as it goes, and is_cancelled() is polled between
+    steps; a cancelled evaluation raises EvaluationCancelled and leaves the ship half evaluated.
+    With a checkpoint path the evaluation is saved after every completed stage, see resume().
+    """
+
+    def __init__(self, filepath: str = None, ship: Ship = None, recipes: dict = None,
+                 progress=_no_progress, is_cancelled=_not_cancelled, checkpoint: str = None):
+        self.filepath = filepath
+        self.ship = ship
+        self.recipes = RECIPES if recipes is None else recipes
+        self.progress = progress
+        self.is_cancelled = is_cancelled
+        self.checkpoint = checkpoint
+        self.logger: DataLogger | None = None
+        self.cases = []
+        # the plates' pressure contributions, shared by the recipes
+        self.pressures: csr.PlatePressures | None = None
+        self.section: dict[str, tuple[float, float]] = {}
+        # the unit responses of the blocks per draught, shared by the dynamic stages and rebuilt after a resume
+        self.responses: dict[float, UnitResponses] = {}
+        # the outputs of the completed stages
+        self.outputs: dict[str, object] = {}
+
+    def step(self, stage: str, done: int, total: int, message: str = ''):
+        if self.is_cancelled():
+            raise EvaluationCancelled(f'Evaluation cancelled at {stage} ({done}/{total})')
+        self.progress(stage, done, total, message)
+
+    # ------------------------------------------------- stages -------------------------------------------------
+    def plan(self, *stages: str) -> list[str]:
+        """
+        The stages to run for the requested ones, in order: the requested stages and their missing ancestors.
+        """
+        order = []
+
+        def visit(stage):
+            if stage not in STAGES:
+                Logger.error(f'(pipeline.py) Evaluation/plan: {stage} is not a stage. '
+                             f'The available stages are : {", ".join(STAGES)}.')
+            if stage in self.outputs or stage in order:
+                return
+            for i in STAGES[stage][0]:
+                visit(i)
+            order.append(stage)
+
+        for stage in stages:
+            visit(stage)
+        return order
+
+    def request(self, *stages: str) -> dict:
+        """
+        Runs the plan() of the stages and returns their outputs as {stage: output}.
+        """
+        for stage in self.plan(*stages):
+            self.run_stage(stage)
+        return {stage: self.outputs[stage] for stage in stages}
+
+    def run_stage(self, stage: str):
+        """
+        Runs a single stage whether its inputs have run or not, records its output and checkpoints.
+        """
+        self.outputs[stage] = getattr(self, STAGES[stage][1])(stage)
+        if self.checkpoint is not None:
+            self.save(self.checkpoint)
+        return self.outputs[stage]
+
+    def _load(self, stage):
+        self.step('load', 0, 1, f'Loading {self.filepath}')
+        if self.ship is None:
+            self.ship = IO.load_ship(self.filepath)
+        self.logger = DataLogger(self.ship)
+        self.step('load', 1, 1, 'Ship loaded')
+        return self.ship
+
+    def _corrosion(self, stage):
+        self.step('loads', 0, 2 + len(DYNAMIC_CASES), 'Evaluating Corrosion Reduction for stiffened plates...')
+        csr.corrosion_assign(self.ship, offload=True)
+
+    def _section_screen(self, stage):
+        """
+        The hull girder checks of the net section with its effective breadths, before the rules raise any
+        thickness, without a single pressure evaluation. The section is a copy, the load cases capture the
+        ship's own.
+        """
+        ship = copy.deepcopy(self.ship)
+        ship.evaluate_beff()
+        for st_pl in ship.stiff_plates:
+            if not st_pl.null and st_pl.tag != 6:
+                st_pl.update()
+        ship.update()
+        return csr.section_checks(ship)
+
+    def _static(self, stage):
+        self.step('loads', 1, 2 + len(DYNAMIC_CASES), 'Evaluating the STATIC case...')
+        evaluators.static_total_eval(self.ship, LOADING_DRAUGHT, RHO_S)
+
+    def _dynamic(self, stage):
+        self.step('loads', 2 + DYNAMIC_CASES.index(stage), 2 + len(DYNAMIC_CASES), f'Evaluating the {stage} cases...')
+        cases = evaluators.dynamic_total_eval(self.ship, LOADING_DRAUGHT, stage, self.unit_responses(LOADING_DRAUGHT))
+        self.cases = [i for case in DYNAMIC_CASES for i in (cases if case == stage else self.outputs.get(case, []))]
+        self.logger.load_conds([x.cond for x in self.cases])
+        return cases
+
+    def unit_responses(self, Tlc: float) -> UnitResponses:
+        if Tlc not in self.responses:
+            self.responses[Tlc] = UnitResponses(self.ship, Data(Tlc, self.ship, EDW[0]))
+        return self.responses[Tlc]
+
+    def _plate_pressures(self, stage):
+        self.pressures = csr.PlatePressures(self.ship)
+        self.step('loads', 2 + len(DYNAMIC_CASES), 2 + len(DYNAMIC_CASES), 'Loads evaluated')
+        return self.pressures
+
+    def _slenderness(self, stage):
+        self.step('slenderness', 0, 1, 'Evaluating Stiffened Plates Slenderness Requirements...')
+        self.ship.evaluate_beff()
+        slenderness = csr.buckling_evaluator(self.ship)
+        self.step('slenderness', 1, 1)
+        return slenderness
+
+    def _scantlings(self, stage):
+        for name, condition in self.recipes.items():
+            self.evaluate_condition(name, condition)
+
+    def _hull_girder(self, stage):
+        self.step('section', 0, 2, 'Evaluating the Sections Moments and Checking with the Rules...')
+        self.section = csr.ship_scantlings(self.ship)
+        self.step('section', 1, 2, 'Evaluating Corrosion Addition for stiffened plates...')
+        csr.corrosion_assign(self.ship, offload=False)
+        self.step('section', 2, 2)
+        return self.section
+
+    def _tabulate(self, stage):
+        self.step('tabulate', 0, 1)
+        self.logger.create_tabular_data()
+        self.step('tabulate', 1, 1, 'Tables updated')
+
+    # ----------------------------------------------- checkpoints -----------------------------------------------
+    def save(self, path: str):
+        """
+        Pickles the evaluated state, the file is replaced at once so that an interrupted save keeps the last one.
+        """
+        state = {key: getattr(self, key) for key in CHECKPOINTED}
+        with open(path + '.tmp', 'wb') as file:
+            pickle.dump(state, file)
+        os.replace(path + '.tmp', path)
+
+    @classmethod
+    def resume(cls, path: str, progress=_no_progress, is_cancelled=_not_cancelled, checkpoint: str = None):
+        """
+        The evaluation saved at path, its requests go on from its completed stages.
+        """
+        with open(path, 'rb') as file:
+            state = pickle.load(file)
+        evaluation = cls(progress=progress, is_cancelled=is_cancelled, checkpoint=checkpoint)
+        for key, value in state.items():
+            setattr(evaluation, key, value)
+        return evaluation
+
+    # ------------------------------------------------ the CLI's ------------------------------------------------
+    def load(self):
+        self.run_stage('ship')
+        return self
+
+    def evaluate_loads(self):
+        """
+        Corrosion reduction, then the static and dynamic pressure distributions.
+        """
+        self.request('pressures')
+        return self
+
+    def reuse_loads(self, other: 'Evaluation'):
+        """
+        Stands in for evaluate_loads() when other evaluated the loads of the same geometry and blocks, the
+        thicknesses and stiffeners may differ. The blocks' pressure distributions do not depend on them and are
+        shared, as are the plates' pressure contributions; the load cases are rebuilt for this ship's section
+        properties.
+        """
+        self.step('loads', 0, 2, 'Reusing the evaluated pressure distributions...')
+        self.ship.blocks = other.ship.blocks
+        csr.corrosion_assign(self.ship, offload=True)
+        self.outputs.update({'corrosion': None, 'static': None})
+        for case in DYNAMIC_CASES:
+            if case in other.outputs:
+                self.outputs[case] = [Data(LOADING_DRAUGHT, self.ship, i.cond) for i in other.outputs[case]]
+        self.cases = [i for case in DYNAMIC_CASES if case in self.outputs for i in self.outputs[case]]
+        self.logger.load_conds([x.cond for x in self.cases])
+        self.pressures = other.pressures if other.pressures is not None else csr.PlatePressures(self.ship)
+        self.outputs['pressures'] = self.pressures
+        self.step('loads', 2, 2, 'Loads reused')
+        return self
+
+    def evaluate_condition(self, name: str, condition: dict[str, str]):
+        """
+        Offloads every load case of the condition to the plates and evaluates the plating scantlings.
+        """
+        total = 2 * len(self.cases)
+        for i, case in enumerate(self.cases):
+            self.step(name, i, total, f'Pressure offloading for {case.cond}')
+            csr.loading_cases_eval(self.ship, case, condition, self.logger, self.pressures)
+        for i, case in enumerate(self.cases):
+            self.step(name, len(self.cases) + i, total, f'Local scantlings for {case.cond}')
+            csr.net_scantling(self.ship, case, condition['Dynamics'])
+        self.step(name, total, total, f'{name} evaluated')
+
+    def evaluate_scantlings(self):
+        self.request('hull girder')
+        return self
+
+    def tabulate(self):
+        """
+        Tabulates whatever has been evaluated, i.e. the GUI tabulates ships it only loaded. The report is only
+        recorded once its inputs have run, so that a later request() still runs them.
+        """
+        if self.plan('report') == ['report']:
+            self.request('report')
+        else:
+            self._tabulate('report')
+        return self
+
+    @staticmethod
+    def thickness_verdict(plate) -> dict:
+        """
+        As built, net, corrosion and required net thickness [mm] of a plate; it passes when its net thickness
+        covers the calculated, the empirical and the buckling requirements.
+        """
+        required = max(plate.net_thickness_calc, plate.net_thickness_empi, plate.net_thickness_buck)
+        return {
+            'thickness': float(plate.thickness * 1e3),
+            'net_thickness': float(plate.net_thickness * 1e3),
+            'corrosion': float(plate.cor_thickness * 1e3),
+            'required_net_thickness': float(required * 1e3),
+            'pass': bool(plate.net_thickness >= required - THICKNESS_TOLERANCE),
+        }
+
+    def results(self) -> dict:
+        """
+        JSON serialisable summary of the evaluated ship: the section properties and checks, and the thickness
+        verdicts per plate. Girders are not evaluated by the rules and carry no verdict.
+        """
+        plates = []
+        for st_pl in self.ship.stiff_plates:
+            if st_pl.null:
+                continue
+            entry = {'id': st_pl.id, 'tag': _PLACE_[st_pl.tag], 'evaluated': st_pl.tag != 6}
+            entry.update(self.thickness_verdict(st_pl.plate))
+            if len(st_pl.stiffeners) != 0:
+                stiffener = st_pl.stiffeners[0]
+                z, z_rule = float(stiffener.calc_Z() * 1e6), float(stiffener.Z_rule * 1e6)
+                webs = [self.thickness_verdict(i) for i in stiffener.plates]
+                entry['stiffener'] = {'Z': z, 'Z_rule': z_rule, 'plates': webs,
+                                      'pass': z >= z_rule and all(i['pass'] for i in webs)}
+                entry['pass'] = entry['pass'] and entry['stiffener']['pass']
+            if not entry['evaluated']:
+                entry['pass'] = None
+            plates.append(entry)
+
+        section = {key: {'value': float(value), 'required': float(required), 'pass': bool(value >= required)}
+                   for key, (value, required) in self.section.items()}
+        return {
+            'verdict': all(i['pass'] for i in section.values()) and all(i['pass'] is not False for i in plates),
+            'section': {
+                'yo': float(self.ship.yo),
+                'area': float(self.ship.cross_section_area),
+                'Ixx': float(self.ship.Ixx),
+                'Iyy': float(self.ship.Iyy),
+                'n50_Ixx': float(self.ship.n50_Ixx),
+                'n50_Iyy': float(self.ship.n50_Iyy),
+                'checks': section,
+            },
+            'plates': plates,
+        }
+
+    def run(self):
+        """
+        Runs every stage; returns the evaluation so that the ship and its DataLogger can be picked up.
+        """
+        self.request('report')
+        Logger.success('Evaluation concluded.')
+        return self
@@ -1,123 +1,218 @@
-import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
 
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.colors import Normalize
 from matplotlib.figure import Figure
 import numpy as np
 from matplotlib.cm import ScalarMappable
 
 from modules.utils.logger import Logger
 from modules.baseclass.ship import Ship
-from modules.utils.operations import normals_2d_np, normalize
+from modules.utils.operations import normalize
 
+# Every plot is split in a payload step, that reads the ship into plain numpy arrays, and a draw step that turns
+# the payload into a handful of collections. The payloads are picklable so figures can be drawn away from the Ship.
 
-def lines_plot(ship: Ship, show_w=False, color="black", axis_padding=(3, 1), fig=None, ax=None):
+BLOCK_COLORS = {
+    "SEA": "blue",
+    "ATM": "lightcyan",
+    "WB": "turquoise",
+    "DC": "tomato",
+    "OIL": "darkgoldenrod",
+    "FW": "aqua",
+    "VOID": "silver"
+}
+
+CONTOUR_KEYS = {
+    "thickness": ("number", "As Built Thickness [mm]"),
+    "spacing": ("string", "Web Section Spacing [m]"),
+    "material": ("string", "Material"),
+    "tag": ("string", "Locality Tag"),
+    "id": ("string", "Plate's Id"),
+}
+
+
+def _segments(x, y):
+    return np.column_stack((np.asarray(x, dtype=float), np.asarray(y, dtype=float)))
+
+
+def outline_data(ship: Ship):
     """
-    Rendering Function using the Matplotlib library.
-    Input args:
-    A ship class item,
-    show_w : Boolean, If True -> the plates seams are shown
-    color : String, describes the color to plot the lines
+    Plate and stiffener polylines of the section, together with the ship's main dimensions.
     """
-    marker = ""
-    if show_w:
-        marker = "*"
+    plates = [_segments(*i.plate.render_data()[:2]) for i in ship.stiff_plates]
+    stiffeners = [_segments(*j.render_data()[:2]) for i in ship.stiff_plates for j in i.stiffeners]
+    return {"plates": plates, "stiffeners": stiffeners, "B": ship.B, "D": ship.D, "T": ship.T}
 
-    # ! gui update passes the fig reference
-    if fig is None or ax is None:
-        fig, ax = plt.subplots(1, 1)
 
+def block_data(ship: Ship):
+    blocks = []
+    for i in ship.blocks:
+        x, y, tag, pos = i.render_data()
+        blocks.append({"outline": _segments(x, y), "type": i.space_type, "tag": tag, "pos": pos})
+    return {"blocks": blocks, "B": ship.B, "D": ship.D}
+
+
+def contour_data(ship: Ship, key="thickness"):
+    """
+    Plate polylines coloured by the requested key. Null plates are skipped except for locality.
+    Returns None when the key is not valid.
+    """
+    if key not in CONTOUR_KEYS:
+        Logger.warning(f"(render.py) contour_plot(): Key :{key} is not valid. "
+                       f"Valid options are 'thickness', 'material', 'tag', 'id', 'spacing'. Thus no plot is produced.")
+        return None
+
+    plates, values, stiffeners = [], [], []
     for i in ship.stiff_plates:
-        x, y = i.plate.render_data()[:2]
-        ax.plot(x, y, marker=marker, color=color)
-        for j in i.stiffeners:
-            ax.plot(*j.render_data()[:2], color=color)
-    ax.set_ylim([-1, ship.D + axis_padding[0]])
-    ax.set_xlim([-1, ship.B / 2 + axis_padding[1]])
-    return fig, ax
+        if i.null and key != "tag":
+            continue
+        x_, y_, t_, m_, tag_ = i.plate.render_data()
+        plates.append(_segments(x_, y_))
+        values.append({
+            "thickness": t_ * 1e3,
+            "spacing": i.PSM_spacing,
+            "material": m_,
+            "tag": tag_,
+            "id": f'{i.id}',
+        }[key])
+        stiffeners.extend(_segments(*j.render_data()[:2]) for j in i.stiffeners)
+
+    kind, label = CONTOUR_KEYS[key]
+    return {"plates": plates, "values": values, "stiffeners": stiffeners, "key": key, "kind": kind,
+            "label": label, "B": ship.B, "D": ship.D}
+
+
+def pressure_data(ship: Ship, pressure_index: str, block_types: str, normals_mode=False):
+    """
+    Pressure distribution of the selected blocks, projected on each grid point's normal.
+    Each entry holds the grid points, the unit offset directions scaled by the normalized pressure and the pressure.
+    """
+    blocks = []
+    for i in ship.blocks:
+        enabled = block_types == "all" or i.space_type in block_types
+        if not enabled:
+            continue
+
+        x, y, p = i.pressure_data(pressure_index, graphical=normals_mode)
+        if p is None:
+            continue
 
+        points = _segments(x, y)
+        # the normal of point j comes from the segment (j-1, j), the first point borrows the first segment
+        d = np.diff(points, axis=0)
+        d = np.vstack((d[:1], d))
+        norm = np.hypot(d[:, 0], d[:, 1])
+        eta = np.column_stack((-d[:, 1], d[:, 0])) / np.where(norm == 0, 1, norm)[:, None]
+        offset = eta * np.asarray(normalize(p))[:, None]
+        blocks.append({"points": points, "offset": offset, "pressure": np.asarray(p, dtype=float)})
+
+    return {"index": pressure_index, "blocks": blocks, "outline": outline_data(ship)}
 
-def block_plot(ship: Ship, show_w=True, color="black", fill=True, fig=None, ax=None):
-    marker = ""
-    if show_w:
-        marker = "*"
-
-    colors = {
-        "SEA": "blue",
-        "ATM": "lightcyan",
-        "WB": "turquoise",
-        "DC": "tomato",
-        "OIL": "darkgoldenrod",
-        "FW": "aqua",
-        "VOID": "silver"
-    }
 
+def _axes(fig, ax):
     # ! gui update passes the fig reference
     if fig is None or ax is None:
         fig, ax = plt.subplots(1, 1)
+    return fig, ax
 
-    for i in ship.blocks:
-        x, y, tag, pos = i.render_data()
-        # FIXME this is ugly, must be a better way
-        ax.fill(x, y, color=colors[i.space_type]) if fill else ax.plot(x, y, color=colors[i.space_type], marker=marker)
-        ax.annotate(tag, pos, color=colors[i.space_type])
 
-    ax.set_ylim([-3, ship.D + 3])
-    ax.set_xlim([-3, ship.B / 2 + 3])
+def draw_outline(data, show_w=False, color="black", axis_padding=(3, 1), fig=None, ax=None):
+    fig, ax = _axes(fig, ax)
+    ax.add_collection(LineCollection(data["plates"] + data["stiffeners"], colors=color))
+    if show_w and len(data["plates"]) != 0:
+        seams = np.vstack(data["plates"])
+        ax.plot(seams[:, 0], seams[:, 1], linestyle="", marker="*", color=color)
+    ax.set_ylim([-1, data["D"] + axis_padding[0]])
+    ax.set_xlim([-1, data["B"] / 2 + axis_padding[1]])
     return fig, ax
 
 
-def contour_plot(ship: Ship, cmap="Set2", color="black", key="thickness", path=None, fig=None, ax=None):
+def draw_blocks(data, show_w=True, fill=True, fig=None, ax=None):
+    fig, ax = _axes(fig, ax)
+    outlines = [i["outline"] for i in data["blocks"]]
+    colors = [BLOCK_COLORS[i["type"]] for i in data["blocks"]]
+    if fill:
+        ax.add_collection(PolyCollection(outlines, facecolors=colors, edgecolors=colors))
+    else:
+        ax.add_collection(LineCollection(outlines, colors=colors))
+        if show_w and len(outlines) != 0:
+            seams = np.vstack(outlines)
+            ax.scatter(seams[:, 0], seams[:, 1], marker="*", c=np.repeat(colors, [len(i) for i in outlines]))
+    for i, c in zip(data["blocks"], colors):
+        ax.annotate(i["tag"], i["pos"], color=c)
+
+    ax.set_ylim([-3, data["D"] + 3])
+    ax.set_xlim([-3, data["B"] / 2 + 3])
+    return fig, ax
+
+
+def draw_contour(data, cmap="Set2", color="black", path=None, fig=None, ax=None):
+    if data is None:
+        return None
+    fig, ax = _axes(fig, ax)
+    ax.add_collection(LineCollection(data["stiffeners"], colors=color))
+    ax.set_ylim([-1, data["D"] + 3])
+    ax.set_xlim([-1, data["B"] / 2 + 1])
+    fig, ax = c_contour(data["plates"], data["values"], data["label"], fig, ax, cmap, key=data["kind"])
+    ax.set_title(f"Plating's {data['key']} Plot")
+    ax.invert_xaxis()
+    if path:
+        fig.savefig(path, bbox_inches='tight', orientation="landscape")
+    return fig, ax
+
+
+def draw_pressure(data, path=None, fig=None, ax=None):
+    fig, ax = draw_outline(data["outline"], show_w=True, axis_padding=(10, 10), fig=fig, ax=ax)
+
+    lines, values, points = [], [], []
+    for i in data["blocks"]:
+        shifted = i["points"] + i["offset"] * 2
+        # anchor the distribution on the block's end points
+        lines.append(np.vstack((i["points"][:1], shifted, i["points"][-1:])))
+        values.append(np.concatenate((i["pressure"][:1], i["pressure"], i["pressure"][-1:])))
+        points.append(shifted)
+
+    if len(lines) != 0:
+        c_contour(lines, values, "Pressure [kPa]", fig, ax, "jet", marker=".", per_vertex=True)
+    outline = data["outline"]
+    ax.plot((-3, outline["B"] / 2 + 3), (outline["T"], outline["T"]))
+    ax.set_ylim([-3, outline["D"] + 3])
+    ax.set_xlim([-3, outline["B"] / 2 + 3])
+    ax.invert_xaxis()
+    ax.set_title(f"Pressure Distribution for {data['index']}")
+
+    if path:
+        fig.savefig(path, bbox_inches="tight", orientation="landscape")
+
+    return fig, ax
+
+
+def lines_plot(ship: Ship, show_w=False, color="black", axis_padding=(3, 1), fig=None, ax=None):
     """
     Rendering Function using the Matplotlib library.
     Input args:
-    A ship class item
+    A ship class item,
+    show_w : Boolean, If True -> the plates seams are shown
+    color : String, describes the color to plot the lines
     """
+    return draw_outline(outline_data(ship), show_w=show_w, color=color, axis_padding=axis_padding, fig=fig, ax=ax)
 
-    x, y, t, m = [], [], [], []
-    tag = []
-    identifier = []
-    psm_spacing = []
 
-    # ! gui update passes the fig reference
-    if fig is None or ax is None:
-        fig, ax = plt.subplots(1, 1)
+def block_plot(ship: Ship, show_w=True, color="black", fill=True, fig=None, ax=None):
+    return draw_blocks(block_data(ship), show_w=show_w, fill=fill, fig=fig, ax=ax)
 
-    for i in ship.stiff_plates:
-        # skip rendering null plates except for locality
-        if i.null and key != "tag":
-            continue
-        x_, y_, t_, m_, tag_ = i.plate.render_data()
-        x.append(x_)
-        y.append(y_)
-        t.append(t_ * 1e3)
-        m.append(m_)
-        tag.append(tag_)
-        identifier.append(f'{i.id}')
-        psm_spacing.append(i.PSM_spacing)
-
-        for j in i.stiffeners:
-            ax.plot(*j.render_data()[:2], color=color)
-
-    data = {
-        "thickness": [t, "number", "As Built Thickness [mm]"],
-        "spacing": [psm_spacing, "string", "Web Section Spacing [m]"],
-        "material": [m, "string", "Material"],
-        "tag": [tag, "string", "Locality Tag"],
-        "id": [identifier, "string", "Plate's Id"]
-    }
-
-    ax.set_ylim([-1, ship.D + 3])
-    ax.set_xlim([-1, ship.B / 2 + 1])
-    try:
-        fig, ax = c_contour(x, y, data[key][0], data[key][2], fig, ax, cmap, key=data[key][1])
-        plt.title(f"Plating's {key} Plot")
-        ax.invert_xaxis()
-        if path:
-            plt.savefig(path, bbox_inches='tight', orientation="landscape")
-        return fig, ax
-    except KeyError:
-        Logger.warning(f"(render.py) contour_plot(): Key :{key} is not valid. "
-               f"Valid options are 'thickness', 'material', 'tag', 'id', 'spacing'. Thus no plot is produced.")
+
+def contour_plot(ship: Ship, cmap="Set2", color="black", key="thickness", path=None, fig=None, ax=None):
+    """
+    Rendering Function using the Matplotlib library.
+    Input args:
+    A ship class item
+    """
+    return draw_contour(contour_data(ship, key), cmap=cmap, color=color, path=path, fig=fig, ax=ax)
 
 
 def pressure_plot(ship: Ship, pressure_index: str, block_types: str, normals_mode=False, path=None, fig=None, ax=None):
@@ -129,117 +224,151 @@ def pressure_plot(ship: Ship, pressure_index: str, block_types: str, normals_mod
     ship-> A ship class item\n
     pressure_index -> The pressure distribution case key (For example: 'HSM-1' -> HSM - 1 case).\n
     """
-    # Use the pressure distribution saved in each block
-    fig, ax = lines_plot(ship, show_w=True, axis_padding=(10, 10), fig=fig, ax=ax)
+    return draw_pressure(pressure_data(ship, pressure_index, block_types, normals_mode), path=path, fig=fig, ax=ax)
 
-    plot_x = []
-    plot_y = []
-    data = []
-    for i in ship.blocks:
-        _Px_ = []
-        _Py_ = []
 
-        enabled = block_types == "all" or i.space_type in block_types
-        if not enabled:
-            continue
-
-        x, y, p = i.pressure_data(pressure_index, graphical=normals_mode)
-
-        if p is None:
-            continue
-
-        data = [*data, math.nan, math.nan, *p, math.nan, math.nan]
-        p = normalize(p)
+def _categories(data):
+    """
+    Numbers categorical values by order of appearance, returns the numbers and the categories.
+    """
+    d_map = {}
+    for i in data:
+        d_map.setdefault(i, len(d_map) + 1)
+    return [d_map[i] for i in data], list(d_map)
 
-        for j, _ in enumerate(x):
-            if j == 0:
-                eta = normals_2d_np(np.array([[x[0], y[0]], [x[1], y[1]]]), flip_n=True, show_norms=False)
-                _Px_.append(eta[0, 0] * p[j])
-                _Py_.append(eta[0, 1] * p[j])
-                continue
 
-            eta = normals_2d_np(np.array([[x[j], y[j]], [x[j - 1], y[j - 1]]]), flip_n=False, show_norms=False)
-            _Px_.append(eta[0, 0] * p[j])
-            _Py_.append(eta[0, 1] * p[j])
+def _flat(data):
+    return np.concatenate([np.ravel(np.asarray(i, dtype=float)) for i in data]) if len(data) else np.zeros(0)
 
-        plot_x = [*plot_x, math.nan, x[0], *[x[i] + _Px_[i] * 2 for i in range(len(x))], x[-1]]
-        plot_y = [*plot_y, math.nan, y[0], *[y[i] + _Py_[i] * 2 for i in range(len(x))], y[-1]]
 
-    fig, ax = c_contour(plot_x, plot_y, data, "Pressure [kPa]", fig, ax, "jet", marker=".")
-    ax.plot((-3, ship.B / 2 + 3), (ship.T, ship.T))
-    ax.set_ylim([-3, ship.D + 3])
-    ax.set_xlim([-3, ship.B / 2 + 3])
-    ax.invert_xaxis()
-    plt.title(f"Pressure Distribution for {pressure_index}")
+def _limits(values):
+    finite = values[np.isfinite(values)]
+    return (finite.min(), finite.max()) if finite.size else (0, 1)
 
-    if path:
-        plt.savefig(path, bbox_inches="tight", orientation="landscape")
 
-    return fig, ax
-
-
-def c_contour(x, y, data, data_label, fig: Figure, ax, cmap, key="number", marker="+", lines=True):
-    d_map = {}
-    _map_ = ScalarMappable(cmap=cmap)
+def c_contour(lines, data, data_label, fig: Figure, ax, cmap, key="number", marker="+", per_vertex=False):
+    """
+    Draws the polylines in lines as a single LineCollection coloured by data.
+    data holds one value per polyline, or one value per vertex when per_vertex is set, in which case every
+    segment takes the colour of its end vertex. key is either 'number' for a continuous colour bar or
+    'string' for a categorical one. The vertices are marked with a single scatter artist.
+    Both collections are colour mapped (gid 'contour' and 'contour-vertices'), so that recolor_contour()
+    can update them in place.
+    """
+    if key == "number":
+        try:
+            values = _flat(data)
+        except ValueError:
+            Logger.error(
+                "(render.py) c_contour: Detected item of type <str>. Considering changing the key value to string."
+            )
+            return fig, ax
+        norm = Normalize(*_limits(values))
+        values = data
+    else:
+        values, categories = _categories(data)
+        norm = Normalize(1, max(len(categories), 1))
+
+    if per_vertex:
+        segments = [np.stack((i[:-1], i[1:]), axis=1) for i in lines if len(i) > 1]
+        colors = np.concatenate([np.asarray(v, dtype=float)[1:] for i, v in zip(lines, values) if len(i) > 1])
+        segments = np.concatenate(segments) if segments else np.zeros((0, 2, 2))
+        collection = LineCollection(segments, array=colors, cmap=cmap, norm=norm, gid="contour")
+        vertex_values = np.concatenate([np.asarray(v, dtype=float) for v in values])
+    else:
+        collection = LineCollection(lines, array=np.asarray(values, dtype=float), cmap=cmap, norm=norm,
+                                    gid="contour")
+        vertex_values = np.repeat(np.asarray(values, dtype=float), [len(i) for i in lines])
+    ax.add_collection(collection)
 
     if key == "number":
-        vals = []
-        for i in data:
-            if i is str:
-                Logger.error(
-                    "(render.py) c_contour: Detected item of type <str>. Considering changing the key value to string."
-                )
-                quit()
-            if (i not in vals) and (i != math.nan):
-                vals.append(i)
-        vals.sort()
-        _map_.set_array(vals)
-        cb = fig.colorbar(_map_, cmap=cmap, ax=ax)
+        cb = fig.colorbar(collection, ax=ax)
         cb.ax.set_title(data_label)
-
-    if key == "string":
-        vals = []
-        text = []
-        c = 1
-        for i in data:
-            if i not in d_map:
-                d_map[i] = c
-                d_map[c] = i
-                vals.append(c)
-                text.append("- " + str(i))
-                c += 1
-
-        vals.sort()
-        _map_.set_array(vals)
-        cb = fig.colorbar(_map_, ticks=vals, ax=ax)
+    else:
+        ticks = list(range(1, len(categories) + 1))
+        cb = fig.colorbar(collection, ticks=ticks, ax=ax)
         cb.ax.set_title(data_label)
         cb.ax.get_yaxis().set_ticks([])
-        for j, lab in enumerate(text):
-            y_off = j + 1 - 0.02
-            cb.ax.text(1, y_off, lab, ha="left", va="center")
-
-    for i in range(len(x)):
-        breaks = 0  # Int to increment where a break by nan is encountered
-        val = data[i - breaks]
-        if key == "string":
-            val = d_map[data[i - breaks]]
-
-        element_is_list =  isinstance(x[i], list)
-        element_is_tuple =  isinstance(x[i], tuple)
-        element_is_np_array =  isinstance(x[i], np.ndarray)
-
-        if element_is_list or element_is_tuple or element_is_np_array:
-            # passing line coordinates as arguments. NaN is handled internally by plot
-            ax.plot(x[i], y[i], color=_map_.to_rgba(val), marker=marker)
-            continue
-
-        if x[i] != math.nan and y[i] != math.nan:
-            ax.plot(x[i], y[i], color=_map_.to_rgba(val), marker=marker)
-            if lines and (i > 0):  # situational based on the data type
-                ax.plot((x[i], x[i - 1]), (y[i], y[i - 1]), color=_map_.to_rgba(val))
-            continue
+        for j, lab in enumerate(categories):
+            cb.ax.text(1, j + 1 - 0.02, "- " + str(lab), ha="left", va="center")
 
-        ax.plot(x[i], y[i])
-        breaks += 1
+    if marker and len(lines) != 0:
+        vertices = np.vstack(lines)
+        ax.scatter(vertices[:, 0], vertices[:, 1], c=vertex_values, cmap=cmap, norm=norm, marker=marker,
+                   gid="contour-vertices")
 
     return fig, ax
+
+
+def recolor_contour(ax, previous, data) -> bool:
+    """
+    Updates in place the colours of a contour that draw_contour() drew from the previous payload.
+    Returns False, leaving the axes untouched, when the plates or the categories changed and the contour
+    has to be drawn again.
+    """
+    if previous is None or data is None or previous["key"] != data["key"]:
+        return False
+    if len(previous["plates"]) != len(data["plates"]) or not all(
+            np.array_equal(a, b) for a, b in zip(previous["plates"], data["plates"])):
+        return False
+    if data["kind"] == "number":
+        values = np.asarray(data["values"], dtype=float)
+    else:
+        values, categories = _categories(data["values"])
+        if categories != _categories(previous["values"])[1]:
+            return False
+        values = np.asarray(values, dtype=float)
+
+    artists = {i.get_gid(): i for i in ax.collections}
+    if "contour" not in artists:
+        return False
+    artists["contour"].set_array(values)
+    if "contour-vertices" in artists:
+        artists["contour-vertices"].set_array(np.repeat(values, [len(i) for i in data["plates"]]))
+    if data["kind"] == "number":
+        # the vertices share the norm, the colour bar follows the collection
+        artists["contour"].set_clim(*_limits(values))
+    return True
+
+
+FIGURE_DRAWERS = {
+    "outline": draw_outline,
+    "blocks": draw_blocks,
+    "contour": draw_contour,
+    "pressure": draw_pressure,
+}
+
+
+def _use_agg():
+    import matplotlib
+    matplotlib.use("Agg")
+
+
+def _export_figure(job):
+    """
+    Draws a single (drawer, payload, path, kwargs) job on a standalone Agg figure. The figure never enters
+    pyplot's global state, so it is released as soon as it is saved.
+    """
+    drawer, payload, path, kwargs = job
+    fig = Figure()
+    try:
+        if FIGURE_DRAWERS[drawer](payload, fig=fig, ax=fig.add_subplot(), **kwargs) is not None:
+            fig.savefig(path, bbox_inches="tight", orientation="landscape")
+    finally:
+        fig.clear()
+    return path
+
+
+def export_figures(jobs, workers=None):
+    """
+    Renders the figure jobs concurrently in worker processes and returns their paths.
+    Each job is a tuple (drawer, payload, path, kwargs), where drawer is a FIGURE_DRAWERS key and payload
+    the matching *_data() output. With workers=1, or a single job, the figures are drawn in this process.
+    """
+    jobs = list(jobs)
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers <= 1:
+        return [_export_figure(i) for i in jobs]
+    # spawn keeps the workers free of the parent's GUI/pyplot state
+    with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn"), initializer=_use_agg) as pool:
+        return list(pool.map(_export_figure, jobs))
@@ -4,6 +4,9 @@
 
 # Materials Constant Array see. CSR ... to be filled
 import math
+
+import numpy as np
+
 from modules.baseclass.stiff_plate import StiffPlate
 from modules.baseclass.block import Block
 from modules.baseclass.ship import Ship
@@ -15,514 +18,420 @@ from modules.utils.logger import Logger
 
 # page 378 the application table
 # ------------------- Thickness Calculation Functions --------------------------
-def minimum_plate_net_thickness(plate: StiffPlate, l2: float, debug=False):
+# IACS Part 1 Chapter 6, Section 3.1, Table 1, tag indexed (a, b, c) of (a + b * L2 + c * sqrt(L2)) mm
+PLATING_MINIMUM = np.array([
+    [5.5, 0.03, 0.0],  # Shell
+    [5.5, 0.03, 0.0],  # InnerBottom
+    [0.0, 0.0, 0.7],  # Hopper, and ship.type == 'BulkCarrier': (implement later)
+    [0.0, 0.0, 0.7],  # Wing
+    [5.5, 0.03, 0.0],  # Bilge
+    [4.5, 0.02, 0.0],  # WeatherDeck
+])
+KEEL_MINIMUM = np.array([7.5, 0.03, 0.0])
+
+
+def minimum_net_thickness(plate: StiffPlate, l2: float) -> float:
     """
-    -----------------------------------------
-    IACS Part 1 Chapter 6, Section 3.1
-    Table 1
-    -----------------------------------------
-    The function checks whether the Rule defined minimum thicknesses are obtained and if not updates them.
-    """
-    _CHECK_ = {
-        "Shell": {
-            "Keel": (7.5 + 0.03 * l2) * 1e-3,
-            "Else": (5.5 + 0.03 * l2) * 1e-3
-        },
-        "Hopper/Wing-BC": math.sqrt(l2) * 0.7 * 1e-3,
-        "Deck": (4.5 + 0.02 * l2) * 1e-3,
-        "InnerBottom": (5.5 + 0.03 * l2) * 1e-3,
-        "OtherPlates": (4.5 + 0.01 * l2) * 1e-3
-    }
+    minimum_net_thicknesses() of a single stiffened plate.
+    """
+    return float(minimum_net_thicknesses([plate], l2)[0])
+
 
-    if debug:
-        out = "Empirical thicknesses : "
-        for i in _CHECK_:
-            if i != "Shell":
-                out += f"{i} -> {_CHECK_[i] * 1e3} mm\n"
-                continue
-
-            keel = _CHECK_[i]["Keel"]
-            else_ = _CHECK_[i]["Else"]
-            out += f"Keel -> {keel * 1e3} mm\n"
-            out += f"Else -> {else_ * 1e3} mm\n"
-
-        Logger.debug(out)
-
-    match plate.tag:
-        case 0 | 4:
-            # keel plate
-            if plate.plate.start[0] == 0:
-                if plate.plate.net_thickness_empi < _CHECK_["Shell"]["Keel"]:
-                    Logger.debug((f"Stiffened plate's : {plate} net plate  thickness {plate.plate.net_thickness_empi} "
-                                  f"was lower than", _CHECK_["Shell"]["Keel"], ". Thus it was changed to the appropriate value"))
-                    plate.plate.net_thickness_empi = _CHECK_["Shell"]["Keel"]
-                    return
-
-                Logger.debug((f"Stiffened plate's : {plate} net plate thickness {plate.plate.net_thickness_empi} "
-                              f"was greater than", _CHECK_["Shell"]["Keel"]))
-                return
-
-            if plate.plate.net_thickness_empi < _CHECK_["Shell"]["Else"]:
-                Logger.debug(f"Stiffened plate's : {plate} net plate thickness {plate.plate.net_thickness_empi} "
-                             f"was lower than", _CHECK_["Shell"]["Else"], ". Thus it was changed to the appropriate value")
-                plate.plate.net_thickness_empi = _CHECK_["Shell"]["Else"]
-                return
-
-            Logger.debug(f"Stiffened plate's : {plate} net plate thickness {plate.plate.net_thickness_empi} "
-                         f"was greater than", _CHECK_["Shell"]["Else"])
-
-        case 1:
-            if plate.plate.net_thickness_empi < _CHECK_["InnerBottom"]:
-                Logger.debug(f"Stiffened plate's : {plate} net plate  thickness {plate.plate.net_thickness_empi} "
-                              f"was lower than", _CHECK_["InnerBottom"], ". Thus it was changed to the appropriate value")
-                plate.plate.net_thickness_empi = _CHECK_["InnerBottom"]
-                return
-
-            Logger.debug(f"Stiffened plate's : {plate} net plate thickness {plate.plate.net_thickness_empi} "
-                          f"was greater than", _CHECK_["InnerBottom"])
-
-        # and ship.type == 'BulkCarrier': (implement later)
-        case 2 | 3:
-            if plate.plate.net_thickness_empi < _CHECK_["Hopper/Wing-BC"]:
-                Logger.debug(f"Stiffened plate's : {plate} net plate thickness {plate.plate.net_thickness_empi} "
-                             f"was lower than", _CHECK_["Hopper/Wing-BC"], ". Thus it was changed to the appropriate value")
-                plate.plate.net_thickness_empi = _CHECK_["Hopper/Wing-BC"]
-                return
-
-            Logger.debug(f"Stiffened plate's : {plate} net plate thickness {plate.plate.net_thickness_empi} "
-                         f"was greater than", _CHECK_["OtherPlates"])
-
-        case 5:
-            if plate.plate.net_thickness_empi < _CHECK_['Deck']:
-                Logger.debug(f"Stiffened plate's : {plate} net plate thickness {plate.plate.net_thickness_empi} "
-                              f"was lower than", _CHECK_["Deck"], ". Thus it was changed to the appropriate value")
-                plate.plate.net_thickness_empi = _CHECK_['Deck']
-                return
-
-            Logger.debug(f"Stiffened plate's : {plate} net plate  thickness {plate.plate.net_thickness_empi} "
-                         f"was greater than", _CHECK_["Deck"])
-
-        case _:
-            Logger.error(f"(rules.py) minimum_plate_net_thickness: Plate {plate}. You are not supposed to enter here.")
+# IACS Part 1 Chapter 6, Section 3.2, Table 2
+STIFFENER_MINIMUM = {
+    "Longs": {
+        "Watertight": (3.5, 0.015),  # (a, b) of (a + b * L2) mm
+        "Else": (3.0, 0.015)
+    }
+}
 
 
 def minimum_stiff_net_thickness(plate: StiffPlate, l2: float):
+    """
+    minimum_stiff_net_thicknesses() of a single stiffened plate.
+    """
+    minimum_stiff_net_thicknesses([plate], l2)
+
+
+def minimum_stiff_net_thicknesses(plates: list[StiffPlate], l2: float):
     """
     -----------------------------------------
     IACS Part 1 Chapter 6, Section 3.2
     Table 2
     -----------------------------------------
-    The function checks whether the Rule defined minimum thicknesses are obtained and if not updates them.\n
+    The function checks whether the Rule defined minimum thicknesses are obtained and if not updates them, for the
+    stiffeners of all the (stiffened) plates at once: the web, and the flange of the flanged ones, of the first
+    stiffener are checked and the updated values are written to the plate's stiffener group.\n
     To be called explicitly after checking the respective stiffened plate's plate.
     """
-    _CHECK_ = {
-        "Longs": {
-            "Watertight": (3.5 + 0.015 * l2) * 1e-3,
-            "Else": (3.0 + 0.015 * l2) * 1e-3
-        }
-    }
-
+    if any(i.stiffeners[0].type not in ('fb', 'g', 'tb') for i in plates):
+        Logger.error(f"(rules.py) minimum_stiff_net_thicknesses: Plates "
+                     f"{[i for i in plates if i.stiffeners[0].type not in ('fb', 'g', 'tb')]}. "
+                     f"You are not supposed to enter here.")
+    a, b = STIFFENER_MINIMUM["Longs"]["Watertight"]  # For the time being every Longitudinal is on a watertight plate
     # must calculate first its pressure thickness
-    sup = 2.0 * plate.plate.net_thickness
-    base = max(_CHECK_["Longs"]["Watertight"], 0.4 * plate.plate.net_thickness)
-    update = False
-    if plate.stiffeners[0].type == 'fb' or plate.stiffeners[0].type in ('g', 'tb'):
-        stiff = plate.stiffeners[0]
-        if (stiff.plates[0].net_thickness_empi < base) and (stiff.plates[0].net_thickness_empi < sup):
-            # For the time being every Longitudinal is on a watertight plate
-            Logger.debug((f"Stiffened plate's : {plate} Stiffener Web plate thickness was lower than", base,
-                          ". Thus it was changed to the appropriate value"))
-            stiff.plates[0].net_thickness_empi = base
-            update = True
-        elif (stiff.plates[0].net_thickness_empi > base) and (stiff.plates[
-                                                                  0].net_thickness_empi > sup):
-            # For the time being every Longitudinal is on a watertight plate
-            Logger.debug((f"Stiffened plate's : {plate} Stiffener Web plate thickness was greater than", sup,
-                          ". Thus it was changed to the appropriate value"))
-            stiff.plates[0].net_thickness_empi = sup
-            update = True
-        else:
-            Logger.debug(f'Stiffened plate\'s : {plate}  Stiffener Web plate thickness was within limits')
-        if (stiff.plates[1].net_thickness_empi < base) and (stiff.plates[1].net_thickness_empi < sup):
-            # For the time being every Longitudinal is on a watertight plate
-            Logger.debug((f"Stiffened plate's : {plate} Stiffener  Flange plate thickness was lower than", base,
-                          ". Thus it was changed to the appropriate value"))
-            stiff.plates[1].net_thickness_empi = base
-            update = True
-        elif (stiff.plates[1].net_thickness_empi > base) and (stiff.plates[1].net_thickness_empi > sup):
-            # For the time being every Longitudinal is on a watertight plate
-            Logger.debug((f"Stiffened plate's : {plate} Stiffener  Flange plate thickness was greater than", sup,
-                          ". Thus it was changed to the appropriate value"))
-            stiff.plates[1].net_thickness_empi = sup
-            update = True
-        else:
-            Logger.debug(f"Stiffened plate's : {plate}  Stiffener Flange plate thickness was within limits")
-
-    else:
-        Logger.error(f"(rules.py) minimum_stiff_net_thickness: Plate {plate}. You are not supposed to enter here.")
-    if update:
-        if plate.stiffeners[0].type == 'fb':
-            for stiff in plate.stiffeners[1:]:
-                stiff.plates[0].net_thickness_empi = plate.stiffeners[0].plates[0].net_thickness_empi
-        elif plate.stiffeners[0].type in ('g', 'tb'):
-            for stiff in plate.stiffeners[1:]:
-                stiff.plates[0].net_thickness_empi = plate.stiffeners[0].plates[0].net_thickness_empi
-                stiff.plates[1].net_thickness_empi = plate.stiffeners[0].plates[1].net_thickness_empi
+    net = np.array([i.plate.net_thickness for i in plates])
+    sup = 2.0 * net
+    base = np.maximum((a + b * l2) * 1e-3, 0.4 * net)
+
+    def limited(t):
+        return np.where((t < base) & (t < sup), base, np.where((t > base) & (t > sup), sup, t))
+
+    web = np.array([i.stiffeners[0].plates[0].net_thickness_empi for i in plates])
+    flanged = np.array([len(i.stiffeners[0].plates) > 1 for i in plates], dtype=bool)
+    flange = np.array([i.stiffeners[0].plates[-1].net_thickness_empi for i in plates])
+    new_web, new_flange = limited(web), np.where(flanged, limited(flange), flange)
+    for k in np.flatnonzero((new_web != web) | (new_flange != flange)):
+        Logger.debug(f"Stiffened plate's : {plates[k]} Stiffener web/flange plate thicknesses were changed to "
+                     f"the appropriate values {new_web[k]}, {new_flange[k]}")
+        for stiff in plates[k].stiffeners:
+            stiff.plates[0].net_thickness_empi = float(new_web[k])
+            if flanged[k]:
+                stiff.plates[1].net_thickness_empi = float(new_flange[k])
 
 
 def plating_net_thickness_calculation(ship: Ship, plate: StiffPlate, case: Data, dynamic=False, debug=False):
     """
-    IACS Part 1 Chapter 6, Section 4
+    plating_net_scantling() of a single stiffened plate.
     """
+    plating_net_scantling(ship, case, dynamic=dynamic, debug=debug, plates=[plate])
 
-    # application point to be on the stiffeners
-    x = {
-        0: 1.0,  # "Shell"
-        1: 0.7,  # 'InnerBottom'
-        2: 0.7,  # 'Hopper'
-        3: 1.0,  # 'Wing'
-        4: 1.0,  # 'Bilge'
-        5: 1.0  # 'WeatherDeck'
-    }
-    ap = 1.2 - plate.spacing ** 2 / 2.1 / plate.PSM_spacing
-    try:
-        reh, rem, teh = MATERIALS[plate.plate.material]
-    except KeyError:
-        Logger.warning(f"(rules.py) plating_thickness_calculation: "
-                       f"Stiffened plate's plate {plate} has material {plate.plate.material} "
-                       f"that is not documented in this program. "
-                       f"Either consider changing it or modify constants.py MATERIALS dict. "
-                       f"Defaulting to A grade steel (Rm = 255)...")
-
-    def ca(point):
-        ca_ = min(1.05 - 0.5 * abs(case.sigma(*point)) / reh, 0.95)
-        if dynamic:
-            ca_ = min(0.9 - 0.5 * abs(case.sigma(*point)) / reh, 0.8)
-
-        if ca_ < 0:
-            Logger.warning(f"(rules.py) plating_thickness_calculation/Ca: Ca coefficient has been found negative! "
-                           f"This is due to having an extremely low Area Moment of Inertia.\n "
-                           f"I assume that this is the first design circle and therefore Ca_max will be used!")
-            if dynamic:
-                return 0.8
-            return 0.95
-        return ca_
-
-    t = lambda point, p: 0.0158 * ap * plate.spacing * math.sqrt(abs(p) / x[plate.tag] / ca(point) / reh)
-    max_t = 0
-
-    try:
-        Logger.debug(f'net_plating plate:{plate}')
-        for i, data in enumerate(plate.Pressure[case.cond]):
-            point = (data[0], data[1])
-            p = data[-1]
-            Logger.debug(f"Press: {p}, "
-                         f"Point: {point}, "
-                         f"sigma {abs(case.sigma(*point))}, "
-                         f"Ca {ca(point)}")
-            t_temp = t(point, p)
-            Logger.debug(f"t_temp:{t_temp}")
-            max_t = t_temp if max_t < t_temp else max_t
-        Logger.debug(f", max_t:{max_t}")
-    except KeyError:
-        Logger.warning(f"(rules.py) plating_thickness_calculation: The {case.cond} "
-                       f"condition has not been calculated for  plate {plate}. "
-                       f"Checking only the empirical thickness value...")
-        minimum_plate_net_thickness(plate, l2=min(300, case.Lsc), debug=debug)
-        return None
 
-    # Special Cases
-    if (plate.tag == 0) and ((ship.Tmin < plate.plate.start[1] < 1.25 * ship.Tsc)
-                             or (ship.Tmin < plate.plate.end[1] < 1.25 * ship.Tsc)):
-        t = 26 * (plate.spacing + 0.7) * (ship.B * ship.Tsc / reh ** 2) ** 0.25 * 1e-3  # m
-        Logger.debug(f"(rules.py) plating_thickness_calculation: Plate {plate} "
-                     f"Contact Fender Zone special t {t * 1e3} while local scantlings t {max_t * 1e3} [mm]")
-    elif plate.tag == 4:
-        p = plate.Pressure[case.cond][0][-1]
-        r = abs(plate.plate.start[1] - plate.plate.end[1]) + 0.5 * (plate.s_pad + plate.e_pad)
-        t = 6.45 * (p * plate.PSM_spacing * 1e3) ** 0.4 * (r * 1e3) ** 0.6 * 1e-7  # m
-        Logger.debug(f"(rules.py) plating_thickness_calculation: Plate {plate} "
-                     f"Bilge Zone special t {t * 1e3} while local scantlings t {max_t * 1e3} [mm]")
-    else:
-        t = 0
-
-    if plate.plate.net_thickness_calc < max(t, max_t):
-        plate.plate.net_thickness_calc = max(t, max_t)
-
-    minimum_plate_net_thickness(plate, l2=min(300, case.Lsc), debug=debug)  # need to check what L2 is
-    plate.update()
+# tag indexed coefficients of plating_net_scantling(), girders (6) are not evaluated
+PLATING_X = np.array([1.0, 0.7, 0.7, 1.0, 1.0, 1.0])  # application point to be on the stiffeners
+MATERIAL_NAMES = tuple(MATERIALS)
+MATERIAL_REH = np.array([MATERIALS[i][0] for i in MATERIAL_NAMES])
 
 
-def stiffener_plating_net_thickness_calculation(plate: StiffPlate, case: Data, dynamic=False):
+def minimum_net_thicknesses(plates: list[StiffPlate], l2: float) -> np.ndarray:
     """
-    IACS Part 1 Chapter 6, Section 4
-    """
-    try:
-        reh, rem, teh = MATERIALS[plate.stiffeners[0].plates[0].material]
-    except KeyError:
-        Logger.warning(f"(rules.py) plating_thickness_calculation: "
-                       f"Stiffened plate's plate {plate} has material {plate.plate.material} that is not documented "
-                       f"in this program. Either consider changing it or modify constants.py MATERIALS dict. "
-                       f"Defaulting to A grade steel (Rm = 255)...")
-    x = {
-        0: 1.0,  # "Shell"
-        1: 0.9,  # 'InnerBottom'
-        2: 0.9,  # 'Hopper'
-        3: 1.0,  # 'Wing'
-        4: 1.0,  # 'Bilge'
-        5: 1.0  # 'WeatherDeck'
-    }
-    ct_ = {
-        "AC-S": 0.75,
-        "AC-SD": 0.90
-    }
-    ct = ct_["AC-S"] if dynamic else ct_["AC-SD"]
+    -----------------------------------------
+    IACS Part 1 Chapter 6, Section 3.1
+    Table 1
+    -----------------------------------------
+    The Rule defined minimum net thickness of the stiffened plates' plates as an array. The keel plate is the
+    bottom plate on the centreline.
+    """
+    tags = np.array([i.tag for i in plates], dtype=int)
+    if np.any((tags < 0) | (tags > 5)):
+        Logger.error(f"(rules.py) minimum_net_thicknesses: Plates {[i for i in plates if not 0 <= i.tag <= 5]}. "
+                     f"You are not supposed to enter here.")
+    keel = np.array([i.tag in (0, 4) and i.plate.start[0] == 0 for i in plates], dtype=bool)
+    coefs = np.where(keel[:, None], KEEL_MINIMUM, PLATING_MINIMUM[tags])
+    return (coefs[:, 0] + coefs[:, 1] * l2 + coefs[:, 2] * math.sqrt(l2)) * 1e-3
 
-    def cs(sigma):
-        if dynamic:  # AC-S
-            if sigma >= 0:
-                return 0.75
-            return 0.85 - abs(sigma) / reh
-        # AC-SD
-        if sigma >= 0:
-            return 0.9
-        return 1.0 - abs(sigma) / reh
 
-    # hardcoded that phiw = 90 deg This is a critical assumption
-    dshr = (plate.plate.length + plate.stiffeners[0].plates[0].net_thickness + 0.5 * plate.plate.cor_thickness - 0.5 *
-            plate.stiffeners[0].plates[0].net_thickness) * 1.0
-
-    fshr = 0.7  # lower end of vertical stiffeners is the minimum worst condition
-    fbdg = 12  # horizontal stiffeners
-
-    lbdg = plate.PSM_spacing  # worst case scenario don't know the stiffener span
-    lshr = plate.PSM_spacing - plate.spacing / 2  # worst case scenario don't know the stiffener span
-    tw = lambda p: (fshr * abs(p) * plate.spacing * lshr) / (dshr * x[plate.tag] * ct * teh) * 1e-3
-    z = lambda p, point: (abs(p) * plate.spacing * 1e3 * lbdg ** 2) / (
-            fbdg * x[plate.tag] * cs(case.sigma(*point)) * reh) * 1e-6
-
-    max_t = 0
-    max_z = 0
-    p = 0
-    for i, stiff in enumerate(plate.stiffeners):
-        try:
-            p = plate.local_P(case.cond, stiff.plates[0].start)
-        except KeyError:
-            Logger.warning(f"(rules.py) stiffener_plating_thickness_calculation: "
-                           f"The {case.cond} condition has not been calculated for this plate. "
-                           f"Checking only the empirical thickness value...")
-            break
-        t_tmp = tw(p)
-        if max_t < t_tmp:
-            max_t = t_tmp
-    if plate.stiffeners[0].plates[0].net_thickness_calc < max_t:
-        for stiff in plate.stiffeners:
-            if len(stiff.plates) > 1:
-                for st_pl in stiff.plates:
-                    st_pl.net_thickness_calc = max_t
-            stiff.plates[0].net_thickness_calc = max_t
+def plating_net_scantling(ship: Ship, case: Data, dynamic=False, debug=False, plates: list[StiffPlate] = None):
+    """
+    IACS Part 1 Chapter 6, Section 4\n
+    The plating net thickness of all the (not null, not girder) stiffened plates of the ship, or of the given plates,
+    at once: the pressure points of every plate are concatenated and the requirement is reduced per plate segment.
+    """
+    plates = [i for i in (ship.stiff_plates if plates is None else plates) if not i.null and i.tag != 6]
+    if not plates:
+        return
+    l2 = min(300, case.Lsc)
+    loaded = [case.cond in i.Pressure for i in plates]
+    for plate in (i for i, j in zip(plates, loaded) if not j):
+        Logger.warning(f"(rules.py) plating_net_scantling: The {case.cond} "
+                       f"condition has not been calculated for  plate {plate}. "
+                       f"Checking only the empirical thickness value...")
 
-    minimum_stiff_net_thickness(plate, min(300, case.Lsc))
-    plate.update()
-    for i, stiff in enumerate(plate.stiffeners):
-        z_tmp = z(p, stiff.plates[0].start)
-        if max_z < z_tmp:
-            max_z = z_tmp
-    z_local = plate.stiffeners[0].calc_Z()
-    if max_z > plate.stiffeners[0].Z_rule:
-        for i in plate.stiffeners:
-            i.Z_rule = max_z
+    reh = np.empty(len(plates))
+    for k, plate in enumerate(plates):
+        try:
+            reh[k] = MATERIAL_REH[MATERIAL_NAMES.index(plate.plate.material)]
+        except ValueError:
+            Logger.warning(f"(rules.py) plating_net_scantling: "
+                           f"Stiffened plate's plate {plate} has material {plate.plate.material} "
+                           f"that is not documented in this program. "
+                           f"Either consider changing it or modify constants.py MATERIALS dict. "
+                           f"Defaulting to A grade steel (Rm = 255)...")
+            reh[k] = MATERIALS['A'][0]
+    tags = np.array([i.tag for i in plates], dtype=int)
+    spacing = np.array([i.spacing for i in plates])
+    psm = np.array([i.PSM_spacing for i in plates])
+    ap = 1.2 - spacing ** 2 / 2.1 / psm
+
+    # the pressure points, plate after plate
+    rows = [row for plate, j in zip(plates, loaded) if j for row in plate.Pressure[case.cond]]
+    counts = np.array([len(plate.Pressure[case.cond]) if j else 0 for plate, j in zip(plates, loaded)])
+    max_t = np.zeros(len(plates))
+    first_p = np.zeros(len(plates))
+    if rows:
+        y, z, p = np.array([(i[0], i[1], i[-1]) for i in rows], dtype=float).T
+        owner = np.repeat(np.arange(len(plates)), counts)
+        ca = np.minimum(0.9 - 0.5 * np.abs(case.sigma(y, z)) / reh[owner], 0.8) if dynamic else \
+            np.minimum(1.05 - 0.5 * np.abs(case.sigma(y, z)) / reh[owner], 0.95)
+        if np.any(ca < 0):
+            Logger.warning(f"(rules.py) plating_net_scantling/Ca: Ca coefficient has been found negative! "
+                           f"This is due to having an extremely low Area Moment of Inertia.\n "
+                           f"I assume that this is the first design circle and therefore Ca_max will be used!")
+            ca = np.where(ca < 0, 0.8 if dynamic else 0.95, ca)
+        t = 0.0158 * ap[owner] * spacing[owner] * np.sqrt(np.abs(p) / PLATING_X[tags[owner]] / ca / reh[owner])
+        nonempty = counts > 0
+        starts = (np.cumsum(counts) - counts)[nonempty]
+        max_t[nonempty] = np.maximum(np.maximum.reduceat(t, starts), 0)
+        first_p[nonempty] = p[starts]
 
-    if max_z > z_local:
-        Logger.warning(f"(rules.py) stiffener_plating_net_thickness_calculation: "
-                       f"Plate {plate} Z is less than Z calculated by regulations ({z_local * 1e6} < {max_z * 1e6})")
-        Logger.warning(f"Consider fixing it manually, as an automatic solution is not currently possible.")
+    # Special Cases
+    special = np.zeros(len(plates))
+    start_z = np.array([i.plate.start[1] for i in plates])
+    end_z = np.array([i.plate.end[1] for i in plates])
+    fender = np.array(loaded) & (tags == 0) & (((ship.Tmin < start_z) & (start_z < 1.25 * ship.Tsc))
+                                               | ((ship.Tmin < end_z) & (end_z < 1.25 * ship.Tsc)))
+    special[fender] = 26 * (spacing[fender] + 0.7) * (ship.B * ship.Tsc / reh[fender] ** 2) ** 0.25 * 1e-3  # m
+    bilge = np.array(loaded) & (tags == 4)
+    if np.any(bilge):
+        r = np.array([abs(i.plate.start[1] - i.plate.end[1]) + 0.5 * (i.s_pad + i.e_pad) for i in plates])
+        special[bilge] = 6.45 * (first_p[bilge] * psm[bilge] * 1e3) ** 0.4 * (r[bilge] * 1e3) ** 0.6 * 1e-7  # m
+    required = np.maximum(special, max_t)
+    minimum = minimum_net_thicknesses(plates, l2)
+
+    for k, plate in enumerate(plates):
+        if loaded[k]:
+            if debug:
+                Logger.debug(f"(rules.py) plating_net_scantling: Plate {plate} local scantlings t "
+                             f"{max_t[k] * 1e3} special t {special[k] * 1e3} minimum t {minimum[k] * 1e3} [mm]")
+            if plate.plate.net_thickness_calc < required[k]:
+                plate.plate.net_thickness_calc = float(required[k])
+        if plate.plate.net_thickness_empi < minimum[k]:
+            plate.plate.net_thickness_empi = float(minimum[k])
+        if loaded[k]:
+            plate.update()
 
 
-def buckling_evaluator(ship: Ship):
+def stiffener_plating_net_thickness_calculation(plate: StiffPlate, case: Data, dynamic=False):
     """
-    IACS PART 1 CHAPTER 8 SECTION 2
-    Slenderness requirements 
+    stiffener_net_scantling() of a single stiffened plate.
     """
-    cwcf = {
-        "fb": (22,),
-        "bb": (45,),
-        "tb": (75, 12),
-        "g": (75, 12)
-    }
+    stiffener_net_scantling([plate], case, dynamic=dynamic)
 
-    # longitudinals
-    c = 1.43
-    Logger.debug("Buckling check")
 
-    for st_plate in ship.stiff_plates:
-        Logger.debug(st_plate)
+SLENDERNESS_CWCF = {
+    "fb": (22,),
+    "bb": (45,),
+    "tb": (75, 12),
+    "g": (75, 12)
+}
+SLENDERNESS_C = 1.43  # longitudinals
+SLENDERNESS_CHECKS = {
+    'tp': 'plate thickness',
+    'tw': 'stiffener web thickness',
+    'tf': 'stiffener flange thickness',
+    'Ist': 'stiffener area moment of inertia',
+}
 
-        if len(st_plate.stiffeners) <= 0 or st_plate.tag in (4, 6):
-            continue
 
-        reh = min(MATERIALS[st_plate.plate.material][0], MATERIALS[st_plate.stiffeners[0].material][0])
-        n = len(st_plate.stiffeners)
-        aeff = n * st_plate.stiffeners[0].area + st_plate.plate.thickness * st_plate.b_eff  # m^2
-        ist = n * c * st_plate.PSM_spacing ** 2 * aeff * reh / 235 * 1e-4  # m^4
-
-        # thickness check
-        tp = st_plate.b_eff / 100 * math.sqrt(reh / 235)
-
-        Logger.debug("b_eff: ", st_plate.b_eff)
-        Logger.debug("tp: ", tp)
-
-        if st_plate.plate.net_thickness_calc < tp:
-            if st_plate.plate.net_thickness < tp:
-                Logger.warning(f"(rules.py) buckling_evaluator: "
-                               f"Available tp: {st_plate.plate.net_thickness * 1e3} mm is less than minimum "
-                               f"tp: {tp * 1e3} mm by the rules for plate {st_plate} ")
-            st_plate.plate.net_thickness_calc = tp
-        tw = st_plate.stiffeners[0].plates[0].length / cwcf[st_plate.stiffeners[0].type][0] * math.sqrt(reh / 235)
-
-        Logger.debug("tw: ", tw)
-
-        if st_plate.stiffeners[0].plates[0].net_thickness_buck < tw:
-            if st_plate.stiffeners[0].plates[0].net_thickness < tw:
-                Logger.warning(f"(rules.py) buckling_evaluator: "
-                               f"Available tw: {st_plate.stiffeners[0].plates[0].net_thickness * 1e3} mm is less than minimum "
-                               f"tw: {tw * 1e3} mm by the rules for plate {st_plate} ")
-            st_plate.stiffeners[0].plates[0].net_thickness_buck = tw
-
-        if st_plate.stiffeners[0].type in ('tb', 'g'):
-            tf = (math.sqrt((st_plate.stiffeners[0].plates[1].end[0] - st_plate.stiffeners[0].plates[0].end[0]) ** 2
-                            + (st_plate.stiffeners[0].plates[1].end[1] - st_plate.stiffeners[0].plates[0].end[1]) ** 2)
-                  / cwcf[st_plate.stiffeners[0].type][1] * math.sqrt(reh / 235))
-
-            Logger.debug("tf: ", tf)
-
-            if st_plate.stiffeners[0].plates[1].net_thickness_buck < tf:
-                if st_plate.stiffeners[0].plates[1].net_thickness < tf:
-                    Logger.warning(f"(rules.py) buckling_evaluator: "
-                                   f"Available tf: {st_plate.stiffeners[0].plates[1].net_thickness * 1e3} "
-                                   f"mm is less than minimum "
-                                   f"tf: {tf * 1e3} mm by the rules for plate {st_plate} ")
-                st_plate.stiffeners[0].plates[1].net_thickness_buck = tf
+def buckling_evaluator(ship: Ship) -> dict[str, dict[int, tuple[float, float]]]:
+    """
+    IACS PART 1 CHAPTER 8 SECTION 2
+    Slenderness requirements\n
+    The requirements of all the stiffened plates are evaluated as arrays and applied at once, followed by a single
+    section update. Returns the failed checks, {check: {plate id: (available, required)}} (see SLENDERNESS_CHECKS),
+    which are logged as one warning per check.
+    """
+    plates = [i for i in ship.stiff_plates if len(i.stiffeners) > 0 and i.tag not in (4, 6)]
+    failed = {key: {} for key in SLENDERNESS_CHECKS}
+    if not plates:
+        return failed
+    Logger.debug("Buckling check")
+    stiffeners = [i.stiffeners[0] for i in plates]
+    reh = np.array([min(MATERIALS[i.plate.material][0], MATERIALS[j.material][0]) for i, j in zip(plates, stiffeners)])
+    n = np.array([len(i.stiffeners) for i in plates])
+    b_eff = np.array([i.b_eff for i in plates])
+    aeff = n * np.array([i.area for i in stiffeners]) + np.array([i.plate.thickness for i in plates]) * b_eff  # m^2
+    ist = n * SLENDERNESS_C * np.array([i.PSM_spacing for i in plates]) ** 2 * aeff * reh / 235 * 1e-4  # m^4
+
+    # thickness checks
+    tp = b_eff / 100 * np.sqrt(reh / 235)
+    cw = np.array([SLENDERNESS_CWCF[i.type][0] for i in stiffeners])
+    tw = np.array([i.plates[0].length for i in stiffeners]) / cw * np.sqrt(reh / 235)
+    flanged = [k for k, i in enumerate(stiffeners) if i.type in ('tb', 'g')]
+    tf = np.full(len(plates), np.nan)
+    if flanged:
+        width = np.array([math.sqrt((stiffeners[k].plates[1].end[0] - stiffeners[k].plates[0].end[0]) ** 2
+                                    + (stiffeners[k].plates[1].end[1] - stiffeners[k].plates[0].end[1]) ** 2)
+                          for k in flanged])
+        cf = np.array([SLENDERNESS_CWCF[stiffeners[k].type][1] for k in flanged])
+        tf[flanged] = width / cf * np.sqrt(reh[flanged] / 235)
+
+    for k, (st_plate, stiff) in enumerate(zip(plates, stiffeners)):
+        if st_plate.plate.net_thickness_calc < tp[k]:
+            if st_plate.plate.net_thickness < tp[k]:
+                failed['tp'][st_plate.id] = (st_plate.plate.net_thickness, float(tp[k]))
+            st_plate.plate.net_thickness_calc = float(tp[k])
+        if stiff.plates[0].net_thickness_buck < tw[k]:
+            if stiff.plates[0].net_thickness < tw[k]:
+                failed['tw'][st_plate.id] = (stiff.plates[0].net_thickness, float(tw[k]))
+            stiff.plates[0].net_thickness_buck = float(tw[k])
+        if not np.isnan(tf[k]) and stiff.plates[1].net_thickness_buck < tf[k]:
+            if stiff.plates[1].net_thickness < tf[k]:
+                failed['tf'][st_plate.id] = (stiff.plates[1].net_thickness, float(tf[k]))
+            stiff.plates[1].net_thickness_buck = float(tf[k])
         # Area Moment check
         st_plate.update()
+        if st_plate.Ixx_c < ist[k]:
+            failed['Ist'][st_plate.id] = (st_plate.Ixx_c, float(ist[k]))
+    ship.update()
 
-        Logger.debug("Ist: ", ist, "Ieff: ", st_plate.Ixx_c)
-
-        if st_plate.Ixx_c < ist:
-            Logger.warning(f"(rules.py) buckling_evaluator: "
-                           f"Available Ieff: {st_plate.Ixx_c} is less than minimum "
-                           f"Ieff: {ist} by the rules for plate {st_plate}")
-        ship.update()
+    for key, ids in failed.items():
+        if ids:
+            Logger.warning(f"(rules.py) buckling_evaluator: {len(ids)} plate(s) have less than the minimum "
+                           f"{SLENDERNESS_CHECKS[key]} {key} by the rules: {sorted(ids)}")
+    return failed
 
 
 # ----------------  Loading cases manager function  ----------------------------
-def loading_cases_eval(ship: Ship, case: Data, condition: dict, logger: DataLogger):
+class PlatePressures:
     """
-    condition = {
-        'Dynamics':'SD',
-        'max value': 'DC,WB',
-        'skip value':'LC'
-    }
+    Recipe agnostic cache of the pressures the blocks apply to the stiffened plates. Every side of a plate gets
+    its pressure per case and load (plate_pressure_assigner() of the single block) once; a recipe only picks,
+    skips (zero pressure) and combines the cached sides. The blocks' pressures have to be evaluated.
     """
 
-    def maximum_p(p):
-        max_p = 0
-        index = 0
+    def __init__(self, ship: Ship):
+        self.ship = ship
+        self.sides = plate_blocks(ship)
+        self.zeros: dict[int, list] = {}
+        self.contributions: dict[tuple, list] = {}
 
-        for i, P_ in enumerate(p):
-            local_max = max(P_, key=lambda k: abs(k[-1]))
-            if max_p < local_max[-1]:  # Pressure position
-                max_p = local_max[-1]
-                index = i
-        return index
-
-    for plate in ship.stiff_plates:
-        # skip calculation for null plates and girders
-        if plate.null or plate.tag == 6:
-            continue
+    def plate_sides(self, plate: StiffPlate) -> list[int]:
+        """
+        Indices of the blocks bounding the plate in ship.blocks.
+        """
+        return self.sides.get(plate.id, [])
 
-        blocks = []
-        max_eval = False
-        for block in ship.blocks:
-
-            plate_id_is_in_block_ids = plate.id in block.list_plates_id
-            inverse_plate_is_in_block_ids = -plate.id in block.list_plates_id
-            if not (plate_id_is_in_block_ids or inverse_plate_is_in_block_ids):
-                continue
-            if block.space_type not in condition['skip value']:
-                blocks.append(block)
-                continue
-            # use a zero pressure pseudo block as the plate is well-defined
-            #  and raising an exception is unwanted behavior
+    def zero(self, plate: StiffPlate) -> list:
+        """
+        The pressure of a skipped side, from a zero pressure pseudo block as the plate is well-defined and
+        raising an exception is unwanted behavior.
+        """
+        if plate.id not in self.zeros:
             zero = Block("zero", False, "VOID", [plate.id])
-            zero.get_coords([plate, ])
-            zero.Pressure[case.cond] = [0 for _ in zero.pressure_coords]
-            blocks.append(zero)
+            zero.get_coords([plate, ], self.ship.pressure_grid)
+            # the pseudo block has no pressures, which pressure_over_plate() turns to zeros
+            self.zeros[plate.id] = zero.pressure_over_plate(plate, 'STATIC')
+        return self.zeros[plate.id]
 
+    def contribution(self, plate: StiffPlate, index: int, case: Data, load: str) -> list:
+        """
+        The pressure the index-th block of the ship applies to the plate.
+        """
+        key = (plate.id, index, case.cond, load)
+        if key not in self.contributions:
+            self.contributions[key] = plate_pressure_assigner([self.ship.blocks[index]], plate, case, load)
+        return self.contributions[key]
+
+    def plate_pressure(self, plate: StiffPlate, case: Data, condition: dict) -> list | None:
+        """
+        The plate's pressure for the case under the recipe (condition), None for plates in no block.
+        """
+        indices = self.plate_sides(plate)
+        blocks = [self.ship.blocks[i] for i in indices]
         if len(blocks) > 2 or len(blocks) == 0:
             Logger.error(
                 f"(rules.py) Loading_cases: Detected a plate: {plate} which is contained in multiple blocks. "
                 f"A stiffened plate can be boundary of only 2 Blocks at most at a time!")
             Logger.error(f"Involved Blocks:\n {blocks}")
             quit()
+        sides = [self.zero(plate) if block.space_type in condition['skip value']
+                 else self.contribution(plate, i, case, condition['Dynamics']) for i, block in zip(indices, blocks)]
+        # the skipped sides count as VOID
+        types = ['VOID' if block.space_type in condition['skip value'] else block.space_type for block in blocks]
+        if any(i in condition['max value'] for i in types):
+            # the side of the greatest pressure
+            max_p = 0
+            index = 0
+            for i, P_ in enumerate(sides):
+                local_max = max(P_, key=lambda k: abs(k[-1]))
+                if max_p < local_max[-1]:  # Pressure position
+                    max_p = local_max[-1]
+                    index = i
+            return sides[index]
+        return sides_pressure(plate, sides)
+
+
+def sides_pressure(plate: StiffPlate, sides: list[list]) -> list:
+    """
+    The pressure over a plate out of the pressures of its sides: a single side as is, the vector sum of two
+    sides projected on the plate's normal. Both sides are evaluated on the plate's own mesh and given in the
+    plate's direction (Block.pressure_over_plate()), so they pair point by point.
+    """
+    if len(sides) == 1:
+        return sides[0]
+    a, b = sides
+    if len(a) != len(b):
+        Logger.error(
+            f'(rules.py) sides_pressure: Plate {plate} Vector a has length {len(a)} while Vector b has length {len(b)} !')
+    eta = plate.plate.eta[0]
+    # Pressures are applied plate side!
+    return [(i[0], i[1], eta[0] * (i[2] * i[4] + j[2] * j[4]) + eta[1] * (i[3] * i[4] + j[3] * j[4]))
+            for i, j in zip(a, b)]
+
+
+def loading_cases_eval(ship: Ship, case: Data, condition: dict, logger: DataLogger,
+                       pressures: PlatePressures = None):
+    """
+    condition = {
+        'Dynamics':'SD',
+        'max value': 'DC,WB',
+        'skip value':'LC'
+    }
+    pressures caches the plates' pressure contributions across the cases and recipes of a ship.
+    """
+    if pressures is None:
+        pressures = PlatePressures(ship)
 
-        for block in blocks:
-            max_eval = block.space_type in condition['max value'] and not max_eval
-            if max_eval:
-                break
-
-        if max_eval:
-            p = []
-            for block in blocks:
-                # force the singular evaluation of each pressure distribution
-                p.append(plate_pressure_assigner([block], plate, case, condition['Dynamics']))
-            p_max = maximum_p(p)
-            plate.Pressure[case.cond] = p[p_max]
-        else:
-            # let the function handle the proper aggregation
-            plate.Pressure[case.cond]= plate_pressure_assigner(blocks, plate, case, condition['Dynamics'])
+    for plate in ship.stiff_plates:
+        # skip calculation for null plates and girders
+        if plate.null or plate.tag == 6:
+            continue
+        plate.Pressure[case.cond] = pressures.plate_pressure(plate, case, condition)
         logger.update_stiff_plate(plate)  # save pressure maximum pressure data
 
 
-def ship_scantlings(ship: Ship):
+SECTION_CHECKS = {
+    'In50': ('The Area Inertia Moment of the ship In50', 'In50'),
+    'Zn50,keel': ('The Section Modulus at Keel of the ship Zn50,keel', 'Zrn50'),
+    'Zn50,Depth': ('The Section Modulus at Depth of the ship Zn50,Depth', 'Zrn50'),
+}
+
+
+def section_checks(ship: Ship) -> dict[str, tuple[float, float]]:
+    """
+    The hull girder checks of the ordinary section as {check: (ship's value, rule requirement)}.
+    """
     in50 = 2.7 * ship.Cw * ship.Lsc ** 3 * ship.B * (ship.Cb + 0.7) * 1e-8
     # k = 1.0 Grade A steel(not a good idea, pretty retarded)
     zrn50 = 0.9 * ship.kappa * ship.Cw * ship.Lsc ** 2 * ship.B * (ship.Cb + 0.7) * 1e-6
-    zn50k_ship = ship.n50_Ixx / ship.yo
-    zn50d_ship = ship.n50_Ixx / abs(ship.yo - ship.D)
+    return {
+        'In50': (ship.n50_Ixx, in50),
+        'Zn50,keel': (ship.n50_Ixx / ship.yo, zrn50),
+        'Zn50,Depth': (ship.n50_Ixx / abs(ship.yo - ship.D), zrn50),
+    }
+
 
+def ship_scantlings(ship: Ship):
+    """
+    Logs the section_checks() of the ship and returns them.
+    """
+    checks = section_checks(ship)
     # FIXME this is borderline beyond saving, we need better checks or at least a better format for them
     Logger.debug(f"(rules.py) ship_scantlings: The ship's neutral axis is at {ship.yo:0.5g} meters from Keel")
-    if ship.n50_Ixx < in50:
-        Logger.warning(
-            f"(rules.py) ship_scantlings: "
-            f"The Area Inertia Moment of the ship In50 : {ship.n50_Ixx:0.5g} is less than "
-            f"In50: {in50:0.5g} calculated by the rules")
-    else:
-        Logger.success(
-            f"(rules.py) ship_scantlings: "
-            f"The Area Inertia Moment of the ship In50 : {ship.n50_Ixx:0.5g} is adequate compared to "
-            f"In50: {in50:0.5g} calculated by the rules")
-    if zn50k_ship < zrn50:
-        Logger.warning(
-            f"(rules.py) ship_scantlings: "
-            f"The Section Modulus at Keel of the ship Zn50,keel : {zn50k_ship:0.5g} is less than "
-            f"Zrn50: {zrn50:0.5g} calculated by the rules")
-    else:
-        Logger.success(
-            f"(rules.py) ship_scantlings: "
-            f"The Section Modulus at Keel of the ship Zn50,keel : {zn50k_ship:0.5g} is adequate compared to "
-            f"Zrn50: {zrn50:0.5g} calculated by the rules")
-    if zn50d_ship < zrn50:
-        Logger.warning(
-            f"(rules.py) ship_scantlings: "
-            f"The Section Modulus at Depth of the ship Zn50,Depth : {zn50d_ship:0.5g} is less than "
-            f"Zrn50: {zrn50:0.5g} calculated by the rules")
-    else:
-        Logger.success(
-            f"(rules.py) ship_scantlings: "
-            f"The Section Modulus at Depth of the ship Zn50,Depth : {zn50d_ship:0.5g} is adequate compared to "
-            f"Zrn50: {zrn50:0.5g} calculated by the rules")
+    for key, (value, required) in checks.items():
+        text, rule = SECTION_CHECKS[key]
+        if value < required:
+            Logger.warning(
+                f"(rules.py) ship_scantlings: "
+                f"{text} : {value:0.5g} is less than "
+                f"{rule}: {required:0.5g} calculated by the rules")
+        else:
+            Logger.success(
+                f"(rules.py) ship_scantlings: "
+                f"{text} : {value:0.5g} is adequate compared to "
+                f"{rule}: {required:0.5g} calculated by the rules")
+    return checks
 
 
 def net_scantling(ship: Ship, case: Data, dynamics: str, debug=True):
@@ -530,204 +439,249 @@ def net_scantling(ship: Ship, case: Data, dynamics: str, debug=True):
     if "d" in dynamics or "D" in dynamics:
         _Dynamic = True
 
-    for stiff_plate in ship.stiff_plates:
-        # skip calculation for null plates and girders
-        if stiff_plate.null or stiff_plate.tag == 6:
-            continue
-        Logger.debug(f"(rules.py) net_scantling: Evaluating plate's :{stiff_plate} PLATES NET SCANTLING")
-        plating_net_thickness_calculation(ship, stiff_plate, case, dynamic=_Dynamic, debug=debug)
-        Logger.debug(f"(rules.py) net_scantling: Evaluated plate's :{stiff_plate} PLATES NET SCANTLING")
+    Logger.debug(f"(rules.py) net_scantling: Evaluating the PLATES NET SCANTLING")
+    plating_net_scantling(ship, case, dynamic=_Dynamic, debug=debug)
     ship.update()
 
-    for stiff_plate in ship.stiff_plates:
-        # skip calculation for null plates and girders
-        if stiff_plate.null or stiff_plate.tag == 6:
-            continue
-        Logger.debug(f"(rules.py) net_scantling: Evaluating plate's {stiff_plate} STIFFENERS NET SCANTLING")
-        # Bilge plate and other loose plates
-        if len(stiff_plate.stiffeners) != 0:
-            stiffener_plating_net_thickness_calculation(stiff_plate, case, dynamic=_Dynamic)
+    Logger.debug(f"(rules.py) net_scantling: Evaluating the STIFFENERS NET SCANTLING")
+    # skip calculation for null plates and girders, the bilge plate and other loose plates have no stiffeners
+    stiffener_net_scantling([i for i in ship.stiff_plates if not i.null and i.tag != 6], case, dynamic=_Dynamic)
     ship.update()
 
 
-def corrosion_addition(stiff_plate: StiffPlate, blocks: list[Block], tmin, tmax):
-    # CSR Chapter 1, Section 3
-    corr = {
-        "WBT": {
-            "FacePlate": {
-                "=< 3,tank_top": 2.0,
-                "else": 1.5},
-            "OtherMembers": {
-                "=< 3,tank_top": 2.0,
-                "else": 1.5}
-        },
-        "CHP": {
-            "UpperPart": 1.8,
-            "Hopper/InBot": 3.7
-        },
-        "X2A": {
-            "WeatherDeck": 1.7,
-            "Other": 1.0
-        },
-        "X2SW": {
-            "Wet/Dried": 1.5,
-            "Wet": 1.0
-        },
-        "Misc": {
-            "FO/FW/LO/VS": 0.7,
-            "DrySpace": 0.5
-        }
+# tag indexed coefficients of stiffener_net_scantling()
+STIFFENER_X = np.array([1.0, 0.9, 0.9, 1.0, 1.0, 1.0])
+STIFFENER_CT = {
+    "AC-S": 0.75,
+    "AC-SD": 0.90
+}
+STIFFENER_FSHR = 0.7  # lower end of vertical stiffeners is the minimum worst condition
+STIFFENER_FBDG = 12  # horizontal stiffeners
 
-    }
-    # Grab tags
-    tags = []
-    for i in blocks:
-        if stiff_plate.id in i.list_plates_id or -stiff_plate.id in i.list_plates_id:
-            tags.append(i.space_type)
-    plate_t_corr = {
-        "in": 0,
-        "out": 0,
-    }
+
+def root_pressures(plates: list[StiffPlate], cond: str) -> np.ndarray:
+    """
+    StiffPlate.local_P() at the roots of all the stiffeners of the plates, plate after plate, out of one projection
+    of every root on the segments of its own plate's pressure polyline (polyline_projection()).
+    """
+    lines = [np.array([(i[0], i[1], i[-1]) for i in plate.Pressure[cond]], dtype=float) for plate in plates]
+    # a single pressure point is a segment of zero length
+    lines = [np.vstack([i, i]) if len(i) == 1 else i for i in lines]
+    points = np.vstack(lines)
+    segments = np.array([len(i) - 1 for i in lines])
+    first = np.cumsum([len(i) for i in lines]) - [len(i) for i in lines]
+    roots = np.array([stiff.plates[0].start for plate in plates for stiff in plate.stiffeners], dtype=float)
+    owner = np.repeat(np.arange(len(plates)), [len(i.stiffeners) for i in plates])
+
+    # every (root, segment of its plate) pair, root after root
+    pairs = segments[owner]
+    root = np.repeat(np.arange(len(roots)), pairs)
+    a = first[owner][root] + np.arange(pairs.sum()) - np.repeat(np.cumsum(pairs) - pairs, pairs)
+    dx, dy = points[a + 1, 0] - points[a, 0], points[a + 1, 1] - points[a, 1]
+    length = dx ** 2 + dy ** 2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = np.where(length > 0, ((roots[root, 0] - points[a, 0]) * dx + (roots[root, 1] - points[a, 1]) * dy)
+                     / length, 0.0)
+    t = np.minimum(1.0, np.maximum(0.0, t))
+    radius = np.hypot(points[a, 0] + t * dx - roots[root, 0], points[a, 1] + t * dy - roots[root, 1])
+    # the first nearest segment of every root
+    nearest = radius == np.minimum.reduceat(radius, np.cumsum(pairs) - pairs)[root]
+    chosen = np.flatnonzero(nearest)[np.unique(root[nearest], return_index=True)[1]]
+    return points[a[chosen], 2] + t[chosen] * (points[a[chosen] + 1, 2] - points[a[chosen], 2])
+
+
+def stiffener_net_scantling(plates: list[StiffPlate], case: Data, dynamic=False):
+    """
+    IACS Part 1 Chapter 6, Section 4\n
+    The web thickness (shear area) and section modulus requirements of the stiffeners of the (stiffened) plates,
+    evaluated at every stiffener's root with its own pressure and reduced per plate. The results are written once
+    to every plate's stiffener group.
+    """
+    plates = [i for i in plates if len(i.stiffeners) != 0]
+    if not plates:
+        return
+    loaded = [case.cond in i.Pressure for i in plates]
+    for plate in (i for i, j in zip(plates, loaded) if not j):
+        Logger.warning(f"(rules.py) stiffener_net_scantling: "
+                       f"The {case.cond} condition has not been calculated for plate {plate}. "
+                       f"Checking only the empirical thickness value...")
+    material = np.empty((len(plates), 2))  # reh, teh
+    for k, plate in enumerate(plates):
+        try:
+            material[k] = MATERIALS[plate.stiffeners[0].plates[0].material][::2]
+        except KeyError:
+            Logger.warning(f"(rules.py) stiffener_net_scantling: "
+                           f"Stiffened plate's stiffener {plate} has material {plate.stiffeners[0].plates[0].material}"
+                           f" that is not documented in this program. Either consider changing it or modify "
+                           f"constants.py MATERIALS dict. Defaulting to A grade steel (Rm = 255)...")
+            material[k] = MATERIALS['A'][::2]
+    reh, teh = material.T
+    x = STIFFENER_X[[i.tag for i in plates]]
+    ct = STIFFENER_CT["AC-S"] if dynamic else STIFFENER_CT["AC-SD"]
+    spacing = np.array([i.spacing for i in plates])
+    psm = np.array([i.PSM_spacing for i in plates])
+    web = np.array([i.stiffeners[0].plates[0].net_thickness for i in plates])
+    # hardcoded that phiw = 90 deg This is a critical assumption
+    dshr = (np.array([i.plate.length for i in plates]) + web
+            + 0.5 * np.array([i.plate.cor_thickness for i in plates]) - 0.5 * web) * 1.0
+    lbdg = psm  # worst case scenario don't know the stiffener span
+    lshr = psm - spacing / 2  # worst case scenario don't know the stiffener span
+
+    max_t = np.zeros(len(plates))
+    max_z = np.zeros(len(plates))
+    evaluated = [k for k, j in enumerate(loaded) if j]
+    if evaluated:
+        group = [plates[k] for k in evaluated]
+        p = np.abs(root_pressures(group, case.cond))
+        owner = np.repeat(evaluated, [len(i.stiffeners) for i in group])
+        y, z = np.array([stiff.plates[0].start for plate in group for stiff in plate.stiffeners], dtype=float).T
+        sigma = case.sigma(y, z)
+        if dynamic:  # AC-S
+            cs = np.where(sigma >= 0, 0.75, 0.85 - np.abs(sigma) / reh[owner])
+        else:  # AC-SD
+            cs = np.where(sigma >= 0, 0.9, 1.0 - np.abs(sigma) / reh[owner])
+        tw = (STIFFENER_FSHR * p * spacing[owner] * lshr[owner]) / (dshr[owner] * x[owner] * ct * teh[owner]) * 1e-3
+        zr = (p * spacing[owner] * 1e3 * lbdg[owner] ** 2) / (STIFFENER_FBDG * x[owner] * cs * reh[owner]) * 1e-6
+        starts = np.cumsum([len(i.stiffeners) for i in group]) - [len(i.stiffeners) for i in group]
+        max_t[evaluated] = np.maximum(np.maximum.reduceat(tw, starts), 0)
+        max_z[evaluated] = np.maximum(np.maximum.reduceat(zr, starts), 0)
+
+    for k, plate in enumerate(plates):
+        if plate.stiffeners[0].plates[0].net_thickness_calc < max_t[k]:
+            for stiff in plate.stiffeners:
+                for st_pl in stiff.plates:
+                    st_pl.net_thickness_calc = float(max_t[k])
+    minimum_stiff_net_thicknesses(plates, min(300, case.Lsc))
+
+    for k, plate in enumerate(plates):
+        plate.update()
+        z_local = plate.stiffeners[0].calc_Z()
+        if max_z[k] > plate.stiffeners[0].Z_rule:
+            for i in plate.stiffeners:
+                i.Z_rule = float(max_z[k])
+        if max_z[k] > z_local:
+            Logger.warning(f"(rules.py) stiffener_net_scantling: "
+                           f"Plate {plate} Z is less than Z calculated by regulations "
+                           f"({z_local * 1e6} < {max_z[k] * 1e6})")
+            Logger.warning(f"Consider fixing it manually, as an automatic solution is not currently possible.")
+
+
+# CSR Chapter 1, Section 3
+# Corrosion additions [mm] of a face of a plate, by (plate tag, space type on the face, draught zone of the face).
+# The internal faces depend on the space type only (zone None): the shell and the weather deck face the upper part
+# of the holds, the inner bottom, hopper and wing the hopper/inner bottom part. The external faces (SEA, ATM) depend
+# on the draught zone only (draught_zone()).
+_UPPER = {'WB': 2.0, 'DC': 1.8, 'OIL': 0.7, 'FW': 0.7, 'VOID': 0.5}
+_INNER = {'WB': 2.0, 'DC': 3.7, 'OIL': 0.7, 'FW': 0.7, 'VOID': 0.5}
+_EXTERNAL = {
+    0: {'wet': 1.0, 'wet/dried': 1.5, 'dry': 1.7},  # Shell, Wet, Wet/Dried and the Weather Deck value above
+    4: {'wet': 1.0, 'wet/dried': 1.5, 'dry': 1.7},  # Bilge
+    5: {'wet': 1.7, 'wet/dried': 1.7, 'dry': 1.7},  # WeatherDeck
+}
+CORROSION_ADDITIONS = {
+    **{(tag, space, None): value for tag in (0, 4, 5) for space, value in _UPPER.items()},
+    **{(tag, space, None): value for tag in (1, 2, 3) for space, value in _INNER.items()},
+    **{(tag, space, zone): value for tag, zones in _EXTERNAL.items() for space in ('SEA', 'ATM')
+       for zone, value in zones.items()},
+}
+CORROSION_DEFAULT = 3.7  # mm, the hopper/inner bottom value, for plates of no block
+
+
+def draught_zone(y: float, tmin: float, tmax: float) -> str:
+    if y <= tmin:
+        return 'wet'
+    if y <= tmax:
+        return 'wet/dried'
+    return 'dry'
+
+
+def plate_blocks(ship: Ship) -> dict[int, list[int]]:
+    """
+    The indices in ship.blocks of the blocks bounding every plate, {plate id: [block index]}.
+    """
+    blocks = {}
+    for index, block in enumerate(ship.blocks):
+        for _id in dict.fromkeys(abs(i) for i in block.list_plates_id):
+            blocks.setdefault(_id, []).append(index)
+    return blocks
+
+
+def space_types(ship: Ship) -> dict[int, list[str]]:
+    """
+    The space types of the blocks bounding every plate, {plate id: [space type]}, in the order of ship.blocks.
+    """
+    return {_id: [ship.blocks[i].space_type for i in indices] for _id, indices in plate_blocks(ship).items()}
+
+
+def corrosion_addition(stiff_plate: StiffPlate, blocks: list[Block], tmin, tmax, tags: list[str] = None) -> dict:
+    """
+    The corrosion additions [mm] of the inner and outer face of the plate from the space types (tags) of the blocks
+    bounding it (CORROSION_ADDITIONS), which are collected from blocks when not given.
+    """
+    if tags is None:
+        tags = [i.space_type for i in blocks
+                if stiff_plate.id in i.list_plates_id or -stiff_plate.id in i.list_plates_id]
     if len(tags) == 0:
         Logger.warning(
             (f"(rules.py) corrosion_addition:/ Stiffened plate's {stiff_plate} locality data are not present."
              "Resetting to the Hopper case for both sides"))
-        plate_t_corr["in"] = corr["CHP"]["Hopper/InBot"]
-        plate_t_corr["out"] = corr["CHP"]["Hopper/InBot"]
-        return plate_t_corr
-
-    if stiff_plate.tag in (0, 4):  # Shell plates
-        y = max(stiff_plate.plate.start[1], stiff_plate.plate.end[1])
-        if y <= tmin:
-            plate_t_corr["out"] = corr["X2SW"]["Wet"]
-        elif tmin < y < tmax:
-            plate_t_corr["out"] = corr["X2SW"]["Wet/Dried"]
-        elif y > tmax:
-            plate_t_corr["out"] = corr["X2A"]["WeatherDeck"]  # Is it tho ?
-
-        # FIXME remove duplicate with line 686
-        t_in = 0
-        for i in tags:
-            if "WB" == i:
-                if t_in < corr["WBT"]["FacePlate"]["=< 3,tank_top"]:
-                    t_in = corr["WBT"]["FacePlate"]["=< 3,tank_top"]
-            elif 'DC' == i:
-                if t_in < corr["CHP"]["UpperPart"]:
-                    t_in = corr["CHP"]["UpperPart"]
-            elif 'OIL' == i or 'FW' == i:
-                if t_in < corr["Misc"]["FO/FW/LO/VS"]:
-                    t_in = corr["Misc"]["FO/FW/LO/VS"]
-            elif 'VOID' == i:
-                if t_in < corr["Misc"]["DrySpace"]:
-                    t_in = corr["Misc"]["DrySpace"]
-
-        plate_t_corr['in'] = t_in
-
-    elif stiff_plate.tag in (1, 2, 3):  # Inner Bottom, Hopper, Wing
-        t = [0, 0]
-        ind = 0
-        c = 0
+        return {'in': CORROSION_DEFAULT, 'out': CORROSION_DEFAULT}
+
+    tag = stiff_plate.tag
+    if tag in (0, 4, 5):  # Shell plates and Weather Deck
+        zone = draught_zone(max(stiff_plate.plate.start[1], stiff_plate.plate.end[1]), tmin, tmax)
+        return {'in': max(CORROSION_ADDITIONS.get((tag, i, None), 0) for i in tags),
+                'out': CORROSION_ADDITIONS[(tag, 'SEA', zone)]}
+    if tag in (1, 2, 3):  # Inner Bottom, Hopper, Wing
         if len(tags) == 1:
             Logger.warning(
                 (f'(rules.py) corrosion_addition:/ Stiffened plate\'s {stiff_plate} locality data are inadequate.'
                  'Using the data of the one side for both sides ...'))
-            tags.append(tags[0])
-
-        # not the best way but oh well
-        while c <= 1:
-            for i, tag in enumerate(tags):
-                if "WB" == tag:
-                    if t[c] < corr['WBT']['FacePlate']['=< 3,tank_top']:
-                        t[c] = corr['WBT']['FacePlate']['=< 3,tank_top']
-                        ind = i
-                elif 'DC' == tag:
-                    if t[c] < corr["CHP"]["Hopper/InBot"]:
-                        t[c] = corr["CHP"]["Hopper/InBot"]
-                        ind = i
-                elif 'OIL' == tag or 'FW' == tag:
-                    if t[c] < corr["Misc"]["FO/FW/LO/VS"]:
-                        t[c] = corr["Misc"]["FO/FW/LO/VS"]
-                        ind = i
-                elif 'VOID' == tag:
-                    if t[c] < corr["Misc"]["DrySpace"]:
-                        t[c] = corr["Misc"]["DrySpace"]
-                        ind = i
-            tags.pop(ind)
-            c += 1
+            tags = tags * 2
         # No respect for the actual geometry but I 'ld rather over-engineer stiffener scantlings
-        plate_t_corr['in'] = max(t)
-        plate_t_corr['out'] = min(t)
-    elif stiff_plate.tag == 5:  # Weather Deck
-        plate_t_corr['out'] = corr["X2A"]["WeatherDeck"]
-
-        t_in = 0
-        for i in tags:
-            if "WB" == i:
-                if t_in < corr["WBT"]["FacePlate"]["=< 3,tank_top"]:
-                    t_in = corr["WBT"]["FacePlate"]["=< 3,tank_top"]
-            elif 'DC' == i:
-                if t_in < corr["CHP"]["UpperPart"]:
-                    t_in = corr["CHP"]["UpperPart"]
-            elif 'OIL' == i or 'FW' == i:
-                if t_in < corr["Misc"]["FO/FW/LO/VS"]:
-                    t_in = corr["Misc"]["FO/FW/LO/VS"]
-            elif 'VOID' == i:
-                if t_in < corr["Misc"]["DrySpace"]:
-                    t_in = corr["Misc"]["DrySpace"]
-
-        plate_t_corr['in'] = t_in
-
-    return plate_t_corr
+        t = sorted((CORROSION_ADDITIONS.get((tag, i, None), 0) for i in tags), reverse=True)
+        return {'in': t[0], 'out': t[1]}
+    return {'in': 0, 'out': 0}
 
 
 def corrosion_assign(ship: Ship, offload: bool):
     """
     Data input assumes gross thickness scantling.\n
     Input = True, offloads the corrosion addition to assign the net scantling
-    Input = False, loads the corrosion addition to assign the new gross scantling
+    Input = False, loads the corrosion addition to assign the new gross scantling\n
+    The plates of the stiffened plates and of their stiffeners are offloaded/loaded as arrays.
     """
-
-    def round_to_p5(num):
-        return math.ceil(num * 2) / 2
-
+    # skip calculation for null plates and girders
+    st_plates = [i for i in ship.stiff_plates if not i.null and i.tag != 6]
+    plates = [i.plate for i in st_plates]
+    members = [(k, plate) for k, st_pl in enumerate(st_plates) for stiff in st_pl.stiffeners for plate in stiff.plates]
     if offload:
-        for stiff_plate in ship.stiff_plates:
-            # skip calculation for null plates and girders and girders
-            if stiff_plate.null or stiff_plate.tag == 6:
-                continue
-            c_t = corrosion_addition(stiff_plate, ship.blocks, ship.Tmin, ship.Tsc)
-            stiff_plate.plate.cor_thickness = (round_to_p5(c_t['in'] + c_t['out']) + 0.5) * 1e-3
-            stiff_plate.plate.net_thickness = stiff_plate.plate.thickness - stiff_plate.plate.cor_thickness
-
-            # maybe redundant but a good sanity check
-            assert stiff_plate.plate.net_thickness > 0
-
-            for stiffener in stiff_plate.stiffeners:
-                for plate in stiffener.plates:
-                    plate.cor_thickness = (round_to_p5(c_t['out'] + c_t['in']) + 0.5) * 1e-3
-                    plate.net_thickness = plate.thickness - plate.cor_thickness
-                    if plate.net_thickness < 0:
-                        plate.net_thickness = 1e-3
+        types = space_types(ship)
+        c_t = [corrosion_addition(i, ship.blocks, ship.Tmin, ship.Tsc, types.get(i.id, [])) for i in st_plates]
+        total = np.array([i['in'] + i['out'] for i in c_t])
+        cor = (np.ceil(total * 2) / 2 + 0.5) * 1e-3  # rounded up to 0.5 mm
+        net = np.array([i.thickness for i in plates]) - cor
+        # maybe redundant but a good sanity check
+        assert np.all(net > 0)
+        owner = np.array([k for k, _ in members], dtype=int)
+        m_cor = cor[owner] if members else np.empty(0)
+        m_net = np.array([i.thickness for _, i in members]) - m_cor
+        m_net = np.where(m_net < 0, 1e-3, m_net)
+        for plate, c, t in zip(plates + [i for _, i in members], np.concatenate([cor, m_cor]),
+                               np.concatenate([net, m_net])):
+            plate.cor_thickness, plate.net_thickness = float(c), float(t)
         return
 
-    for stiff_plate in ship.stiff_plates:
-        # skip calculation for null plates and girders and girders
-        if stiff_plate.null or stiff_plate.tag == 6:
-            continue
-        if stiff_plate.plate.cor_thickness < 0:
-            Logger.error(f"(rules.py) corrosion_assign: "
-                         f"Stiffened plate {stiff_plate} has not been evaluated for corrosion addition !!!"
-                         )
-            quit()
-        stiff_plate.plate.thickness = stiff_plate.plate.net_thickness + stiff_plate.plate.cor_thickness
-        for stiffener in stiff_plate.stiffeners:
-            for plate in stiffener.plates:
-                if plate.cor_thickness < 0:
-                    Logger.error(f"(rules.py) corrosion_assign: "
-                                 f"Stiffened plate {stiff_plate} has not been evaluated for corrosion addition !!!"
-                                 )
-                    quit()
-                plate.thickness = plate.net_thickness + plate.cor_thickness
+    unevaluated = next((k for k, plate in [*enumerate(plates), *members] if plate.cor_thickness < 0), None)
+    if unevaluated is not None:
+        Logger.error(f"(rules.py) corrosion_assign: "
+                     f"Stiffened plate {st_plates[unevaluated]} has not been evaluated for corrosion addition !!!"
+                     )
+        quit()
+    everything = plates + [i for _, i in members]
+    gross = np.array([i.net_thickness for i in everything]) + np.array([i.cor_thickness for i in everything])
+    for plate, t in zip(everything, gross):
+        plate.thickness = float(t)
 
 
 def plate_pressure_assigner(blocks: list[Block], plate: StiffPlate, case: Data, load: str):
@@ -782,7 +736,7 @@ def plate_pressure_assigner(blocks: list[Block], plate: StiffPlate, case: Data,
 
     P = []
     out_P = []
-    if 'S' not in load or 'D' not in load:
+    if 'S' not in load and 'D' not in load:
         Logger.error(f"Load parameter is not of correct type. "
                      f"Expected 'S' or 'D' or 'S+D' etc. got {load}.")
     for i, block in enumerate(blocks):
@@ -797,9 +751,7 @@ def plate_pressure_assigner(blocks: list[Block], plate: StiffPlate, case: Data,
         elif len(tmp) == 1:
             P.append(tmp[0])
 
-    if len(P) == 2:
-        out_P = add_proj(P[0], P[1], [plate.plate.eta[0] for _ in P[0]])
-    elif len(P) == 1:
-        out_P = P[0]
+    if P:
+        out_P = sides_pressure(plate, P)
 
     return out_P
@@ -0,0 +1,73 @@
+import numpy as np
+
+from modules.baseclass.ship import Ship
+from modules.pipeline import THICKNESS_TOLERANCE
+from modules.rules import minimum_net_thickness
+from modules.section import SectionModel
+from modules.utils.logger import Logger
+
+# Hull girder screening of batches of designs of a fixed topology: the In50, Zn50 checks of ship_scantlings and the
+# Table 1 minimum net thicknesses, without a pressure evaluation and without a Ship per design. The section sums are
+# the vectorised per element contributions of the SectionModel, so a batch is a handful of array operations.
+
+CHUNK = 4096  # designs per pass, bounds the memory of the (designs, stiffened plates) intermediates
+
+
+class HullGirderScreen:
+    """
+    Screens the gross plate thicknesses [m] of the (not null) stiffened plates of a ship, in the order of ids;
+    the stiffeners are the ship's own. The requirements are fixed by the topology: Zrn50 through the material
+    factor kappa (Ship.evaluate_kappa) and the minimum net thicknesses through the corrosion additions.
+    """
+
+    def __init__(self, ship: Ship):
+        """
+        ship has to be offloaded of its corrosion additions, i.e. Evaluation.request('corrosion').
+        """
+        if any(i.plate.cor_thickness < 0 for i in ship.stiff_plates if not i.null and i.tag != 6):
+            Logger.warning('(screening.py) HullGirderScreen: The ship has not been evaluated for corrosion addition, '
+                           'its plates are taken as net.')
+        self.model = SectionModel(ship)
+        self.ids = self.model.ids
+        self.thickness = self.model.thickness
+        self.kappa = ship.kappa
+        self.required = self.model.required
+        l2 = min(300, ship.Lsc)
+        # girders are not evaluated by the rules
+        self.minimum = np.array([minimum_net_thickness(i, l2) if i.tag != 6 else -np.inf
+                                 for i in self.model.stiff_plates])
+
+    def __call__(self, thickness) -> dict:
+        """
+        Screens the (..., n) thicknesses and returns arrays of their leading shape:
+        {'values': {check: value}, 'margins': {check: value / requirement - 1}, 'section': passes the checks,
+         'thickness_margin': (..., n) net - minimum net thickness [m], 'minimum': passes the minimums,
+         'margin': smallest section margin, 'verdict': passes both}
+        """
+        thickness = np.asarray(thickness, dtype=float)
+        if thickness.shape[-1:] != (len(self.ids),):
+            Logger.error(f'(screening.py) HullGirderScreen: Expected (..., {len(self.ids)}) thicknesses, '
+                         f'got {thickness.shape}.')
+        shape = thickness.shape[:-1]
+        flat = thickness.reshape(-1, len(self.ids))
+        values = {key: np.empty(len(flat)) for key in self.required}
+        for start in range(0, len(flat), CHUNK):
+            chunk = flat[start:start + CHUNK]
+            q, a, m, _ = self.model.totals(chunk, np.zeros(chunk.shape, dtype=int))
+            for key, value in self.model.checks(q, a, m).items():
+                values[key][start:start + CHUNK] = value
+        values = {key: value.reshape(shape) for key, value in values.items()}
+        margins = {key: values[key] / rule - 1 for key, rule in self.required.items()}
+
+        thickness_margin = thickness - self.model.cor - self.minimum
+        section = np.logical_and.reduce([i >= 0 for i in margins.values()])
+        minimum = np.all(thickness_margin >= -THICKNESS_TOLERANCE, axis=-1)
+        return {
+            'values': values,
+            'margins': margins,
+            'section': section,
+            'thickness_margin': thickness_margin,
+            'minimum': minimum,
+            'margin': np.minimum.reduce(list(margins.values())),
+            'verdict': section & minimum,
+        }
@@ -0,0 +1,206 @@
+import math
+
+import numpy as np
+
+import modules.io.IO as IO
+from modules.baseclass.plate import _PLACE_
+from modules.baseclass.ship import Ship
+from modules.baseclass.stiffener import Stiffener
+from modules.rules import section_checks
+from modules.utils.logger import Logger
+
+# The n50 hull girder section of a ship in closed form, shared by the optimiser, the screening and the sensitivities.
+
+PLACEHOLDER_CORROSION = -1e-3  # [m], Plate.cor_thickness until corrosion_assign()
+# thickness of the stiffener plates whose corrosion addition exceeds their gross thickness, as in corrosion_assign
+MINIMUM_NET = 1e-3  # [m]
+
+
+class SectionModel:
+    """
+    The n50 section properties of a ship in closed form, vectorised over candidate designs.
+    A design gives every (not null) stiffened plate the gross thickness [m] of its plate and the catalog index of its
+    stiffeners; girders, bilges and plates without stiffeners keep their own stiffeners whatever the index. Without
+    a catalog, index 0 is every stiffened plate's own profile.
+    It reproduces Ship.update() after the corrosion offload and evaluate_beff().
+
+    Each stiffened plate adds (I_c + A_n y², A_n, A_n y) to the section sums, y being its centre of gross area,
+    so a change of a single plate is an O(1) update of the totals.
+    """
+
+    def __init__(self, ship: Ship, catalog: list[dict] = None):
+        """
+        ship has to be offloaded of its corrosion additions (Evaluation.evaluate_loads()).
+        """
+        self.catalog = catalog
+        self.stiff_plates = [i for i in ship.stiff_plates if not i.null]
+        self.ids = [i.id for i in self.stiff_plates]
+        self.factor = 2 if ship.symmetrical else 1
+        self.D = ship.D
+        self.required = {key: rule for key, (_, rule) in section_checks(ship).items()}
+        n, k = len(self.stiff_plates), len(catalog) if catalog is not None else 1
+
+        self.free = np.array([i.tag != 6 for i in self.stiff_plates])
+        self.profiled = np.array([i.tag not in (4, 6) and len(i.stiffeners) != 0 for i in self.stiff_plates])
+        self.effective = np.array([i.tag != 6 and len(i.stiffeners) != 0 for i in self.stiff_plates])
+        self.bilge = np.array([i.tag == 4 for i in self.stiff_plates])
+        self.count = np.array([len(i.stiffeners) for i in self.stiff_plates], dtype=float)
+        self.bef = np.array([min(i.spacing, i.PSM_spacing * 0.2) for i in self.stiff_plates])
+        self.length = np.array([i.plate.calc_lna()[1] for i in self.stiff_plates])
+        self.sin = np.array([math.sin(i.plate.angle) for i in self.stiff_plates])
+        self.cos = np.array([math.cos(i.plate.angle) for i in self.stiff_plates])
+        self.start_y = np.array([i.plate.start[1] for i in self.stiff_plates])
+        self.bilge_y = np.array([i.plate.calc_CoA()[1] if i.tag == 4 else 0.0 for i in self.stiff_plates])
+        self.cor = np.array([max(i.plate.cor_thickness, 0.0) if i.tag != 6 else 0.0 for i in self.stiff_plates])
+        # corrosion addition of the plates as loaded, before corrosion_assign()
+        self.placeholder = np.where(self.free, PLACEHOLDER_CORROSION, 0.0)
+        self.thickness = np.array([i.plate.thickness for i in self.stiff_plates])
+        self.roots = [np.array([j.plates[0].start[1] for j in i.stiffeners]) for i in self.stiff_plates]
+
+        # (sum of I_c n50 as loaded, A, A y, A y², A n50) of the stiffeners of each stiffened plate with each profile
+        self.stiffeners = np.zeros((n, k, 5))
+        self.Z = np.full((n, k), np.inf)
+        self.web = np.full((n, k), np.inf)  # net thickness [m]
+        self.flange = np.full((n, k), np.inf)
+        for j, st_pl in enumerate(self.stiff_plates):
+            if not self.profiled[j]:
+                self.stiffeners[j, :] = self.sums(st_pl.stiffeners, self.loaded(st_pl.stiffeners))
+                continue
+            for p in range(k):
+                stiffeners = self.stiffener_set(st_pl, self.profile(j, p))
+                self.stiffeners[j, p] = self.sums(stiffeners, self.loaded(stiffeners))
+                self.Z[j, p] = stiffeners[0].calc_Z()
+                self.web[j, p] = stiffeners[0].plates[0].net_thickness
+                if len(stiffeners[0].plates) > 1:
+                    self.flange[j, p] = stiffeners[0].plates[1].net_thickness
+        # gross area of the stiffener sets, for the lightest profile choice
+        self.profile_area = self.stiffeners[..., 1]
+
+    def profile(self, j: int, k: int) -> dict:
+        """
+        Stiffener entry of profile k on the stiffened plate j.
+        """
+        if self.catalog is not None:
+            return self.catalog[k]
+        return IO.stiff_save(self.stiff_plates[j].stiffeners[0])
+
+    @staticmethod
+    def stiffener_set(st_pl, profile: dict) -> list[Stiffener]:
+        """
+        The profile's stiffeners at the roots of the stiffened plate's own, offloaded of its corrosion addition.
+        """
+        dims = IO.stiffener_dims(profile)
+        if dims is None:
+            Logger.error(f'(section.py) SectionModel: Profile {profile} has less dims than its type needs.')
+        material = profile.get('material', st_pl.stiffeners[0].material)
+        stiffeners = []
+        for own in st_pl.stiffeners:
+            stiffener = Stiffener(profile['type'], dims, st_pl.plate.angle, own.plates[0].start, material,
+                                  _PLACE_[st_pl.tag])
+            for plate in stiffener.plates:
+                plate.cor_thickness = st_pl.plate.cor_thickness
+                plate.net_thickness = plate.thickness - plate.cor_thickness
+                if plate.net_thickness < 0:
+                    plate.net_thickness = MINIMUM_NET
+            stiffener.update()
+            stiffeners.append(stiffener)
+        return stiffeners
+
+    @staticmethod
+    def loaded(stiffeners: list[Stiffener]) -> float:
+        """
+        n50 moment of inertia of the stiffeners' plates about their centres, with the placeholder corrosion.
+        """
+        return sum(plate.calc_I_center(plate.thickness + 0.5 * PLACEHOLDER_CORROSION)[0]
+                   for stiffener in stiffeners for plate in stiffener.plates)
+
+    @staticmethod
+    def sums(stiffeners: list[Stiffener], inertia: float) -> tuple:
+        a = ay = ay2 = an = 0
+        for stiffener in stiffeners:
+            for plate in stiffener.plates:
+                a += plate.area
+                ay += plate.area * plate.CoA[1]
+                ay2 += plate.area * plate.CoA[1] ** 2
+                an += plate.n50_area
+        return inertia, a, ay, ay2, an
+
+    def plate_inertia(self, index, b, length):
+        """
+        n50 moment of inertia of the plates index about their centre, as Plate.calc_I_center.
+        """
+        sin, cos = self.sin[index], self.cos[index]
+        straight = b * length / 12 * ((b * cos) ** 2 + (length * sin) ** 2)
+        # bilges: quarter annulus around the mean radius
+        r = self.length[index] / math.pi * 2
+        ri, ro = r - b / 2, r + b / 2
+        centre = 4 * (ro ** 3 - ri ** 3) / (3 * math.pi * (ro ** 2 - ri ** 2))
+        annulus = math.pi / 16 * (ro ** 4 - ri ** 4) - math.pi / 4 * (ro ** 2 - ri ** 2) * centre ** 2
+        return np.where(self.bilge[index], annulus, straight)
+
+    def centre(self, index, length):
+        return np.where(self.bilge[index], self.bilge_y[index], self.start_y[index] + length / 2 * self.sin[index])
+
+    def parts(self, index, thickness, profile):
+        """
+        Sums over the elements of the stiffened plates index, with plate thickness [m] and catalog profile (arrays of
+        a common shape): (A, A y, A_n) as evaluated and (I_c, A, A y, A y²) as loaded, A being the gross areas.
+        """
+        index, profile = np.asarray(index), np.asarray(profile)
+        t = np.asarray(thickness, dtype=float)
+        s = self.stiffeners[index, profile]
+        c = self.cor[index]
+        bef = np.where(t - c < 8 * 1e-3, np.minimum(0.6, self.bef[index]), self.bef[index])
+        length = np.where(self.effective[index], self.count[index] * bef, self.length[index])
+        a, ay = length * t + s[..., 1], length * t * self.centre(index, length) + s[..., 2]
+        an = length * (t - 0.5 * c) + s[..., 4]
+
+        # Ship.Calculate_I takes the stiffened plate's own inertia as StiffPlate.__init__ left it: about the centre
+        # of gross area of the full length plate, with the placeholder corrosion of the loaded plates
+        full = self.length[index]
+        y0 = self.centre(index, full)
+        ic0 = self.plate_inertia(index, t + 0.5 * self.placeholder[index], full) + s[..., 0]
+        return a, ay, an, ic0, full * t + s[..., 1], full * t * y0 + s[..., 2], full * t * y0 ** 2 + s[..., 3]
+
+    def terms(self, index, thickness, profile):
+        """
+        Section sums (I_c + A_n y², A_n, A_n y) and gross steel area of the stiffened plates index, with plate
+        thickness [m] and catalog profile; the three arguments are arrays of a common shape.
+        """
+        a, ay, an, ic0, a0, ay0, ay20 = self.parts(index, thickness, profile)
+        cy = ay / a
+        return ic0 + ay20 - ay0 ** 2 / a0 + an * cy ** 2, an, an * cy, a0
+
+    def totals(self, thickness, profile):
+        """
+        Section sums of whole designs, thickness and profile are (..., n) arrays.
+        """
+        index = np.broadcast_to(np.arange(len(self.ids)), np.shape(thickness))
+        return tuple(i.sum(axis=-1) for i in self.terms(index, thickness, profile))
+
+    def section(self, q, a, m):
+        """
+        (yo, n50_Ixx) of the section sums.
+        """
+        yo = m / a
+        return yo, self.factor * (q - m * yo)
+
+    def checks(self, q, a, m) -> dict:
+        """
+        The ship's values of the section_checks().
+        """
+        yo, ixx = self.section(q, a, m)
+        return {'In50': ixx, 'Zn50,keel': ixx / yo, 'Zn50,Depth': ixx / np.abs(yo - self.D)}
+
+    def margin(self, q, a, m):
+        """
+        The smallest relative margin over the section checks, value / requirement - 1.
+        """
+        checks = self.checks(q, a, m)
+        return np.minimum.reduce([checks[key] / rule for key, rule in self.required.items()]) - 1
+
+    def area(self, w):
+        """
+        Cross-section steel area [m²] of the gross area sum.
+        """
+        return self.factor * w
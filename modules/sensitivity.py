@@ -0,0 +1,164 @@
+import math
+
+import numpy as np
+
+from modules.baseclass.ship import Ship
+from modules.section import PLACEHOLDER_CORROSION, SectionModel
+from modules.utils.logger import Logger
+
+# Closed form gradients of the hull girder n50 properties that ship_scantlings checks, with respect to the design
+# variables of every (not null) stiffened plate: the thickness of its plate, which moves the gross and the net
+# thickness alike at a given corrosion addition, and the dimensions of its stiffeners [m]. They are the derivatives
+# of the SectionModel, i.e. of the section the rules see for the design, and ignore the steps of the effective
+# breadth at 8 mm net thickness.
+
+VARIABLES = ('t', 'lw', 'bw', 'lf', 'bf')
+PROPERTIES = ('yo', 'n50_Ixx', 'Zn50,keel', 'Zn50,Depth')
+# derivatives of the sums of SectionModel.parts()
+_A, _AY, _AN, _IC0, _A0, _AY0, _AY20 = range(7)
+
+
+def plate_inertia_partials(b, length, sin, cos):
+    """
+    (d/db, d/dl) of the centre inertia b l / 12 ((b cos)² + (l sin)²) of a straight plate.
+    """
+    bc, ls = (b * cos) ** 2, (length * sin) ** 2
+    return length / 12 * (3 * bc + ls), b / 12 * (bc + 3 * ls)
+
+
+def bilge_inertia_partial(b, r):
+    """
+    d/db of the centre inertia of a quarter annulus of mean radius r, as Plate.calc_I_center.
+    """
+    # I = pi r³ b / 4 + pi r b³ / 16 - 2 r³ b / pi (1 + u)², u = b² / (12 r²)
+    u = b ** 2 / (12 * r ** 2)
+    return math.pi * r ** 3 / 4 + 3 * math.pi * r * b ** 2 / 16 - 2 * r ** 3 / math.pi * (1 + u) * (1 + 5 * u)
+
+
+def stiffener_elements(model: SectionModel, profile) -> dict:
+    """
+    Flattened web and flange plates of every stiffener of the profiled stiffened plates: their stiffened plate row,
+    the variables of their length and thickness, length, thickness, angle, centre y and its derivatives by lw, lf.
+    """
+    rows, lengths, thicknesses, sins, coss, ys, dy_lw, dy_lf, var_l, var_t = ([] for _ in range(10))
+    for j in np.flatnonzero(model.profiled):
+        entry = model.profile(j, profile[j])
+        dims = [i * 1e-3 for i in entry['dimensions']]
+        kind = entry['type']
+        sin, cos = model.sin[j], model.cos[j]
+        # the web is normal to the plate: angle + pi / 2
+        web_sin, web_cos = cos, -sin
+        for root in model.roots[j]:
+            rows.append(j), var_l.append(1), var_t.append(2)
+            lengths.append(dims[0]), thicknesses.append(dims[1]), sins.append(web_sin), coss.append(web_cos)
+            ys.append(root + dims[0] / 2 * web_sin), dy_lw.append(web_sin / 2), dy_lf.append(0.0)
+            if kind in ('tb', 'g'):
+                # a T bar's flange is centred on the web's end, an angle bar's starts there
+                offset = dims[2] / 2 * sin if kind == 'g' else 0.0
+                rows.append(j), var_l.append(3), var_t.append(4)
+                lengths.append(dims[2]), thicknesses.append(dims[3]), sins.append(sin), coss.append(cos)
+                ys.append(root + dims[0] * web_sin + offset), dy_lw.append(web_sin)
+                dy_lf.append(sin / 2 if kind == 'g' else 0.0)
+    return {key: np.array(value, dtype=float if key not in ('rows', 'var_l', 'var_t') else int) for key, value in
+            zip(('rows', 'length', 'thickness', 'sin', 'cos', 'y', 'dy_lw', 'dy_lf', 'var_l', 'var_t'),
+                (rows, lengths, thicknesses, sins, coss, ys, dy_lw, dy_lf, var_l, var_t))}
+
+
+def part_gradients(model: SectionModel, thickness, profile) -> np.ndarray:
+    """
+    (n, variables, parts) derivatives of the SectionModel.parts() of every stiffened plate.
+    """
+    n = len(model.ids)
+    rows = np.arange(n)
+    d = np.zeros((n, len(VARIABLES), 7))
+
+    # the plate
+    c = model.cor
+    bef = np.where(thickness - c < 8 * 1e-3, np.minimum(0.6, model.bef), model.bef)
+    length = np.where(model.effective, model.count * bef, model.length)
+    full = model.length
+    y, y0 = model.centre(rows, length), model.centre(rows, full)
+    b0 = thickness + 0.5 * model.placeholder
+    straight = plate_inertia_partials(b0, full, model.sin, model.cos)[0]
+    d[:, 0, _IC0] = np.where(model.bilge, bilge_inertia_partial(b0, full / math.pi * 2), straight)
+    d[:, 0, _A], d[:, 0, _AY], d[:, 0, _AN] = length, length * y, length
+    d[:, 0, _A0], d[:, 0, _AY0], d[:, 0, _AY20] = full, full * y0, full * y0 ** 2
+
+    # the stiffeners, every element adds to the derivatives by its own length and thickness, and by lw, lf through y
+    e = stiffener_elements(model, profile)
+    if len(e['rows']) == 0:
+        return d
+    l, t, y = e['length'], e['thickness'], e['y']
+    ce = model.cor[e['rows']]
+    di_db, di_dl = plate_inertia_partials(t + 0.5 * PLACEHOLDER_CORROSION, l, e['sin'], e['cos'])
+    by_length = np.stack([t, t * y, t - 0.5 * ce, di_dl, t, t * y, t * y ** 2], axis=-1)
+    by_thickness = np.stack([l, l * y, l, di_db, l, l * y, l * y ** 2], axis=-1)
+    zero = np.zeros_like(l)
+    by_y = np.stack([zero, l * t, zero, zero, zero, l * t, 2 * l * t * y], axis=-1)
+    np.add.at(d, (e['rows'], e['var_l']), by_length)
+    np.add.at(d, (e['rows'], e['var_t']), by_thickness)
+    np.add.at(d, (e['rows'], 1), by_y * e['dy_lw'][:, None])
+    np.add.at(d, (e['rows'], 3), by_y * e['dy_lf'][:, None])
+    return d
+
+
+def gradients(model: SectionModel, thickness=None, profile=None) -> dict:
+    """
+    Values and gradients of the section properties of a design of the model (the model's own by default):
+    {'ids', 'variables', 'values': {property: value}, 'gradients': {property: (n, variables) array}}.
+    Variables a stiffened plate does not have (stiffeners of girders and bilges, flanges of flat bars) are nan.
+    """
+    n = len(model.ids)
+    rows = np.arange(n)
+    thickness = model.thickness if thickness is None else np.asarray(thickness, dtype=float)
+    profile = np.zeros(n, dtype=int) if profile is None else np.asarray(profile)
+
+    a, ay, an, ic0, a0, ay0, ay20 = model.parts(rows, thickness, profile)
+    cy, c0 = ay / a, ay0 / a0
+    d = part_gradients(model, thickness, profile)
+    # chain rule through SectionModel.terms(), per stiffened plate and variable
+    a, cy, c0, an = a[:, None], cy[:, None], c0[:, None], an[:, None]
+    dcy = (d[..., _AY] - cy * d[..., _A]) / a
+    di0 = d[..., _IC0] + d[..., _AY20] - 2 * c0 * d[..., _AY0] + c0 ** 2 * d[..., _A0]
+    dq = di0 + d[..., _AN] * cy ** 2 + 2 * an * cy * dcy
+    da = d[..., _AN]
+    dm = d[..., _AN] * cy + an * dcy
+
+    # and through SectionModel.section()
+    q, aa, m, _ = model.totals(thickness, profile)
+    yo, ixx = model.section(q, aa, m)
+    depth = yo - model.D
+    dyo = (dm - yo * da) / aa
+    dixx = model.factor * (dq - 2 * yo * dm + yo ** 2 * da)
+    grads = {
+        'yo': dyo,
+        'n50_Ixx': dixx,
+        'Zn50,keel': dixx / yo - ixx * dyo / yo ** 2,
+        'Zn50,Depth': dixx / abs(depth) - ixx * np.sign(depth) * dyo / depth ** 2,
+    }
+    values = {'yo': yo, 'n50_Ixx': ixx, 'Zn50,keel': ixx / yo, 'Zn50,Depth': ixx / abs(depth)}
+
+    missing = np.zeros((n, len(VARIABLES)), dtype=bool)
+    missing[~model.profiled, 1:] = True
+    for j in np.flatnonzero(model.profiled):
+        if model.profile(j, profile[j])['type'] not in ('tb', 'g'):
+            missing[j, 3:] = True
+    for key in grads:
+        grads[key] = np.where(missing, np.nan, grads[key])
+    return {
+        'ids': model.ids,
+        'variables': VARIABLES,
+        'values': {key: float(values[key]) for key in PROPERTIES},
+        'gradients': grads,
+    }
+
+
+def section_gradients(ship: Ship) -> dict:
+    """
+    gradients() of the ship's own design. The ship has to be offloaded of its corrosion additions
+    (Evaluation.evaluate_loads()), its plates' thicknesses are taken as given.
+    """
+    if any(i.plate.cor_thickness < 0 for i in ship.stiff_plates if not i.null and i.tag != 6):
+        Logger.warning('(sensitivity.py) section_gradients: The ship has not been evaluated for corrosion addition, '
+                       'its plates are taken as net.')
+    return gradients(SectionModel(ship))
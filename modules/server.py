@@ -0,0 +1,292 @@
+import asyncio
+import copy
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+import modules.io.IO as IO
+from modules.pipeline import Evaluation, RECIPES
+from modules.utils.logger import Logger
+
+# A local HTTP/1.1 front end to the CSR pipeline. Requests are answered from an LRU cache of finished
+# results; misses go through a bounded job queue to a pool of worker processes, each of which keeps the
+# recently loaded ships with their evaluated load cases (Data) warm in its own LRU cache.
+#
+#   POST /evaluate   {"envelope": {...}, "recipes": {...}} or the bare envelope -> verdicts, plates, section
+#   GET  /health     -> {"status": "ok"}
+#   GET  /stats      -> cache and queue counters
+
+MAX_BODY = 64 * 2 ** 20  # bytes
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 413: 'Payload Too Large',
+           422: 'Unprocessable Entity', 503: 'Service Unavailable'}
+
+
+class LRUCache:
+    def __init__(self, size: int):
+        self.size = size
+        self.data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        try:
+            self.data.move_to_end(key)
+        except KeyError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self.data[key]
+
+    def put(self, key, value):
+        self.data[key] = value
+        self.data.move_to_end(key)
+        while len(self.data) > self.size:
+            self.data.popitem(last=False)
+
+    def __len__(self):
+        return len(self.data)
+
+    def stats(self) -> dict:
+        return {'size': len(self.data), 'capacity': self.size, 'hits': self.hits, 'misses': self.misses}
+
+
+def digest(obj) -> str:
+    return hashlib.sha256(json.dumps(obj, sort_keys=True, separators=(',', ':')).encode()).hexdigest()
+
+
+# ----------------------------------------------- worker processes -----------------------------------------------
+# ships loaded and evaluated for their load cases, by envelope digest
+_WARM: LRUCache | None = None
+
+
+def _init_worker(warm_size: int, quiet: bool):
+    global _WARM
+    _WARM = LRUCache(warm_size)
+    if quiet:
+        Logger.OUT = open(os.devnull, 'w')
+        Logger.LEVEL = Logger.LOG_LEVELS['ERROR']
+
+
+def evaluate_envelope(envelope_key: str, envelope: dict, recipes: dict | None) -> tuple[int, dict]:
+    """
+    Runs in a worker process. The loads only depend on the envelope, so the ship with its load cases is
+    kept warm and every request evaluates the scantlings of a copy of it. Returns (HTTP status, payload).
+    """
+    warm = _WARM.get(envelope_key) if _WARM is not None else None
+    try:
+        if warm is None:
+            ship = IO.parse_ship(envelope)
+            if ship is None:
+                return 422, {'error': 'The envelope could not be loaded'}
+            warm = Evaluation(ship=ship).load().evaluate_loads()
+            if _WARM is not None:
+                _WARM.put(envelope_key, warm)
+        evaluation = copy.deepcopy(warm)
+        if recipes is not None:
+            evaluation.recipes = recipes
+        results = evaluation.evaluate_scantlings().results()
+    except (Exception, SystemExit) as e:
+        # the rules quit() on invalid designs, the worker has to survive that
+        return 422, {'error': f'{type(e).__name__}: {e}'}
+    return 200, results
+
+
+# ---------------------------------------------------- server ----------------------------------------------------
+class EvaluationServer:
+    """
+    asyncio server that answers evaluation requests. At most queue_size jobs wait for the workers, further
+    requests are turned away with 503 until the queue drains. Identical requests in flight share one job.
+    """
+
+    def __init__(self, workers: int = None, cache_size: int = 128, queue_size: int = 32, warm_size: int = 8,
+                 quiet: bool = True):
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.cache = LRUCache(cache_size)
+        self.queue_size = max(1, queue_size)
+        self.warm_size = warm_size
+        self.quiet = quiet
+        self.queue: asyncio.Queue | None = None
+        self.pending: dict[str, asyncio.Future] = {}
+        self.pool: ProcessPoolExecutor | None = None
+        self.server: asyncio.Server | None = None
+        self.consumers: list[asyncio.Task] = []
+        self.connections: set[asyncio.StreamWriter] = set()
+        self.running = 0
+        self.rejected = 0
+        self.served = 0
+
+    async def start(self, host: str = '127.0.0.1', port: int = 8050, path: str = None):
+        """
+        Listens on host:port, or on the Unix socket at path when given.
+        """
+        # spawn keeps the workers free of the parent's event loop and threads
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=get_context('spawn'),
+                                        initializer=_init_worker, initargs=(self.warm_size, self.quiet))
+        self.queue = asyncio.Queue(maxsize=self.queue_size)
+        self.consumers = [asyncio.create_task(self.consume()) for _ in range(self.workers)]
+        if path is not None:
+            self.server = await asyncio.start_unix_server(self.handle, path=path)
+        else:
+            self.server = await asyncio.start_server(self.handle, host, port)
+        return self
+
+    @property
+    def address(self):
+        return self.server.sockets[0].getsockname()
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            # idle keep-alive connections would hold wait_closed() forever
+            for writer in list(self.connections):
+                writer.close()
+            await self.server.wait_closed()
+        for task in self.consumers:
+            task.cancel()
+        await asyncio.gather(*self.consumers, return_exceptions=True)
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+
+    async def serve_forever(self):
+        async with self.server:
+            await self.server.serve_forever()
+
+    # ------------------------------------------------- jobs -------------------------------------------------
+    async def consume(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            key, envelope_key, envelope, recipes, future = await self.queue.get()
+            self.running += 1
+            try:
+                status, payload = await loop.run_in_executor(self.pool, evaluate_envelope, envelope_key, envelope,
+                                                             recipes)
+                body = json.dumps(payload).encode()
+                if status == 200:
+                    self.cache.put(key, body)
+                future.set_result((status, body))
+            except Exception as e:
+                future.set_result((422, json.dumps({'error': f'{type(e).__name__}: {e}'}).encode()))
+            finally:
+                self.running -= 1
+                self.pending.pop(key, None)
+                self.queue.task_done()
+
+    async def evaluate(self, request: dict) -> tuple[int, bytes, bool]:
+        """
+        Returns (HTTP status, JSON body, whether it came from the cache).
+        """
+        envelope = request.get('envelope', request)
+        recipes = request.get('recipes') if 'envelope' in request else None
+        if not isinstance(envelope, dict) or (recipes is not None and not isinstance(recipes, dict)):
+            message = {'error': 'Expected an envelope object and optionally a recipes object'}
+            return 400, json.dumps(message).encode(), False
+        envelope_key = digest(envelope)
+        key = digest([envelope_key, recipes if recipes is not None else RECIPES])
+
+        body = self.cache.get(key)
+        if body is not None:
+            return 200, body, True
+        future = self.pending.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            try:
+                self.queue.put_nowait((key, envelope_key, envelope, recipes, future))
+            except asyncio.QueueFull:
+                self.rejected += 1
+                return 503, json.dumps({'error': 'The evaluation queue is full, retry later'}).encode(), False
+            self.pending[key] = future
+        status, body = await asyncio.shield(future)
+        return status, body, False
+
+    def stats(self) -> dict:
+        return {
+            'cache': self.cache.stats(),
+            'queued': self.queue.qsize() if self.queue is not None else 0,
+            'queue_size': self.queue_size,
+            'running': self.running,
+            'workers': self.workers,
+            'rejected': self.rejected,
+            'served': self.served,
+        }
+
+    # ------------------------------------------------- HTTP -------------------------------------------------
+    async def route(self, method: str, path: str, body: bytes) -> tuple[int, bytes, dict]:
+        if path == '/health':
+            return 200, b'{"status": "ok"}', {}
+        if path == '/stats':
+            return 200, json.dumps(self.stats()).encode(), {}
+        if path != '/evaluate':
+            return 404, b'{"error": "Unknown path"}', {}
+        if method != 'POST':
+            return 405, b'{"error": "Use POST"}', {}
+        try:
+            request = json.loads(body)
+        except ValueError as e:
+            return 400, json.dumps({'error': f'Invalid JSON: {e}'}).encode(), {}
+        if not isinstance(request, dict):
+            return 400, b'{"error": "Expected a JSON object"}', {}
+        status, payload, cached = await self.evaluate(request)
+        return status, payload, {'X-CSR-Cache': 'hit' if cached else 'miss'}
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        Serves the requests of a (keep-alive) connection one after the other.
+        """
+        self.connections.add(writer)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    method, path, version = line.decode('latin-1').split()
+                except ValueError:
+                    await self.respond(writer, 400, b'{"error": "Malformed request line"}', close=True)
+                    break
+                headers = {}
+                while (header := await reader.readline()) not in (b'\r\n', b'\n', b''):
+                    name, _, value = header.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                length = headers.get('content-length', '') or '0'
+                if not length.isdecimal():
+                    # negative or not a number
+                    await self.respond(writer, 400, b'{"error": "Invalid Content-Length"}', close=True)
+                    break
+                length = int(length)
+                if length > MAX_BODY:
+                    await self.respond(writer, 413, b'{"error": "Request body too large"}', close=True)
+                    break
+                body = await reader.readexactly(length) if length else b''
+                close = headers.get('connection', '').lower() == 'close' or version == 'HTTP/1.0'
+
+                status, payload, extra = await self.route(method, path.split('?')[0], body)
+                self.served += 1
+                await self.respond(writer, status, payload, close=close, headers=extra)
+                if close:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.connections.discard(writer)
+            writer.close()
+
+    @staticmethod
+    async def respond(writer, status: int, body: bytes, close=False, headers: dict = None):
+        head = [f'HTTP/1.1 {status} {REASONS[status]}', 'Content-Type: application/json',
+                f'Content-Length: {len(body)}', f"Connection: {'close' if close else 'keep-alive'}"]
+        head += [f'{k}: {v}' for k, v in (headers or {}).items()]
+        writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1') + body)
+        await writer.drain()
+
+
+async def serve(host='127.0.0.1', port=8050, path=None, **kwargs):
+    server = await EvaluationServer(**kwargs).start(host, port, path)
+    where = path if path is not None else '{}:{}'.format(*server.address[:2])
+    Logger.success(f'CSR evaluation server listening on {where} with {server.workers} worker(s)')
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
@@ -0,0 +1,190 @@
+import math
+from collections import Counter, defaultdict
+
+from modules.baseclass.block import Block
+from modules.baseclass.stiff_plate import StiffPlate
+
+# Connectivity of the blocks' boundaries. The end points of the plates are hashed on a TOLERANCE grid into the nodes
+# of a graph whose edges are the plates, and every block's plates are chained through their shared nodes, in the
+# direction that has the block on the right-hand side (clockwise), so Block.eta points into the block. A plate may
+# end on the face of another (a T-junction, i.e. a girder standing on the inner bottom): the boundary then steps
+# along that face to the nearest free end of the block's plates. Any other step is a gap.
+
+TOLERANCE = 1e-3  # m, end points closer than this are the same node
+FACE_CELL = 1.0  # m, cell size of the hash of the plates' faces
+
+
+def _cell(point, size: float) -> tuple[int, int]:
+    return math.floor(point[0] / size), math.floor(point[1] / size)
+
+
+class Topology:
+    """
+    Connectivity graph of the stiffened plates: nodes hashes the end points, ends holds the (start, end) nodes
+    of every plate and faces the plates crossing each FACE_CELL cell, so that the point queries are local.
+    """
+
+    def __init__(self, stiff_plates: list[StiffPlate]):
+        self.plates = {i.id: i for i in stiff_plates}
+        self.points = []  # node -> point
+        self.nodes = defaultdict(list)  # TOLERANCE cell -> nodes
+        self.ends = {}
+        self.faces = defaultdict(list)
+        for st_pl in stiff_plates:
+            plate = st_pl.plate
+            self.ends[st_pl.id] = (self.node(plate.start), self.node(plate.end))
+            x0, y0 = _cell((min(plate.start[0], plate.end[0]), min(plate.start[1], plate.end[1])), FACE_CELL)
+            x1, y1 = _cell((max(plate.start[0], plate.end[0]), max(plate.start[1], plate.end[1])), FACE_CELL)
+            for i in range(x0 - 1, x1 + 2):
+                for j in range(y0 - 1, y1 + 2):
+                    self.faces[(i, j)].append(st_pl.id)
+
+    def node(self, point) -> int:
+        """
+        The node of the point, a new one unless a node lies within TOLERANCE.
+        """
+        cx, cy = _cell(point, TOLERANCE)
+        for i in range(cx - 1, cx + 2):
+            for j in range(cy - 1, cy + 2):
+                for n in self.nodes[(i, j)]:
+                    if math.dist(self.points[n], point) <= TOLERANCE:
+                        return n
+        self.points.append(tuple(point))
+        self.nodes[(cx, cy)].append(len(self.points) - 1)
+        return len(self.points) - 1
+
+    def on_plate(self, point, _id: int) -> bool:
+        plate = self.plates[_id].plate
+        if plate.tag == 4:
+            cx, cy, r, start, end = plate.arc_params()
+            theta = plate.arc_angle(point)
+            return abs(math.dist((cx, cy), point) - r) <= TOLERANCE and \
+                start - TOLERANCE / r <= theta <= end + TOLERANCE / r
+        (x0, y0), (x1, y1) = plate.start, plate.end
+        dx, dy = x1 - x0, y1 - y0
+        t = min(1.0, max(0.0, ((point[0] - x0) * dx + (point[1] - y0) * dy) / (dx ** 2 + dy ** 2)))
+        return math.dist((x0 + t * dx, y0 + t * dy), point) <= TOLERANCE
+
+    def face(self, a, b) -> int | None:
+        """
+        A plate both points lie on, i.e. the face a boundary steps along at a T-junction, None for a gap.
+        """
+        for _id in self.faces[_cell(a, FACE_CELL)]:
+            if self.on_plate(a, _id) and self.on_plate(b, _id):
+                return _id
+        return None
+
+    def order(self, block: Block, problems: list[str]) -> list[int] | None:
+        """
+        The signed plate ids of the block, chained and oriented clockwise; the problems are appended to problems.
+        Symmetrical blocks are half sections, whose boundary starts and ends on the centreline (x = 0).
+        SEA and ATM are open: the sea's boundary starts from the keel on the centreline and the atmosphere's ends
+        there.
+        """
+        name = f'Block {block.name}'
+        missing = [i for i in block.list_plates_id if abs(i) not in self.plates]
+        repeated = {i for i, n in Counter(abs(j) for j in block.list_plates_id).items() if n > 1}
+        if missing:
+            problems.append(f'{name}: plates {missing} do not exist.')
+        if repeated:
+            problems.append(f'{name}: plates {sorted(repeated)} are listed more than once.')
+        if missing or repeated or not block.list_plates_id:
+            return None
+
+        # the listed direction is kept where the geometry does not decide it
+        remaining = {abs(i): i >= 0 for i in block.list_plates_id}
+        at = defaultdict(list)
+        for _id in remaining:
+            for n in self.ends[_id]:
+                at[n].append(_id)
+        for n, ids in at.items():
+            if len(ids) > 2:
+                problems.append(f'{name}: plates {ids} overlap, they meet at {self.points[n]}.')
+                return None
+
+        free = [(_id, k) for _id in remaining for k in (0, 1) if len(at[self.ends[_id][k]]) == 1]
+        centreline = [(_id, k) for _id, k in free if abs(self.points[self.ends[_id][k]][0]) <= TOLERANCE]
+        open_ = block.symmetrical or block.space_type in ('SEA', 'ATM')
+        if open_ and not centreline:
+            problems.append(f'{name}: the boundary has no end on the centreline.')
+            return None
+        if open_:
+            first, k = centreline[0]
+        else:
+            first = next(iter(remaining))
+            k = 0 if remaining[first] else 1
+
+        chain = []
+        _id, node = first, self.ends[first][k]
+        while True:
+            forward = self.ends[_id][0] == node
+            chain.append(_id if forward else -_id)
+            del remaining[_id]
+            node = self.ends[_id][1 if forward else 0]
+            if not remaining:
+                break
+            following = [i for i in at[node] if i in remaining]
+            if following:
+                _id = following[0]
+                continue
+            # the nearest free end, along a face
+            _id, k = min(((i, k) for i in remaining for k in (0, 1)),
+                         key=lambda e: math.dist(self.points[node], self.points[self.ends[e[0]][e[1]]]))
+            target = self.ends[_id][k]
+            if self.face(self.points[node], self.points[target]) is None:
+                problems.append(f'{name}: there is a gap of {math.dist(self.points[node], self.points[target]):.3f} m'
+                                f' between {self.points[node]} and {self.points[target]}.')
+            node = target
+
+        start = self.ends[abs(chain[0])][0 if chain[0] > 0 else 1]
+        if block.space_type == 'SEA':
+            # from the keel, the sea on the right
+            return chain
+        if block.space_type != 'ATM' and block.symmetrical and abs(self.points[node][0]) > TOLERANCE:
+            problems.append(f'{name}: the boundary ends off the centreline, at {self.points[node]}.')
+            return None
+        if not open_ and node != start and self.face(self.points[node], self.points[start]) is None:
+            problems.append(f'{name}: the boundary is not closed, it ends '
+                            f'{math.dist(self.points[node], self.points[start]):.3f} m off its start.')
+            return None
+        area = self.area(chain)
+        if block.space_type != 'ATM' and abs(area) < TOLERANCE:
+            # i.e. a boundary that steps back along its only plate
+            problems.append(f'{name}: the boundary is not closed, it encloses no area.')
+            return None
+        if block.space_type == 'ATM' or area > 0:
+            # counter-clockwise, or the atmosphere from the centreline
+            chain = [-i for i in reversed(chain)]
+        return chain
+
+    def area(self, chain: list[int]) -> float:
+        """
+        Signed (shoelace) area of the closed boundary, through its bilges' midpoints; positive counter-clockwise.
+        """
+        points = []
+        for i in chain:
+            plate = self.plates[abs(i)].plate
+            start, end = (plate.start, plate.end) if i > 0 else (plate.end, plate.start)
+            points.append(start)
+            if plate.tag == 4:
+                points.append(plate.arc_point((plate.arc_angle(start) + plate.arc_angle(end)) / 2))
+            points.append(end)
+        return sum(a[0] * b[1] - b[0] * a[1] for a, b in zip(points, points[1:] + points[:1])) / 2
+
+    def validate(self, blocks: list[Block]) -> list[str]:
+        """
+        Orders and orients the boundaries of the blocks in place and returns all the problems found: plates that
+        do not exist, are listed twice, overlap or bound more than two blocks, gaps and unclosed boundaries.
+        """
+        problems = []
+        bounded = defaultdict(list)
+        for block in blocks:
+            chain = self.order(block, problems)
+            if chain is not None:
+                block.list_plates_id = chain
+            for i in {abs(j) for j in block.list_plates_id}:
+                bounded[i].append(block.name)
+        for _id, names in bounded.items():
+            if len(names) > 2:
+                problems.append(f'Plate {_id} bounds {len(names)} blocks ({", ".join(names)}), 2 at most are allowed.')
+        return problems
@@ -12,6 +12,7 @@ LOADS = {
     'OIL': {'rho': 0.8, 'hair': 0.0},
     'FW': {'rho': RHO_F, 'hair': 0.0},
     'VOID': {'rho': 0.0, 'hair': 0.0}}
+PRESSURE_GRID_SPACING = 1.0  # m, arc length between the pressure points of the plates' meshes
 STATIC = {
     'Liquids': ['S-NOS', 'S-HSWO'],
     'Dry': 'STATIC',
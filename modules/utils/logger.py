@@ -1,4 +1,4 @@
-import inspect
+import contextlib
 import os
 import sys
 from datetime import datetime
@@ -65,14 +65,34 @@ class Logger:
         if die:
             raise RuntimeError(*args)
 
+    # the logging call's frame is 3 levels up: get_parent/get_file <- get_prefix <- success/info/... <- caller
+    # sys._getframe skips the source lookups of inspect.stack(), which cost milliseconds per message
+
     @staticmethod
     def get_parent() -> str:
-        return inspect.stack()[3][3]
+        return sys._getframe(3).f_code.co_name
 
     @staticmethod
     def get_file() -> str:
-        return inspect.stack()[3][1].split(os.sep)[-1]
+        return sys._getframe(3).f_code.co_filename.split(os.sep)[-1]
 
     @staticmethod
     def get_prefix(colour: LogLevelColours, name) -> str:
         return f"{colour}{datetime.now().strftime('%H:%M:%S')}|{name}|{Logger.get_file()}|{Logger.get_parent()} :"
+
+
+@contextlib.contextmanager
+def silenced(quiet=True):
+    """
+    Sends the Logger output to devnull, the rules report every plate of every load case.
+    """
+    if not quiet:
+        yield
+        return
+    out = Logger.OUT
+    with open(os.devnull, 'w') as devnull:
+        Logger.OUT = devnull
+        try:
+            yield
+        finally:
+            Logger.OUT = out
@@ -2,7 +2,6 @@ import math
 from typing import Iterable
 
 import numpy as np
-from matplotlib import pyplot as plt
 
 from modules.utils.logger import Logger
 
@@ -43,6 +42,24 @@ def linear_inter(start, end, target_x) -> float:
     return (end[1] - start[1]) / (end[0] - start[0]) * (target_x - start[0])
 
 
+def polyline_projection(points: list, point) -> tuple[int, float]:
+    """
+    Projects the point on the polyline of the (x, y, ...) points: the index i of the nearest segment
+    (points[i], points[i + 1]) and the position t in [0, 1] of the projection along it.
+    """
+    min_r = math.inf
+    index, position = 0, 0.0
+    for i, (a, b) in enumerate(zip(points[:-1], points[1:])):
+        dx, dy = b[0] - a[0], b[1] - a[1]
+        length = dx ** 2 + dy ** 2
+        t = ((point[0] - a[0]) * dx + (point[1] - a[1]) * dy) / length if length > 0 else 0.0
+        t = min(1.0, max(0.0, t))
+        radius = math.hypot(a[0] + t * dx - point[0], a[1] + t * dy - point[1])
+        if radius < min_r:
+            min_r, index, position = radius, i, t
+    return index, position
+
+
 def lin_int_dict(vli_dict: dict, key: float, *f_args, suppress=False) -> float:
     """
     Parses a dictionary of values and linear interpolates at key value accordingly
@@ -142,6 +159,8 @@ def normals_2d_np(geom: np.array, flip_n=False, show_norms=False):
 
     # Debug only for standalone call
     if show_norms:
+        from matplotlib import pyplot as plt
+
         fig, ax = plt.subplots()
         ax.plot(geom[0:-2, 0], geom[0:-2, 1])
         ax.quiver(geom[0:-2, 0], geom[0:-2, 1], eta[:, 0], eta[:, 1])
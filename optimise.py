@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+import argparse
+import json
+
+import modules.io.IO as IO
+from modules.optimiser import Optimiser
+from modules.utils.logger import silenced
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Steel weight optimiser of the ordinary section.')
+    parser.add_argument('envelope', help='ship envelope (JSON)')
+    parser.add_argument('catalog', help='stiffener profiles (JSON list of {"type", "dimensions", "material"})')
+    parser.add_argument('--out', default='out/optimised.json', help='envelope of the lightest adequate design')
+    parser.add_argument('--report', default=None, help='write the Pareto set of steel area and margin here')
+    parser.add_argument('--target', type=float, default=0.0, help='section margin the design has to keep')
+    parser.add_argument('--max-margin', type=float, default=0.5, help='margin at which the search stops')
+    parser.add_argument('--steps', type=int, default=500, help='greedy steps per search')
+    args = parser.parse_args()
+
+    with open(args.envelope) as file:
+        envelope = json.load(file)
+    with open(args.catalog) as file:
+        catalog = json.load(file)
+    optimiser = Optimiser(envelope, catalog, target=args.target, max_margin=args.max_margin, max_steps=args.steps)
+    report = optimiser.run()
+    with silenced():
+        IO.ship_save(IO.parse_ship(optimiser.envelope_of(*optimiser.design)), args.out)
+    if args.report is not None:
+        with open(args.report, 'w') as file:
+            json.dump(report, file, indent=1)
+    print(json.dumps({key: report[key] for key in ('verified', 'violations', 'candidates', 'rule_runs', 'seconds',
+                                                   'candidates_per_minute')}, indent=1))
+    print(json.dumps({key: report['best'][key] for key in ('area', 'margin', 'checks')}, indent=1))
+
+
+if __name__ == "__main__":
+    main()
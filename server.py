@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+import argparse
+import asyncio
+
+from modules.server import serve
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local CSR evaluation server.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8050)
+    parser.add_argument('--unix', default=None, help='listen on this Unix socket instead of host:port')
+    parser.add_argument('--workers', type=int, default=None, help='evaluation processes (default: CPU count)')
+    parser.add_argument('--cache', type=int, default=128, help='finished results kept in memory')
+    parser.add_argument('--warm', type=int, default=8, help='loaded ships kept by each worker')
+    parser.add_argument('--queue', type=int, default=32, help='jobs allowed to wait for a worker')
+    parser.add_argument('--verbose', action='store_true', help='keep the workers\' log output')
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, workers=args.workers, cache_size=args.cache,
+                          queue_size=args.queue, warm_size=args.warm, quiet=not args.verbose))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+import math
+
+import numpy as np
+import pytest as pt
+
+from modules.baseclass.plate import Plate
+
+
+def bilge(thickness=20):
+    return Plate((15.33, 0), (17.0, 1.67), thickness, 'AH32', 'Bilge')
+
+
+def test_bilge_discretisation_is_cached_until_the_geometry_changes(monkeypatch):
+    plate = bilge()
+    X = plate.render_data()[0]
+    assert plate.render_data()[0] is X
+
+    monkeypatch.setattr(plate, 'ARC_RESOLUTION', 25)
+    assert len(plate.render_data()[0]) == 25
+    plate.end = (17.5, 2.17)
+    assert plate.render_data()[0][-1] == pt.approx(17.5)
+
+
+def test_bilge_normals_are_radial():
+    plate = bilge()
+    cx, cy, r = plate.arc_params()[:3]
+    X, Y = plate.render_data()[:2]
+    for x, y, eta in zip(X, Y, plate.eta):
+        assert eta == pt.approx([(x - cx) / r, (y - cy) / r])
+
+
+def test_bilge_centroidal_inertia_matches_quadrature():
+    plate = bilge()
+    cx, cy, r, a, b = plate.arc_params()
+    t = plate.net_thickness
+    # midpoint quadrature over the quarter annulus in polar coordinates
+    rr, th = np.meshgrid(r - t / 2 + (np.arange(200) + .5) * t / 200, a + (np.arange(2000) + .5) * (b - a) / 2000)
+    dA = rr * t / 200 * (b - a) / 2000
+    y = rr * np.sin(th)
+    yc = (y * dA).sum() / dA.sum()
+
+    assert plate.area == pt.approx(dA.sum())
+    assert plate.Ixx_c == pt.approx(((y - yc) ** 2 * dA).sum(), rel=1e-6)
+    assert math.dist(plate.CoA, (cx + 2 * r / math.pi, cy - 2 * r / math.pi)) < 1e-12
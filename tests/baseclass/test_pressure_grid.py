@@ -0,0 +1,71 @@
+import math
+import os
+from types import SimpleNamespace
+
+import pytest as pt
+
+import modules.io.IO as IO
+import modules.rules as csr
+from modules.utils.constants import PRESSURE_GRID_SPACING
+from modules.utils.logger import silenced
+
+PROJECT_ROOT = os.path.split(os.environ['VIRTUAL_ENV'])[0]
+MOCK_SHIP_JSON_PATH = os.path.join(PROJECT_ROOT, "out/final.json")
+
+
+@pt.fixture(scope="module")
+def ship():
+    with silenced():
+        return IO.load_ship(MOCK_SHIP_JSON_PATH)
+
+
+def test_meshes_keep_to_the_spacing(ship):
+    assert ship.pressure_grid == {'spacing': PRESSURE_GRID_SPACING, 'levels': (ship.T, ship.Tsc)}
+    for st_pl in ship.stiff_plates:
+        points, normals = st_pl.plate.mesh(**ship.pressure_grid)
+        assert len(points) == len(normals) >= 3
+        assert math.dist(points[0], st_pl.plate.start) == math.dist(points[-1], st_pl.plate.end) == 0
+        for a, b in zip(points[:-1], points[1:]):
+            # chords of the bilge arcs are shorter than their arc length
+            assert 0 < math.dist(a, b) <= PRESSURE_GRID_SPACING + 1e-9
+
+
+def test_levels_are_mesh_points(ship):
+    crossed = 0
+    for st_pl in ship.stiff_plates:
+        points = st_pl.plate.mesh(**ship.pressure_grid)[0]
+        for z in ship.pressure_grid['levels']:
+            if min(st_pl.plate.start[1], st_pl.plate.end[1]) < z < max(st_pl.plate.start[1], st_pl.plate.end[1]):
+                assert any(abs(i[1] - z) < 1e-9 for i in points)
+                crossed += 1
+    assert crossed
+
+
+def test_sides_share_the_plate_mesh(ship):
+    shared = 0
+    for st_pl in ship.stiff_plates:
+        blocks = [i for i in ship.blocks if st_pl.id in i.spans]
+        views = [i.pressure_over_plate(st_pl, 'NONE') for i in blocks]
+        points = st_pl.plate.mesh(**ship.pressure_grid)[0]
+        for block, view in zip(blocks, views):
+            # the plate's own points, in its own direction, not a copy of them
+            start, stop, forward = block.spans[st_pl.id]
+            assert all(block.pressure_coords[i] is points[i - start if forward else stop - 1 - i]
+                       for i in range(start, stop))
+            assert [i[:2] for i in view] == points
+        if len(blocks) == 2:
+            # the normals of the two sides are opposite
+            assert [i[2:4] for i in views[0]] == pt.approx([(-i[2], -i[3]) for i in views[1]])
+            shared += 1
+    assert shared
+
+
+def test_sides_are_paired_point_by_point():
+    # a horizontal plate, pressed by 10 + x from below and by 2 x from above
+    plate = SimpleNamespace(plate=SimpleNamespace(eta=[(0, 1)]))
+    below = [(x, 0, 0, 1, 10 + x) for x in (0, 1, 2, 3, 4)]
+    above = [(x, 0, 0, -1, 2 * x) for x in (0, 1, 2, 3, 4)]
+    P = csr.sides_pressure(plate, [below, above])
+    assert [i[:2] for i in P] == [i[:2] for i in below]
+    assert [i[2] for i in P] == pt.approx([10 - x for x in (0, 1, 2, 3, 4)])
+
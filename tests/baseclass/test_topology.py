@@ -0,0 +1,84 @@
+import json
+import os
+import random
+
+import pytest as pt
+
+import modules.io.IO as IO
+from modules.topology import Topology
+from modules.utils.logger import Logger, silenced
+
+PROJECT_ROOT = os.path.split(os.environ['VIRTUAL_ENV'])[0]
+MOCK_SHIP_JSON_PATH = os.path.join(PROJECT_ROOT, "out/final.json")
+ORDERED = {
+    'WB Tank Bottom': [300, -201, -202, -105, -104, -103, -102, -101],
+    # the side of the hatch is turned, and the pipe duct is oriented clockwise as the other blocks
+    'Cargo Hold': [-111, -211, 210, -107, -106, 202, 201, 200],
+    'WB Wing Tank': [-210, 211, -110, -109, -108],
+    'Pipe Duct': [-200, -300, -100],
+    'SEA': [100, 101, 102, 103, 104, 105, 106, 107, 108, 109],
+    'ATM': [110, 111],
+}
+
+
+def load_envelope():
+    with open(MOCK_SHIP_JSON_PATH) as file:
+        return json.load(file)
+
+
+def test_boundaries_are_ordered_and_oriented():
+    with silenced():
+        ship = IO.load_ship(MOCK_SHIP_JSON_PATH)
+    assert {i.name: i.list_plates_id for i in ship.blocks} == ORDERED
+    for block in ship.blocks:
+        if block.space_type not in ('SEA', 'ATM'):
+            assert Topology(ship.stiff_plates).area(block.list_plates_id) < 0
+
+
+def test_listing_order_and_signs_do_not_matter():
+    data = load_envelope()
+    rng = random.Random(7)
+    for block in data['blocks']:
+        rng.shuffle(block['ids'])
+        block['ids'] = [i * rng.choice((1, -1)) for i in block['ids']]
+    rng.shuffle(data['geometry'])
+    with silenced():
+        ship = IO.parse_ship(data)
+    for block in ship.blocks:
+        # a closed boundary may start anywhere along it
+        ordered = ORDERED[block.name]
+        k = ordered.index(block.list_plates_id[0])
+        assert block.list_plates_id == ordered[k:] + ordered[:k]
+
+
+def test_every_boundary_problem_is_reported_at_once(monkeypatch):
+    monkeypatch.setattr(Logger, 'LEVEL', Logger.LOG_LEVELS['ERROR'])
+    data = load_envelope()
+    blocks = {i['name']: i for i in data['blocks']}
+    blocks['Pipe Duct']['ids'].append(999)
+    blocks['WB Wing Tank']['ids'].append(-108)
+    # without its inner bottom the tank's boundary jumps off the girder's top and cannot close
+    blocks['WB Tank Bottom']['ids'].remove(-201)
+    # a third block on the hopper
+    data['blocks'].append({'name': 'Extra', 'symmetrical': False, 'type': 'VOID', 'ids': [202]})
+
+    with pt.raises(RuntimeError) as e:
+        IO.parse_ship(data)
+    message = str(e.value)
+    assert '6 problem(s)' in message
+    for needle in ('Block Pipe Duct: plates [999] do not exist', 'Block WB Wing Tank: plates [108] are listed more',
+                   'Block WB Tank Bottom: there is a gap of 2.511 m between (2.46, 2.5) and (2.7, 0)',
+                   'Block WB Tank Bottom: the boundary is not closed', 'Block Extra: the boundary is not closed',
+                   'Plate 202 bounds 3 blocks'):
+        assert needle in message
+
+
+def test_graph_joins_end_points_within_the_tolerance():
+    with silenced():
+        ship = IO.load_ship(MOCK_SHIP_JSON_PATH)
+    topology = Topology(ship.stiff_plates)
+    # the plates meeting end to end share their node, a T-junction does not
+    assert topology.ends[101][1] == topology.ends[102][0]
+    assert topology.ends[300][0] not in topology.ends[100]
+    assert topology.face((2.46, 0), (2.7, 0)) == 100
+    assert topology.face((2.46, 0), (2.46, 3.0)) is None
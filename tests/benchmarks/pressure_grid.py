@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Convergence of the pressure grid of the blocks (Block.calculate_pressure_grid).
+
+    python tests/benchmarks/pressure_grid.py --resolutions 10 20 40 80 --spacings 2 1 0.5 0.25 --reference 0.05
+
+Every grid evaluates the ship in full and is compared with the reference grid (a fine spacing) on the quantities
+the pressures drive: the calculated net thickness of every plate and the rule section modulus of every stiffener.
+The error is the largest relative difference over them; the points are the pressure points of all the blocks.
+"""
+import argparse
+import os
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+MOCK_SHIP_JSON_PATH = os.path.join(PROJECT_ROOT, "out/final.json")
+sys.path.insert(0, PROJECT_ROOT)
+
+import modules.io.IO as IO  # noqa: E402
+from modules.pipeline import Evaluation  # noqa: E402
+from modules.utils.logger import silenced  # noqa: E402
+
+
+def requirements(evaluation: Evaluation) -> dict:
+    """
+    {(plate id, quantity): value} of the pressure driven requirements of the evaluated ship.
+    """
+    out = {}
+    for st_pl in evaluation.ship.stiff_plates:
+        if st_pl.null or st_pl.tag == 6:
+            continue
+        out[(st_pl.id, 'plate')] = st_pl.plate.net_thickness_calc
+        if len(st_pl.stiffeners) != 0:
+            out[(st_pl.id, 'Z_rule')] = st_pl.stiffeners[0].Z_rule
+    return out
+
+
+def evaluate(path: str, grid: dict) -> dict:
+    start = time.perf_counter()
+    with silenced():
+        ship = IO.load_ship(path, pressure_grid=grid)
+        evaluation = Evaluation(ship=ship).run()
+    return {
+        'grid': grid,
+        'points': sum(len(i.pressure_coords) for i in ship.blocks),
+        'seconds': time.perf_counter() - start,
+        'requirements': requirements(evaluation),
+    }
+
+
+def error(run: dict, reference: dict) -> float:
+    worst = 0.0
+    for key, value in reference['requirements'].items():
+        if value != 0:
+            worst = max(worst, abs(run['requirements'][key] / value - 1))
+    return worst
+
+
+def convergence(path: str, resolutions, spacings, reference: float) -> list[dict]:
+    """
+    The runs of the grids with their error against the reference spacing, the reference last. The spacing grids
+    are refined at the waterlines as the ship's default one.
+    """
+    with silenced():
+        levels = IO.load_ship(path).pressure_grid['levels']
+    ref = evaluate(path, {'spacing': reference, 'levels': levels})
+    runs = [evaluate(path, {'resolution': i}) for i in resolutions]
+    runs += [evaluate(path, {'spacing': i, 'levels': levels}) for i in spacings]
+    for run in runs + [ref]:
+        run['error'] = error(run, ref)
+    return runs + [ref]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('--envelope', default=MOCK_SHIP_JSON_PATH)
+    parser.add_argument('--resolutions', type=int, nargs='*', default=[10, 20, 40, 80])
+    parser.add_argument('--spacings', type=float, nargs='*', default=[2.0, 1.0, 0.5, 0.25])
+    parser.add_argument('--reference', type=float, default=0.05, help='spacing of the reference grid [m]')
+    args = parser.parse_args(argv)
+
+    runs = convergence(args.envelope, args.resolutions, args.spacings, args.reference)
+    print(f'{"grid":>24} {"points":>8} {"time [s]":>9} {"max rel. error":>15}')
+    for run in runs:
+        grid = ', '.join(f'{key}={value}' for key, value in run['grid'].items() if key != 'levels')
+        print(f'{grid:>24} {run["points"]:>8} {run["seconds"]:>9.2f} {run["error"]:>15.2e}')
+    return runs
+
+
+if __name__ == '__main__':
+    main()
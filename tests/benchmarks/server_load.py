@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Load test of the local evaluation server (server.py).
+
+    python tests/benchmarks/server_load.py --url 127.0.0.1:8050 --duration 10 --concurrency 16 --distinct 4
+
+Without --url a server is started in process on a free port. The clients keep their connections alive and cycle
+over `distinct` request bodies, the envelope with its plates' thicknesses offset by 0.5 mm per variant. Every
+variant is evaluated once before the clock starts (reported as warmup), the timed requests measure the server.
+"""
+import argparse
+import asyncio
+import copy
+import json
+import os
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+MOCK_SHIP_JSON_PATH = os.path.join(PROJECT_ROOT, "out/final.json")
+
+
+def variants(envelope: dict, distinct: int) -> list[bytes]:
+    bodies = []
+    for k in range(distinct):
+        variant = copy.deepcopy(envelope)
+        for i in variant['geometry']:
+            i['plate'][2] += 0.5 * k
+        bodies.append(json.dumps({'envelope': variant}).encode())
+    return bodies
+
+
+async def request(reader, writer, host: str, body: bytes) -> int:
+    writer.write((f'POST /evaluate HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n'
+                  f'Content-Length: {len(body)}\r\n\r\n').encode() + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while (line := await reader.readline()) not in (b'\r\n', b''):
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.lower() == 'content-length':
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+
+async def client(host, port, bodies, offset, deadline, latencies, statuses):
+    reader, writer = await asyncio.open_connection(host, port)
+    n = offset
+    try:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            status = await request(reader, writer, host, bodies[n % len(bodies)])
+            latencies.append(time.perf_counter() - start)
+            statuses[status] = statuses.get(status, 0) + 1
+            n += 1
+    finally:
+        writer.close()
+
+
+async def load(host: str, port: int, duration=10.0, concurrency=16, distinct=4, envelope_path=MOCK_SHIP_JSON_PATH):
+    """
+    Runs the clients for duration seconds and returns the throughput and latency summary.
+    """
+    with open(envelope_path) as file:
+        bodies = variants(json.load(file), distinct)
+    start = time.perf_counter()
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        warmup = [await request(reader, writer, host, body) for body in bodies]
+    finally:
+        writer.close()
+    warmup_seconds = time.perf_counter() - start
+
+    latencies, statuses = [], {}
+    start = time.perf_counter()
+    await asyncio.gather(*(client(host, port, bodies, i, start + duration, latencies, statuses)
+                           for i in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+
+    def percentile(q):
+        return latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1e3 if latencies else float('nan')
+
+    return {
+        'warmup': {'requests': len(warmup), 'seconds': warmup_seconds, 'ok': warmup.count(200)},
+        'requests': len(latencies),
+        'seconds': elapsed,
+        'rps': statuses.get(200, 0) / elapsed,
+        'statuses': statuses,
+        'p50_ms': percentile(0.50),
+        'p95_ms': percentile(0.95),
+        'max_ms': latencies[-1] * 1e3 if latencies else float('nan'),
+    }
+
+
+async def main(args):
+    server = None
+    if args.url:
+        host, port = args.url.rsplit(':', 1)
+        port = int(port)
+    else:
+        sys.path.insert(0, PROJECT_ROOT)
+        from modules.server import EvaluationServer
+        server = await EvaluationServer(workers=args.workers).start('127.0.0.1', 0)
+        host, port = server.address[:2]
+    try:
+        summary = await load(host, port, args.duration, args.concurrency, args.distinct, args.envelope)
+        if server is not None:
+            summary['server'] = server.stats()
+    finally:
+        if server is not None:
+            await server.close()
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', default=None, help='host:port of a running server')
+    parser.add_argument('--duration', type=float, default=10.0)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--distinct', type=int, default=4)
+    parser.add_argument('--workers', type=int, default=None, help='workers of the in process server')
+    parser.add_argument('--envelope', default=MOCK_SHIP_JSON_PATH)
+    asyncio.run(main(parser.parse_args()))
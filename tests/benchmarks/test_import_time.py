@@ -0,0 +1,52 @@
+import json
+import os
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.split(os.environ['VIRTUAL_ENV'])[0]
+# seconds, generous on purpose: the guard is against matplotlib/template I/O sneaking back in, not against noise
+IMPORT_BUDGET = float(os.environ.get('CSR_IMPORT_BUDGET', 1.0))
+CORE_MODULES = (
+    'modules.baseclass.ship',
+    'modules.physics.evaluators',
+    'modules.rules',
+    'modules.io.IO',
+    'modules.io.latex',
+)
+
+PROBE = f"""
+import json, sys, time
+start = time.perf_counter()
+for name in {CORE_MODULES!r}:
+    __import__(name)
+elapsed = time.perf_counter() - start
+import modules.io.datalogger as dl
+import modules.io.latex as lx
+lazy = [t for m in (dl, lx) for t in vars(m).values() if type(t).__name__ == 'LazyLatexTemplate']
+print(json.dumps({{
+    'elapsed': elapsed,
+    'heavy': sorted(m for m in sys.modules if m.split('.')[0] in ('matplotlib', 'PySide6')),
+    'loaded_templates': sum(t._template is not None for t in lazy),
+    'lazy_templates': len(lazy),
+}}))
+"""
+
+
+def cold_import():
+    env = dict(os.environ, CSR_LOG_LEVEL='NONE')
+    res = subprocess.run([sys.executable, '-c', PROBE], cwd=PROJECT_ROOT, env=env,
+                         capture_output=True, text=True, check=True)
+    return json.loads(res.stdout.splitlines()[-1])
+
+
+def test_core_import_does_not_load_plotting_or_templates():
+    probe = cold_import()
+    assert probe['heavy'] == []
+    assert probe['lazy_templates'] > 0
+    assert probe['loaded_templates'] == 0
+
+
+def test_core_cold_import_time():
+    # best of three to keep the measurement about the code and not the page cache
+    elapsed = min(cold_import()['elapsed'] for _ in range(3))
+    assert elapsed < IMPORT_BUDGET, f"core cold import: {elapsed * 1e3:.1f} ms (budget {IMPORT_BUDGET * 1e3:.0f} ms)"
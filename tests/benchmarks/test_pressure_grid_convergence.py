@@ -0,0 +1,18 @@
+import json
+import os
+
+from modules.utils.constants import PRESSURE_GRID_SPACING
+from pressure_grid import convergence
+
+PROJECT_ROOT = os.path.split(os.environ['VIRTUAL_ENV'])[0]
+MOCK_SHIP_JSON_PATH = os.path.join(PROJECT_ROOT, "out/final.json")
+
+
+def test_default_spacing_beats_the_fixed_resolution():
+    fixed, spaced, reference = convergence(MOCK_SHIP_JSON_PATH, resolutions=[10], spacings=[PRESSURE_GRID_SPACING],
+                                           reference=0.1)
+    report = json.dumps([{key: run[key] for key in ('grid', 'points', 'seconds', 'error')} for run in
+                         (fixed, spaced, reference)], indent=2, default=str)
+    assert spaced['points'] < fixed['points'], report
+    assert spaced['error'] <= fixed['error'] + 1e-12, report
+    assert spaced['error'] < 1e-9, report
@@ -0,0 +1,26 @@
+import asyncio
+import json
+import os
+
+from modules.server import EvaluationServer
+from server_load import load
+
+PROJECT_ROOT = os.path.split(os.environ['VIRTUAL_ENV'])[0]
+MOCK_SHIP_JSON_PATH = os.path.join(PROJECT_ROOT, "out/final.json")
+# requests per second, a floor for the warm path: parsing, hashing and answering from the result cache
+SERVER_RPS_BUDGET = float(os.environ.get('CSR_SERVER_RPS', 100))
+
+
+def test_sustained_requests_per_second():
+    async def main():
+        server = await EvaluationServer(workers=1).start('127.0.0.1', 0)
+        try:
+            return await load(*server.address[:2], duration=2, concurrency=8, distinct=2,
+                              envelope_path=MOCK_SHIP_JSON_PATH)
+        finally:
+            await server.close()
+
+    summary = asyncio.run(main())
+    assert summary['warmup']['ok'] == 2
+    assert set(summary['statuses']) == {200}
+    assert summary['rps'] > SERVER_RPS_BUDGET, json.dumps(summary, indent=2)
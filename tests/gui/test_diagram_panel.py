@@ -0,0 +1,95 @@
+import copy
+import os
+from types import SimpleNamespace
+
+import numpy as np
+import pytest as pt
+
+pt.importorskip("PySide6")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+
+import modules.io.IO as IO
+from gui_modules.PlotRenderWidget import DiagramPanel
+
+PROJECT_ROOT = os.path.split(os.environ['VIRTUAL_ENV'])[0]
+MOCK_SHIP_JSON_PATH = os.path.join(PROJECT_ROOT, "out/final.json")
+
+
+@pt.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pt.fixture
+def panel(app):
+    return DiagramPanel(IO.load_ship(MOCK_SHIP_JSON_PATH), None)
+
+
+def contour(view):
+    return next(i for i in view.ax.collections if i.get_gid() == 'contour')
+
+
+def test_switching_back_blits_the_cached_plot(panel, monkeypatch):
+    panel.dropDown.setCurrentText('Thickness Plot')
+    outline, thickness = panel.views['Outline Plot'], panel.views['Thickness Plot']
+    assert outline.background is not None and thickness.background is not None
+
+    draws = []
+    monkeypatch.setattr(panel.fig_canvas, 'draw', lambda: draws.append(1))
+    panel.dropDown.setCurrentText('Outline Plot')
+    panel.dropDown.setCurrentText('Thickness Plot')
+    assert draws == []
+    assert panel.views['Thickness Plot'] is thickness
+    assert thickness.ax.get_visible() and not outline.ax.get_visible()
+
+
+def test_evaluation_update_recolors_the_drawn_collections(panel):
+    panel.dropDown.setCurrentText('Thickness Plot')
+    view = panel.views['Thickness Plot']
+    lines = contour(view)
+    before = np.array(lines.get_array())
+
+    st_pl = next(i for i in panel.ship.stiff_plates if not i.null)
+    st_pl.plate.thickness *= 2
+    panel.set_ship(panel.ship)
+
+    assert panel.views['Thickness Plot'] is view
+    assert contour(view) is lines
+    after = np.array(lines.get_array())
+    assert (after != before).sum() == 1
+    assert lines.norm.vmax == pt.approx(after.max())
+    # the other cached plots are only brought up to date when shown
+    assert panel.views['Outline Plot'].dirty
+
+
+def test_an_evaluated_copy_recolors_the_cached_plots(panel):
+    from gui_modules.MainWindow import MainWindow
+
+    panel.dropDown.setCurrentText('Thickness Plot')
+    views = dict(panel.views)
+    lines = contour(views['Thickness Plot'])
+    before = np.array(lines.get_array())
+
+    # MainWindow.evaluate() hands a copy of the displayed ship to the worker
+    ship = copy.deepcopy(panel.ship)
+    st_pl = next(i for i in ship.stiff_plates if not i.null)
+    st_pl.plate.thickness *= 2
+    window = SimpleNamespace(graph=panel, table=SimpleNamespace(set_data_logger=lambda logger: None),
+                             evaluation_stopped=lambda message: None)
+    MainWindow.evaluation_finished(window, SimpleNamespace(ship=ship, logger=None, outputs={'scantlings': None}))
+
+    assert panel.ship is ship
+    assert panel.views == views and contour(views['Thickness Plot']) is lines
+    assert (np.array(lines.get_array()) != before).sum() == 1
+    assert views['Outline Plot'].dirty
+
+
+def test_a_new_ship_drops_the_cached_plots(panel):
+    panel.dropDown.setCurrentText('Plating Tag Plot')
+    old = dict(panel.views)
+    panel.set_ship(IO.load_ship(MOCK_SHIP_JSON_PATH))
+    assert list(panel.views) == ['Plating Tag Plot']
+    assert panel.views['Plating Tag Plot'] is not old['Plating Tag Plot']
+    assert all(ax not in panel.fig.axes for view in old.values() for ax in view.axes)
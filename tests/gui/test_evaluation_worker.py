@@ -0,0 +1,95 @@
+import os
+from types import SimpleNamespace
+
+import pytest as pt
+
+pt.importorskip("PySide6")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QEventLoop, QTimer, QThreadPool
+from PySide6.QtWidgets import QApplication
+
+from gui_modules.EvaluationWorker import EvaluationService
+import modules.io.IO as IO
+from modules.pipeline import Evaluation, EvaluationCancelled
+from modules.utils.logger import silenced
+
+PROJECT_ROOT = os.path.split(os.environ['VIRTUAL_ENV'])[0]
+MOCK_SHIP_JSON_PATH = os.path.join(PROJECT_ROOT, "out/final.json")
+
+
+@pt.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+def run_service(service, timeout=300_000, **kwargs):
+    """
+    Starts the service and spins an event loop until it reports back; returns the outcome and the progress stream.
+    """
+    events, progress = [], []
+    loop = QEventLoop()
+    service.progress.connect(lambda *args: progress.append(args))
+    service.finished.connect(lambda evaluation: (events.append(('finished', evaluation)), loop.quit()))
+    service.cancelled.connect(lambda: (events.append(('cancelled', None)), loop.quit()))
+    service.failed.connect(lambda msg: (events.append(('failed', msg)), loop.quit()))
+    QTimer.singleShot(timeout, loop.quit)
+    worker = service.start(**kwargs)
+    loop.exec()
+    return worker, events, progress
+
+
+def test_evaluation_streams_progress_per_load_case():
+    seen = []
+    evaluation = Evaluation(MOCK_SHIP_JSON_PATH, progress=lambda *args: seen.append(args)).run()
+    stages = [i[0] for i in seen]
+    for stage in ('load', 'loads', 'slenderness', 'Full Load Condition', 'Water Ballast Condition', 'section'):
+        assert stage in stages
+    conds = [x.cond for x in evaluation.cases]
+    messages = [i[3] for i in seen if i[0] == 'Full Load Condition']
+    assert all(any(cond in msg for msg in messages) for cond in conds)
+    assert evaluation.logger.Plate_D
+
+
+def test_evaluation_cancellation():
+    calls = []
+
+    def is_cancelled():
+        calls.append(1)
+        return len(calls) > 3
+
+    with pt.raises(EvaluationCancelled):
+        Evaluation(MOCK_SHIP_JSON_PATH, is_cancelled=is_cancelled).run()
+
+
+def test_service_hands_back_the_loaded_ship(app):
+    service = EvaluationService(pool=QThreadPool())
+    _, events, progress = run_service(service, filepath=MOCK_SHIP_JSON_PATH, evaluate=False)
+    assert [i[0] for i in events] == ['finished']
+    evaluation = events[0][1]
+    assert evaluation.ship is not None and evaluation.logger.Plate_D
+    assert ('load', 1, 1, 'Ship loaded') in progress
+    assert not service.running
+
+
+def test_service_cancels_a_running_evaluation(app):
+    service = EvaluationService(pool=QThreadPool())
+    # cancel as soon as the first load case is reported
+    service.progress.connect(lambda stage, *_: stage == 'loads' and service.cancel())
+    _, events, progress = run_service(service, filepath=MOCK_SHIP_JSON_PATH, evaluate=True)
+    assert [i[0] for i in events] == ['cancelled']
+    assert not any(i[0] == 'section' for i in progress)
+    assert not service.running
+
+
+def test_main_window_evaluates_a_copy_of_the_displayed_ship(app):
+    from gui_modules.MainWindow import MainWindow
+
+    with silenced():
+        ship = IO.load_ship(MOCK_SHIP_JSON_PATH)
+    window = SimpleNamespace(ship=ship, started={})
+    window.run_service = lambda **kwargs: window.started.update(kwargs)
+    MainWindow.evaluate(window)
+    # the worker mutates its ship, the displayed one is only replaced by evaluation_finished()
+    assert window.started['evaluate'] and window.started['ship'] is not ship
+    assert [i.id for i in window.started['ship'].stiff_plates] == [i.id for i in ship.stiff_plates]
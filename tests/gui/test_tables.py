@@ -0,0 +1,92 @@
+import copy
+import os
+from types import SimpleNamespace
+
+import pytest as pt
+
+pt.importorskip("PySide6")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+
+import modules.io.IO as IO
+from modules.io.datalogger import DataLogger
+from gui_modules.TableWidget import DataLoggerTableModel, TablesPanel
+
+PROJECT_ROOT = os.path.split(os.environ['VIRTUAL_ENV'])[0]
+MOCK_SHIP_JSON_PATH = os.path.join(PROJECT_ROOT, "out/final.json")
+
+
+@pt.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pt.fixture
+def data_logger():
+    logger = DataLogger(IO.load_ship(MOCK_SHIP_JSON_PATH))
+    logger.create_tabular_data()
+    return logger
+
+
+def test_model_reads_the_datalogger_rows(app, data_logger):
+    model = DataLoggerTableModel(data_logger, 'Plate_D', 'Plate_Header')
+    assert model.rowCount() == len(data_logger.Plate_D)
+    assert model.data(model.index(0, 0)) == data_logger.Plate_D[0]  # group annotation row
+    assert model.data(model.index(0, 1)) is None
+    assert model.data(model.index(1, 0)) == str(data_logger.Plate_D[1][0])
+
+
+def test_refresh_signals_only_changed_rows(app, data_logger):
+    model = DataLoggerTableModel(data_logger, 'Plate_D', 'Plate_Header')
+    changed = []
+    model.dataChanged.connect(lambda a, b: changed.append((a.row(), b.row())))
+    model.modelReset.connect(lambda: changed.append('reset'))
+
+    st_pl = data_logger.ship.stiff_plates[2]
+    st_pl.plate.thickness *= 1.1
+    data_logger.create_tabular_data()
+    model.refresh()
+
+    row = next(i for i, line in enumerate(data_logger.Plate_D) if isinstance(line, list) and line[0] == f'Plate {st_pl.id} ')
+    assert changed == [(row, row)]
+
+
+def test_panel_builds_tables_lazily_and_filters(app, data_logger):
+    panel = TablesPanel(data_logger, None)
+    assert list(panel.tables) == [0]
+
+    panel.dropDown.setCurrentIndex(2)
+    assert sorted(panel.tables) == [0, 2]
+
+    table = panel.tables[2]
+    panel.filter.setText('Total St. Plate')
+    assert 0 < table.proxy.rowCount() < table.source.rowCount()
+
+    table.sortByColumn(2, Qt.DescendingOrder)
+    assert table.proxy.rowCount() > 0
+
+
+def test_evaluation_updates_the_built_tables_in_place(app, data_logger):
+    from gui_modules.MainWindow import MainWindow
+
+    panel = TablesPanel(data_logger, None)
+    model = panel.tables[0].source
+    changed = []
+    model.dataChanged.connect(lambda a, b: changed.append((a.row(), b.row())))
+    model.modelReset.connect(lambda: changed.append('reset'))
+
+    # every evaluation returns a new DataLogger over a copy of the displayed ship
+    ship = copy.deepcopy(data_logger.ship)
+    st_pl = ship.stiff_plates[2]
+    st_pl.plate.thickness *= 1.1
+    logger = DataLogger(ship)
+    logger.create_tabular_data()
+    window = SimpleNamespace(table=panel, graph=SimpleNamespace(set_ship=lambda ship, evaluated: None),
+                             evaluation_stopped=lambda message: None)
+    MainWindow.evaluation_finished(window, SimpleNamespace(ship=ship, logger=logger, outputs={}))
+
+    assert panel.tables[0].source is model and model.data_logger is logger
+    row = next(i for i, line in enumerate(logger.Plate_D) if isinstance(line, list) and line[0] == f'Plate {st_pl.id} ')
+    assert changed == [(row, row)]
@@ -0,0 +1,53 @@
+import os
+
+import modules.io.IO as IO
+from modules.io.datalogger import DataLogger, max_p
+
+PROJECT_ROOT = os.path.split(os.environ['VIRTUAL_ENV'])[0]
+MOCK_SHIP_JSON_PATH = os.path.join(PROJECT_ROOT, "out/final.json")
+
+
+def data_logger():
+    logger = DataLogger(IO.load_ship(MOCK_SHIP_JSON_PATH))
+    logger.load_conds(['HSM-1'])
+    return logger
+
+
+def test_only_changed_cells_are_rebuilt():
+    logger = data_logger()
+    cells = dict(logger.cells)
+    assert list(cells) == sorted(cells)
+
+    changed = logger.ship.stiff_plates[2]
+    changed.plate.thickness *= 1.1
+    logger.cells[changed.id].Pressure['HSM-1'] = 42.0
+    logger.load_data()
+
+    for _id, cell in logger.cells.items():
+        assert (cell is cells[_id]) == (_id != changed.id)
+    # a rebuilt cell keeps the pressure maxima that were logged so far
+    assert logger.cells[changed.id].Pressure['HSM-1'] == 42.0
+
+
+def test_updated_cells_are_not_rebuilt():
+    logger = data_logger()
+    changed = logger.ship.stiff_plates[2]
+    changed.plate.thickness *= 1.1
+    cell = logger.cells[changed.id]
+    logger.update_stiff_plate(changed)
+    logger.load_data()
+    assert logger.cells[changed.id] is cell
+
+
+def test_tables_reuse_cached_rows():
+    logger = data_logger()
+    first = [list(i) for i in logger.create_tabular_data(dump=True)]
+    second = logger.create_tabular_data(dump=True)
+
+    assert first == [list(i) for i in second]
+    assert all(a is b for a, b in zip(first[1], second[1]))
+
+
+def test_max_p_skips_non_evaluated_entries():
+    assert max_p(['-', 3.0, -5.0, '-']) == -5.0
+    assert max_p(['-']) == 'Not Evaluated'
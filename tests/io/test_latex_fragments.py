@@ -0,0 +1,40 @@
+import os
+
+import modules.io.IO as IO
+from modules.io.datalogger import DataLogger
+from modules.io.latex import FRAGMENTS, latex_document, latex_output, write_latex_fragments
+
+PROJECT_ROOT = os.path.split(os.environ['VIRTUAL_ENV'])[0]
+MOCK_SHIP_JSON_PATH = os.path.join(PROJECT_ROOT, "out/final.json")
+
+
+def data_logger():
+    logger = DataLogger(IO.load_ship(MOCK_SHIP_JSON_PATH))
+    logger.load_conds([])
+    logger.create_tabular_data()
+    return logger
+
+
+def test_only_changed_fragments_are_rewritten(tmp_path):
+    logger = data_logger()
+    path = str(tmp_path) + '/'
+
+    assert write_latex_fragments(logger, path) == list(FRAGMENTS)
+    logger.create_tabular_data()
+    assert write_latex_fragments(logger, path) == []
+
+    logger.ship.stiff_plates[3].plate.thickness *= 1.1
+    logger.create_tabular_data()
+    assert write_latex_fragments(logger, path) == ['plates']
+
+
+def test_fragments_match_the_in_memory_report(tmp_path):
+    logger = data_logger()
+    path = str(tmp_path) + '/'
+    write_latex_fragments(logger, path, figs=('id_plt.pdf',))
+
+    document = latex_document()
+    for name in FRAGMENTS:
+        with open(os.path.join(path, 'tabs', name + '.tex')) as file:
+            document = document.replace(f'\\input{{tabs/{name}}}', file.read())
+    assert document == latex_output(logger, figs=('id_plt.pdf',))
@@ -0,0 +1,42 @@
+import json
+import os
+
+import pytest as pt
+
+import modules.io.IO as IO
+from modules.utils.logger import Logger
+
+PROJECT_ROOT = os.path.split(os.environ['VIRTUAL_ENV'])[0]
+MOCK_SHIP_JSON_PATH = os.path.join(PROJECT_ROOT, "out/final.json")
+
+
+def load_envelope():
+    with open(MOCK_SHIP_JSON_PATH) as file:
+        return json.load(file)
+
+
+@pt.mark.parametrize("chunk_size", [1, 7, IO.STREAM_CHUNK_SIZE])
+def test_streaming_loader_matches_in_memory_parse(chunk_size):
+    streamed = IO.load_ship(MOCK_SHIP_JSON_PATH, chunk_size=chunk_size)
+    parsed = IO.parse_ship(load_envelope())
+
+    assert [i.id for i in streamed.stiff_plates] == [i.id for i in parsed.stiff_plates]
+    assert [i.name for i in streamed.blocks] == [i.name for i in parsed.blocks]
+    assert streamed.n50_Ixx == parsed.n50_Ixx
+    assert streamed.yo == parsed.yo
+
+
+def test_every_validation_error_is_reported_at_once(monkeypatch):
+    monkeypatch.setattr(Logger, 'LEVEL', Logger.LOG_LEVELS['ERROR'])
+    data = load_envelope()
+    data['geometry'][1]['id'] = data['geometry'][0]['id']
+    data['geometry'][2]['plate'][3] = 'NOT_A_MATERIAL'
+    del data['geometry'][3]['spacing']
+    del data['Cb']
+
+    with pt.raises(RuntimeError) as e:
+        IO.parse_ship(data)
+    message = str(e.value)
+    assert '4 error(s)' in message
+    for needle in ("{'Cb'}", 'CONFLICTING ID : 100', 'no documented material', "KeyError('spacing')"):
+        assert needle in message
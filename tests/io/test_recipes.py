@@ -0,0 +1,75 @@
+import copy
+import json
+import os
+
+import pytest as pt
+
+import modules.io.IO as IO
+import modules.rules as csr
+from modules.pipeline import Evaluation, RECIPES
+from modules.utils.logger import Logger, silenced
+
+PROJECT_ROOT = os.path.split(os.environ['VIRTUAL_ENV'])[0]
+MOCK_SHIP_JSON_PATH = os.path.join(PROJECT_ROOT, "out/final.json")
+MORE_RECIPES = {
+    **RECIPES,
+    'Dry Hold': {'Dynamics': 'S+D', 'max value': '', 'skip value': 'DC'},
+    'Static Only': {'Dynamics': 'S', 'max value': 'DC,WB', 'skip value': 'LC,OIL,FW,VOID'},
+}
+
+
+@pt.fixture(scope="module")
+def loaded():
+    with silenced():
+        return Evaluation(MOCK_SHIP_JSON_PATH).load().evaluate_loads()
+
+
+def test_cached_sides_match_the_assigner(loaded):
+    evaluation = copy.deepcopy(loaded)
+    ship, case = evaluation.ship, evaluation.cases[0]
+    recipe = RECIPES['Water Ballast Condition']
+    with silenced():
+        csr.loading_cases_eval(ship, case, recipe, evaluation.logger, evaluation.pressures)
+    checked = 0
+    for plate in ship.stiff_plates:
+        if plate.null or plate.tag == 6:
+            continue
+        blocks = [i for i in ship.blocks if plate.id in i.list_plates_id or -plate.id in i.list_plates_id]
+        assert [ship.blocks[i] for i in evaluation.pressures.plate_sides(plate)] == blocks
+        # the plates none of whose sides the recipe skips or maximises
+        if all(i.space_type not in recipe['skip value'] for i in blocks):
+            assert plate.Pressure[case.cond] == csr.plate_pressure_assigner(blocks, plate, case, 'S+D')
+            checked += 1
+    assert checked
+
+
+def test_recipes_file_evaluates_over_the_cached_contributions(loaded, tmp_path):
+    path = tmp_path / 'recipes.json'
+    path.write_text(json.dumps(MORE_RECIPES))
+    recipes = IO.load_recipes(path)
+    assert recipes == MORE_RECIPES
+
+    evaluation = copy.deepcopy(loaded)
+    evaluation.recipes = recipes
+    with silenced():
+        evaluation.evaluate_scantlings()
+    # every side of a plate is evaluated once per case and load, whatever the number of recipes
+    sides = sum(len(evaluation.pressures.plate_sides(i)) for i in evaluation.ship.stiff_plates
+                if not i.null and i.tag != 6)
+    assert len(evaluation.pressures.contributions) <= 2 * sides * len(evaluation.cases)
+    assert {key[-1] for key in evaluation.pressures.contributions} == {'S+D', 'S'}
+
+
+def test_invalid_recipes_are_reported_at_once(monkeypatch):
+    monkeypatch.setattr(Logger, 'LEVEL', Logger.LOG_LEVELS['ERROR'])
+    recipes = copy.deepcopy(MORE_RECIPES)
+    del recipes['Dry Hold']['max value']
+    recipes['Static Only']['Dynamics'] = 'X'
+    recipes['Broken'] = 'DC'
+
+    with pt.raises(RuntimeError) as e:
+        IO.recipes_parser(recipes)
+    message = str(e.value)
+    assert '3 error(s)' in message
+    for needle in ("{'max value'}", "got X", 'Recipe Broken is not an object'):
+        assert needle in message
@@ -0,0 +1,63 @@
+import json
+import os
+import time
+
+import pytest as pt
+
+import modules.io.IO as IO
+
+PROJECT_ROOT = os.path.split(os.environ['VIRTUAL_ENV'])[0]
+MOCK_SHIP_JSON_PATH = os.path.join(PROJECT_ROOT, "out/final.json")
+# seconds, for saving the mock envelope replicated SAVE_COPIES times
+SAVE_BUDGET = float(os.environ.get('CSR_SAVE_BUDGET', 2.0))
+SAVE_COPIES = 200
+
+
+def leaves(item):
+    # the mm <-> m conversions drift in the last ulp, so the numbers are compared approximately
+    if isinstance(item, dict):
+        for key in sorted(item):
+            yield key
+            yield from leaves(item[key])
+    elif isinstance(item, (list, tuple)):
+        for i in item:
+            yield from leaves(i)
+    else:
+        yield item
+
+
+def section_signature(ship):
+    save = IO.ship_to_dict(ship)
+    save['blocks'] = [IO.blocks_save(i) for i in ship.blocks]
+    return list(leaves(save))
+
+
+@pt.mark.parametrize("name", ["ship.json", "ship.npz"])
+def test_save_load_round_trip(tmp_path, name):
+    ship = IO.load_ship(MOCK_SHIP_JSON_PATH)
+    path = str(tmp_path / name)
+    IO.ship_save(ship, path)
+    loaded = IO.load_ship(path)
+
+    expected = section_signature(ship)
+    assert section_signature(loaded) == [pt.approx(i) if isinstance(i, float) else i for i in expected]
+    assert loaded.n50_Ixx == pt.approx(ship.n50_Ixx)
+
+
+def test_saved_json_is_valid_and_matches_the_dict_form(tmp_path):
+    ship = IO.load_ship(MOCK_SHIP_JSON_PATH)
+    path = tmp_path / "ship.json"
+    IO.ship_save(ship, str(path))
+    with open(path) as file:
+        assert json.load(file) == json.loads(json.dumps(IO.ship_to_dict(ship)))
+
+
+def test_large_envelope_save_time(tmp_path):
+    ship = IO.load_ship(MOCK_SHIP_JSON_PATH)
+    ship.stiff_plates = ship.stiff_plates * SAVE_COPIES
+    path = str(tmp_path / "large.json")
+
+    start = time.perf_counter()
+    IO.ship_save(ship, path)
+    elapsed = time.perf_counter() - start
+    assert elapsed < SAVE_BUDGET, f"saved {len(ship.stiff_plates)} stiffened plates in {elapsed * 1e3:.1f} ms"
@@ -0,0 +1,83 @@
+import copy
+import json
+import os
+
+import numpy as np
+import pytest as pt
+
+import modules.io.IO as IO
+from modules.optimiser import Optimiser
+from modules.pipeline import Evaluation
+from modules.section import SectionModel
+from modules.utils.logger import silenced
+
+PROJECT_ROOT = os.path.split(os.environ['VIRTUAL_ENV'])[0]
+MOCK_SHIP_JSON_PATH = os.path.join(PROJECT_ROOT, "out/final.json")
+
+CATALOG = [{'type': 'tb', 'dimensions': dims} for dims in (
+    [250, 12, 150, 12], [300, 13, 150, 14], [300, 15, 200, 15], [350, 15, 200, 16], [400, 16, 200, 18],
+    [450, 18, 220, 20], [400, 30, 200, 15],
+)]
+
+
+@pt.fixture(scope="module")
+def envelope():
+    with open(MOCK_SHIP_JSON_PATH) as file:
+        return json.load(file)
+
+
+@pt.fixture(scope="module")
+def optimised(envelope):
+    optimiser = Optimiser(envelope, CATALOG, max_steps=150)
+    return optimiser, optimiser.run()
+
+
+def test_section_model_matches_ship(envelope):
+    # the envelope's own stiffeners as the catalog, so that the model sees the envelope itself
+    catalog = []
+    for i in envelope['geometry']:
+        if i['stiffeners'] and i['stiffeners'] not in catalog:
+            catalog.append(i['stiffeners'])
+    with silenced():
+        ship = Evaluation(ship=IO.parse_ship(envelope)).load().evaluate_loads().ship
+    model = SectionModel(ship, catalog)
+    profile = np.array([catalog.index(i['stiffeners']) if i['stiffeners'] else 0
+                        for i in envelope['geometry'] if not i.get('null')])
+    yo, ixx = model.section(*model.totals(model.thickness, profile)[:3])
+
+    # the section as the rules see it, before they raise any thickness
+    ship = copy.deepcopy(ship)
+    ship.evaluate_beff()
+    for st_pl in ship.stiff_plates:
+        if not st_pl.null and st_pl.tag != 6:
+            st_pl.update()
+    ship.update()
+    assert yo == pt.approx(ship.yo, rel=1e-12)
+    assert ixx == pt.approx(ship.n50_Ixx, rel=1e-12)
+
+
+def test_pareto_set_is_non_dominated(optimised):
+    _, report = optimised
+    front = report['pareto']
+    assert len(front) > 1
+    areas = [i['area'] for i in front]
+    margins = [i['margin'] for i in front]
+    assert areas == sorted(areas)
+    assert all(a < b for a, b in zip(margins, margins[1:]))
+    assert report['candidates'] > 1000
+
+
+def test_best_design_passes_the_rules(optimised, envelope):
+    optimiser, report = optimised
+    assert report['verified'] and report['violations'] == []
+    assert report['best']['margin'] >= 0
+
+    # a cold evaluation of the optimised envelope agrees with the model and keeps every thickness
+    with silenced():
+        results = Evaluation(ship=IO.parse_ship(optimiser.envelope_of(*optimiser.design))).run().results()
+    assert results['verdict']
+    assert results['section']['n50_Ixx'] == pt.approx(report['best']['checks']['In50'], rel=1e-9)
+    evaluated = [i for i in results['plates'] if i['evaluated']]
+    assert [i['thickness'] for i in evaluated] == pt.approx([i['thickness'] for i in report['best']['plates']])
+    for plate in report['best']['plates']:
+        assert plate['thickness'] * 2 == round(plate['thickness'] * 2)
@@ -0,0 +1,52 @@
+import os
+
+import numpy as np
+import pytest as pt
+
+import modules.rules as csr
+from modules.pipeline import Evaluation
+from modules.screening import HullGirderScreen
+from modules.utils.logger import silenced
+
+PROJECT_ROOT = os.path.split(os.environ['VIRTUAL_ENV'])[0]
+MOCK_SHIP_JSON_PATH = os.path.join(PROJECT_ROOT, "out/final.json")
+
+
+@pt.fixture(scope="module")
+def evaluation():
+    with silenced():
+        evaluation = Evaluation(MOCK_SHIP_JSON_PATH)
+        evaluation.request('section properties')
+    return evaluation
+
+
+def test_screen_matches_the_section_stage(evaluation):
+    screen = HullGirderScreen(evaluation.ship)
+    result = screen(screen.thickness)
+    for key, (value, required) in evaluation.outputs['section properties'].items():
+        assert result['values'][key] == pt.approx(value, rel=1e-12)
+        assert result['margins'][key] == pt.approx(value / required - 1, rel=1e-12)
+    assert result['verdict']
+
+    # the minimums the rules floor the plates' empirical net thickness to
+    l2 = min(300, evaluation.ship.Lsc)
+    for j, st_pl in enumerate(screen.model.stiff_plates):
+        if st_pl.tag != 6:
+            assert screen.minimum[j] == csr.minimum_net_thickness(st_pl, l2)
+
+
+def test_batches_are_screened_elementwise(evaluation):
+    screen = HullGirderScreen(evaluation.ship)
+    rng = np.random.default_rng(0)
+    batch = screen.thickness * rng.uniform(0.7, 1.3, (3, 5, len(screen.ids)))
+    # the first keel plate below its minimum net thickness
+    keel = next(j for j, i in enumerate(screen.model.stiff_plates) if i.tag == 0 and i.plate.start[0] == 0)
+    batch[0, 0, keel] = screen.model.cor[keel] + screen.minimum[keel] - 1e-4
+    result = screen(batch)
+    assert result['verdict'].shape == (3, 5) and result['thickness_margin'].shape == batch.shape
+    assert not result['minimum'][0, 0]
+    for index in np.ndindex(3, 5):
+        single = screen(batch[index])
+        for key in single['values']:
+            assert result['values'][key][index] == pt.approx(single['values'][key], rel=1e-12)
+        assert result['verdict'][index] == single['verdict']
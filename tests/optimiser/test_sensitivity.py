@@ -0,0 +1,79 @@
+import copy
+import json
+import os
+
+import numpy as np
+import pytest as pt
+
+import modules.io.IO as IO
+from modules.pipeline import Evaluation
+from modules.sensitivity import PROPERTIES, VARIABLES, section_gradients
+from modules.utils.logger import silenced
+
+PROJECT_ROOT = os.path.split(os.environ['VIRTUAL_ENV'])[0]
+MOCK_SHIP_JSON_PATH = os.path.join(PROJECT_ROOT, "out/final.json")
+STEP = 1e-3  # [mm]
+
+
+@pt.fixture(scope="module")
+def envelope():
+    with open(MOCK_SHIP_JSON_PATH) as file:
+        return json.load(file)
+
+
+def offloaded(envelope):
+    with silenced():
+        return Evaluation(ship=IO.parse_ship(envelope)).load().evaluate_loads().ship
+
+
+def section(envelope):
+    """
+    The properties the rules check, by a full Ship.update() of the reloaded envelope.
+    """
+    ship = copy.deepcopy(offloaded(envelope))
+    ship.evaluate_beff()
+    for st_pl in ship.stiff_plates:
+        if not st_pl.null and st_pl.tag != 6:
+            st_pl.update()
+    ship.update()
+    return np.array([ship.yo, ship.n50_Ixx, ship.n50_Ixx / ship.yo, ship.n50_Ixx / abs(ship.yo - ship.D)])
+
+
+def perturbed(envelope, id_, variable, step):
+    envelope = copy.deepcopy(envelope)
+    entry = next(i for i in envelope['geometry'] if i['id'] == id_)
+    if variable == 't':
+        entry['plate'][2] += step
+    else:
+        entry['stiffeners']['dimensions'][VARIABLES.index(variable) - 1] += step
+    return envelope
+
+
+@pt.fixture(scope="module")
+def gradients(envelope):
+    return section_gradients(offloaded(envelope))
+
+
+def test_values_match_the_ship(envelope, gradients):
+    assert [gradients['values'][key] for key in PROPERTIES] == pt.approx(section(envelope), rel=1e-12)
+
+
+@pt.mark.parametrize("id_, variable", [
+    (100, 't'), (100, 'lw'), (100, 'bw'), (100, 'lf'), (100, 'bf'),  # shell, T bars
+    (110, 'lw'),  # weather deck
+    (103, 't'),  # bilge
+    (300, 't'),  # girder
+])
+def test_gradients_match_finite_differences(envelope, gradients, id_, variable):
+    j, v = gradients['ids'].index(id_), VARIABLES.index(variable)
+    analytic = np.array([gradients['gradients'][key][j, v] for key in PROPERTIES])
+    difference = (section(perturbed(envelope, id_, variable, STEP))
+                  - section(perturbed(envelope, id_, variable, -STEP))) / (2 * STEP * 1e-3)
+    assert analytic == pt.approx(difference, rel=1e-5, abs=1e-9)
+
+
+def test_missing_variables_are_nan(gradients):
+    bilge, girder = gradients['ids'].index(103), gradients['ids'].index(300)
+    for key in PROPERTIES:
+        assert np.isnan(gradients['gradients'][key][[bilge, girder], 1:]).all()
+        assert not np.isnan(gradients['gradients'][key][:, 0]).any()
@@ -0,0 +1,117 @@
+import copy
+import math
+import os
+
+import numpy as np
+import pytest as pt
+
+import modules.io.IO as IO
+import modules.physics.evaluators as evaluators
+import modules.pipeline as pipeline
+import modules.rules as csr
+from modules.baseclass.block import Block
+from modules.physics.data import Data
+from modules.physics.superposition import EDW, LIQUID_SPACES, UnitResponses, acceleration_basis
+from modules.utils.constants import G
+from modules.utils.logger import silenced
+
+PROJECT_ROOT = os.path.split(os.environ['VIRTUAL_ENV'])[0]
+MOCK_SHIP_JSON_PATH = os.path.join(PROJECT_ROOT, "out/final.json")
+LOADING_DRAUGHT = 16
+
+
+@pt.fixture(scope="module")
+def ship():
+    with silenced():
+        ship = IO.load_ship(MOCK_SHIP_JSON_PATH)
+        csr.corrosion_assign(ship, offload=True)
+    return ship
+
+
+def edw_case(reference: Data, cond: str) -> Data:
+    """
+    The reference case switched to cond; Data itself only accepts the conditions with a wave pressure function.
+    """
+    case = copy.copy(reference)
+    case.cond, case.fb = cond, reference.fbeta[cond]
+    (case.Cwv, case.Cqw, case.Cwh, case.Cwt, case.Cxs, case.Cxp, case.Cxg, case.Cys, case.Cyr, case.Cyg, case.Czh,
+     case.Czr, case.Czp) = reference.Combination_Factors(cond)
+    return case
+
+
+def dynamic_liquid_pressure(block: Block, case: Data) -> list:
+    """
+    The pointwise dynamic liquid pressure of the block, the reference of the superposition.
+    """
+    ax, ay, az = case.accel_eval(block.CG)
+    V = lambda x, y, z: ax * (x - block.CG[0]) + ay * (y - block.CG[1]) + (az + G) * (z - block.CG[2])
+    # the reference point is the one with the greatest V, the first one of equals
+    Max, pos = -math.inf, None
+    for point in block.pressure_coords:
+        temp = V(case.Lsc * case.fxL, *point)
+        if temp > Max:
+            Max, pos = temp, point
+    x0, y0, z0 = block.CG[0], pos[0], pos[1]
+    # strength assessment only
+    full_l, full_t = (0.62, 0.67) if block.space_type == 'LC' else (1.0, 1.0)
+    rho = max(block.payload['rho'], 1.025)
+    x = case.Lsc * case.fxL
+    return [case.fb * rho * (az * (z0 - z) + full_l * ax * (x0 - x) + full_t * ay * (y0 - y))
+            for y, z in block.pressure_coords]
+
+
+def dynamic_dry_cargo_pressure(block: Block, case: Data) -> list:
+    """
+    The pointwise dynamic dry cargo pressure of the block, the reference of the superposition.
+    """
+    zc = block.pressure_coords[0][1]
+    rho = block.payload['rho'] if (block.payload['rho'] >= 1.0) else 1.0
+    ax, ay, az = case.accel_eval(block.CG)
+    x = block.CG[0]
+    return [case.fb * rho * (Kc * az * (zc - z) + 0.25 * ax * (block.CG[0] - x) + 0.25 * ay * (block.CG[1] - y))
+            if z <= zc else 0 for (y, z), Kc in zip(block.pressure_coords, block.Kc)]
+
+
+def test_second_variants_are_sign_flips(ship):
+    reference = Data(LOADING_DRAUGHT, ship, 'HSM-1')
+    for cond in EDW[::2]:
+        first = reference.Combination_Factors(cond)
+        second = reference.Combination_Factors(cond.replace('-1', '-2'))
+        assert second == [-i for i in first]
+    assert Data(LOADING_DRAUGHT, ship, 'HSM-2').Cwv == -Data(LOADING_DRAUGHT, ship, 'HSM-1').Cwv
+
+
+def test_acceleration_basis(ship):
+    reference = Data(LOADING_DRAUGHT, ship, 'BSP-1P')
+    point = (ship.Lsc / 2, 12.5, 7.0)
+    factors = np.array(reference.Combination_Factors()[4:])
+    assert acceleration_basis(reference, point) @ factors == pt.approx(reference.accel_eval(point), abs=1e-12)
+
+
+def test_superposition_matches_internal(ship):
+    reference = Data(LOADING_DRAUGHT, ship, 'HSM-1')
+    pressures = UnitResponses(copy.deepcopy(ship), reference).evaluate(EDW)
+    assert set(pressures) == set(EDW)
+    for cond in EDW:
+        case = edw_case(reference, cond)
+        assert pressures[cond]
+        for block, P in pressures[cond].items():
+            assert block.Pressure[cond] is P
+            F = dynamic_liquid_pressure if block.space_type in LIQUID_SPACES else dynamic_dry_cargo_pressure
+            assert P == pt.approx(F(block, case), rel=1e-12, abs=1e-9)
+
+
+def test_the_dynamic_cases_share_the_unit_responses(monkeypatch):
+    built = []
+
+    class Counted(UnitResponses):
+        def __init__(self, *args):
+            built.append(args)
+            super().__init__(*args)
+
+    monkeypatch.setattr(pipeline, 'UnitResponses', Counted)
+    monkeypatch.setattr(evaluators, 'UnitResponses', Counted)
+    evaluation = pipeline.Evaluation(MOCK_SHIP_JSON_PATH)
+    with silenced():
+        evaluation.request(*pipeline.DYNAMIC_CASES)
+    assert len(built) == 1
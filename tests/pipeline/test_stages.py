@@ -0,0 +1,60 @@
+import os
+
+import pytest as pt
+
+from modules.pipeline import Evaluation, STAGES
+from modules.utils.logger import silenced
+
+PROJECT_ROOT = os.path.split(os.environ['VIRTUAL_ENV'])[0]
+MOCK_SHIP_JSON_PATH = os.path.join(PROJECT_ROOT, "out/final.json")
+
+
+@pt.fixture(scope="module")
+def full():
+    with silenced():
+        return Evaluation(MOCK_SHIP_JSON_PATH).run()
+
+
+def test_plan_runs_every_stage_after_its_inputs():
+    plan = Evaluation(MOCK_SHIP_JSON_PATH).plan('report')
+    assert sorted(plan) == sorted(STAGES.keys() - {'section properties'})
+    for stage in plan:
+        assert all(plan.index(i) < plan.index(stage) for i in STAGES[stage][0])
+
+
+def test_section_screen_skips_the_pressures(full):
+    seen = []
+    evaluation = Evaluation(MOCK_SHIP_JSON_PATH, progress=lambda *args: seen.append(args))
+    with silenced():
+        screen = evaluation.request('section properties')['section properties']
+    assert set(evaluation.outputs) == {'ship', 'corrosion', 'section properties'}
+    assert all(not block.Pressure for block in evaluation.ship.blocks)
+    assert not any('STATIC' in i[-1] for i in seen)
+    # the rules only raise thicknesses, the screen bounds the final checks from below
+    for key, (value, required) in screen.items():
+        assert value <= full.section[key][0] * (1 + 1e-9)
+        assert required == pt.approx(full.section[key][1])
+
+
+def test_checkpoint_resumes_to_the_same_results(full, tmp_path):
+    path = str(tmp_path / 'evaluation.pkl')
+    with silenced():
+        Evaluation(MOCK_SHIP_JSON_PATH, checkpoint=path).request('pressures')
+    seen = []
+    evaluation = Evaluation.resume(path, progress=lambda *args: seen.append(args))
+    assert {'HSM', 'BSP', 'pressures'} <= set(evaluation.outputs)
+    with silenced():
+        evaluation.run()
+    assert not any(i[0] in ('load', 'loads') for i in seen)
+    assert evaluation.results() == full.results()
+
+
+def test_tabulating_a_loaded_ship_keeps_the_report_pending(full):
+    evaluation = Evaluation(MOCK_SHIP_JSON_PATH)
+    with silenced():
+        evaluation.request('ship')
+        evaluation.tabulate()
+        assert set(evaluation.outputs) == {'ship'} and evaluation.logger.Plate_D
+        evaluation.request('report')
+    assert set(evaluation.outputs) == STAGES.keys() - {'section properties'}
+    assert evaluation.results() == full.results()
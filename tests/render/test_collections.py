@@ -0,0 +1,38 @@
+import os
+
+import matplotlib
+
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import pytest as pt
+
+import modules.io.IO as IO
+import modules.render as rnr
+
+PROJECT_ROOT = os.path.split(os.environ['VIRTUAL_ENV'])[0]
+MOCK_SHIP_JSON_PATH = os.path.join(PROJECT_ROOT, "out/final.json")
+
+
+def artists(ax):
+    return len(ax.lines) + len(ax.collections)
+
+
+@pt.mark.parametrize("plot", [
+    lambda s: rnr.lines_plot(s, show_w=True),
+    lambda s: rnr.block_plot(s, fill=False),
+    lambda s: rnr.contour_plot(s, key="thickness"),
+    lambda s: rnr.contour_plot(s, key="tag"),
+    lambda s: rnr.pressure_plot(s, "Normals", "all", normals_mode=True),
+])
+def test_artist_count_does_not_grow_with_the_section(plot):
+    ship = IO.load_ship(MOCK_SHIP_JSON_PATH)
+    plates = ship.stiff_plates
+    counts = []
+    for copies in (1, 10):
+        ship.stiff_plates = plates * copies
+        _, ax = plot(ship)
+        counts.append(artists(ax))
+        plt.close('all')
+
+    assert counts[0] == counts[1]
+    assert counts[0] <= 5
@@ -0,0 +1,36 @@
+import os
+
+import modules.io.IO as IO
+import modules.render as rnr
+
+PROJECT_ROOT = os.path.split(os.environ['VIRTUAL_ENV'])[0]
+MOCK_SHIP_JSON_PATH = os.path.join(PROJECT_ROOT, "out/final.json")
+
+
+def jobs(ship, folder):
+    yield "outline", rnr.outline_data(ship), str(folder / "outline.png"), {"show_w": True}
+    yield "blocks", rnr.block_data(ship), str(folder / "blocks.pdf"), {}
+    for key in ("id", "tag", "thickness"):
+        yield "contour", rnr.contour_data(ship, key), str(folder / f"{key}.pdf"), {"cmap": "jet"}
+    yield "pressure", rnr.pressure_data(ship, "Normals", "SEA", True), str(folder / "normals.png"), {}
+
+
+def test_parallel_export_writes_every_figure(tmp_path):
+    ship = IO.load_ship(MOCK_SHIP_JSON_PATH)
+    expected = [i[2] for i in jobs(ship, tmp_path)]
+
+    assert rnr.export_figures(jobs(ship, tmp_path), workers=2) == expected
+    for path in expected:
+        assert os.path.getsize(path) > 0
+
+
+def test_serial_export_matches_parallel(tmp_path):
+    ship = IO.load_ship(MOCK_SHIP_JSON_PATH)
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    rnr.export_figures(jobs(ship, tmp_path / "a"), workers=1)
+    rnr.export_figures(jobs(ship, tmp_path / "b"), workers=3)
+
+    for name in ("outline.png", "normals.png"):
+        with open(tmp_path / "a" / name, "rb") as a, open(tmp_path / "b" / name, "rb") as b:
+            assert a.read() == b.read()
@@ -0,0 +1,65 @@
+import copy
+import os
+
+import pytest as pt
+
+import modules.io.IO as IO
+import modules.rules as csr
+from modules.utils.logger import silenced
+
+PROJECT_ROOT = os.path.split(os.environ['VIRTUAL_ENV'])[0]
+MOCK_SHIP_JSON_PATH = os.path.join(PROJECT_ROOT, "out/final.json")
+
+
+@pt.fixture(scope="module")
+def ship():
+    with silenced():
+        return IO.load_ship(MOCK_SHIP_JSON_PATH)
+
+
+def test_corrosion_additions_of_the_mock(ship):
+    types = csr.space_types(ship)
+    plates = {i.id: i for i in ship.stiff_plates}
+    expected = {
+        100: (0.5, 1.0),  # keel, VOID | wet SEA
+        106: (1.8, 1.5),  # side shell, DC | wet/dried SEA
+        107: (1.8, 1.7),  # side shell above the draught, DC | dry SEA
+        110: (2.0, 1.7),  # weather deck, WB | ATM
+        201: (3.7, 2.0),  # inner bottom, DC | WB
+        200: (3.7, 0.5),  # inner bottom, DC | VOID
+    }
+    for _id, (t_in, t_out) in expected.items():
+        assert csr.corrosion_addition(plates[_id], ship.blocks, ship.Tmin, ship.Tsc, types[_id]) == \
+               {'in': t_in, 'out': t_out}
+        # the bounding blocks are looked up when the space types are not given
+        assert csr.corrosion_addition(plates[_id], ship.blocks, ship.Tmin, ship.Tsc) == {'in': t_in, 'out': t_out}
+
+
+def test_draught_zones():
+    assert [csr.draught_zone(y, 7.5, 16) for y in (0, 7.5, 10, 16, 16.2)] == \
+           ['wet', 'wet', 'wet/dried', 'wet/dried', 'dry']
+
+
+def test_offload_and_load(ship):
+    ship = copy.deepcopy(ship)
+    gross = {i.id: (i.plate.thickness, [j.thickness for s in i.stiffeners for j in s.plates])
+             for i in ship.stiff_plates if not i.null and i.tag != 6}
+    with silenced():
+        csr.corrosion_assign(ship, offload=True)
+    types = csr.space_types(ship)
+    for st_pl in ship.stiff_plates:
+        if st_pl.null or st_pl.tag == 6:
+            continue
+        c_t = csr.corrosion_addition(st_pl, ship.blocks, ship.Tmin, ship.Tsc, types[st_pl.id])
+        # rounded up to 0.5 mm plus 0.5 mm
+        cor = st_pl.plate.cor_thickness * 1e3
+        assert cor - 0.5 >= c_t['in'] + c_t['out'] - 1e-9 and (cor - 0.5) * 2 == pt.approx(round((cor - 0.5) * 2))
+        assert st_pl.plate.net_thickness == pt.approx(st_pl.plate.thickness - st_pl.plate.cor_thickness)
+        assert all(j.cor_thickness == st_pl.plate.cor_thickness for s in st_pl.stiffeners for j in s.plates)
+
+    with silenced():
+        csr.corrosion_assign(ship, offload=False)
+    for _id, (plate, members) in gross.items():
+        st_pl = next(i for i in ship.stiff_plates if i.id == _id)
+        assert st_pl.plate.thickness == pt.approx(plate)
+        assert [j.thickness for s in st_pl.stiffeners for j in s.plates] == pt.approx(members)
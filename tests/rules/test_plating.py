@@ -0,0 +1,94 @@
+import copy
+import math
+import os
+
+import pytest as pt
+
+import modules.rules as csr
+from modules.pipeline import Evaluation, RECIPES
+from modules.utils.constants import MATERIALS
+from modules.utils.logger import silenced
+
+PROJECT_ROOT = os.path.split(os.environ['VIRTUAL_ENV'])[0]
+MOCK_SHIP_JSON_PATH = os.path.join(PROJECT_ROOT, "out/final.json")
+
+
+@pt.fixture(scope="module")
+def loaded():
+    with silenced():
+        return Evaluation(MOCK_SHIP_JSON_PATH).load().evaluate_loads()
+
+
+def reference_plating(ship, plate, case, dynamic):
+    """
+    The plate by plate statement of IACS Part 1 Chapter 6, Section 4 that plating_net_scantling() vectorises.
+    """
+    x = {0: 1.0, 1: 0.7, 2: 0.7, 3: 1.0, 4: 1.0, 5: 1.0}
+    ap = 1.2 - plate.spacing ** 2 / 2.1 / plate.PSM_spacing
+    reh = MATERIALS[plate.plate.material][0]
+
+    def ca(point):
+        ca_ = min(0.9 - 0.5 * abs(case.sigma(*point)) / reh, 0.8) if dynamic else \
+            min(1.05 - 0.5 * abs(case.sigma(*point)) / reh, 0.95)
+        return (0.8 if dynamic else 0.95) if ca_ < 0 else ca_
+
+    l2 = min(300, case.Lsc)
+    if case.cond in plate.Pressure:
+        max_t = max([0.0] + [0.0158 * ap * plate.spacing * math.sqrt(abs(i[-1]) / x[plate.tag] / ca(i[:2]) / reh)
+                             for i in plate.Pressure[case.cond]])
+        t = 0
+        if plate.tag == 0 and any(ship.Tmin < i[1] < 1.25 * ship.Tsc for i in (plate.plate.start, plate.plate.end)):
+            t = 26 * (plate.spacing + 0.7) * (ship.B * ship.Tsc / reh ** 2) ** 0.25 * 1e-3
+        elif plate.tag == 4:
+            p = plate.Pressure[case.cond][0][-1]
+            r = abs(plate.plate.start[1] - plate.plate.end[1]) + 0.5 * (plate.s_pad + plate.e_pad)
+            t = 6.45 * (p * plate.PSM_spacing * 1e3) ** 0.4 * (r * 1e3) ** 0.6 * 1e-7
+        plate.plate.net_thickness_calc = max(plate.plate.net_thickness_calc, t, max_t)
+    plate.plate.net_thickness_empi = max(plate.plate.net_thickness_empi, csr.minimum_net_thickness(plate, l2))
+    if case.cond in plate.Pressure:
+        plate.update()
+
+
+def thicknesses(ship):
+    return {i.id: (i.plate.net_thickness_calc, i.plate.net_thickness_empi, i.plate.net_thickness)
+            for i in ship.stiff_plates}
+
+
+@pt.mark.parametrize('recipe', ['Full Load Condition', 'Water Ballast Condition'])
+@pt.mark.parametrize('dynamic', [False, True])
+def test_bulk_plating_matches_the_plate_by_plate_statement(loaded, recipe, dynamic):
+    evaluation = copy.deepcopy(loaded)
+    ship = evaluation.ship
+    with silenced():
+        for case in evaluation.cases:
+            csr.loading_cases_eval(ship, case, RECIPES[recipe], evaluation.logger, evaluation.pressures)
+        reference = copy.deepcopy(ship)
+        for case in evaluation.cases:
+            for plate in reference.stiff_plates:
+                if not plate.null and plate.tag != 6:
+                    reference_plating(reference, plate, case, dynamic)
+            csr.plating_net_scantling(ship, case, dynamic=dynamic)
+    assert thicknesses(ship) == thicknesses(reference)
+
+
+def test_single_plate_wrapper_matches_the_bulk_engine(loaded):
+    evaluation = copy.deepcopy(loaded)
+    case = evaluation.cases[0]
+    with silenced():
+        csr.loading_cases_eval(evaluation.ship, case, RECIPES['Full Load Condition'], evaluation.logger,
+                               evaluation.pressures)
+        single, bulk = copy.deepcopy(evaluation.ship), copy.deepcopy(evaluation.ship)
+        for plate in single.stiff_plates:
+            csr.plating_net_thickness_calculation(single, plate, case)
+        csr.plating_net_scantling(bulk, case)
+    assert thicknesses(single) == thicknesses(bulk)
+
+
+def test_minimum_net_thicknesses(loaded):
+    plates = [i for i in loaded.ship.stiff_plates if not i.null and i.tag != 6]
+    minimum = csr.minimum_net_thicknesses(plates, 200)
+    # IACS Part 1 Chapter 6, Section 3.1, Table 1
+    table = {0: 11.5, 1: 11.5, 2: 0.7 * math.sqrt(200), 3: 0.7 * math.sqrt(200), 4: 11.5, 5: 8.5}
+    expected = [13.5 if i.tag in (0, 4) and i.plate.start[0] == 0 else table[i.tag] for i in plates]
+    assert minimum * 1e3 == pt.approx(expected)
+    assert csr.minimum_net_thickness(plates[0], 200) == minimum[0]
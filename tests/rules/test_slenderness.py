@@ -0,0 +1,62 @@
+import copy
+import math
+import os
+
+import pytest as pt
+
+import modules.rules as csr
+from modules.baseclass.ship import Ship
+from modules.pipeline import Evaluation
+from modules.utils.constants import MATERIALS
+from modules.utils.logger import silenced
+
+PROJECT_ROOT = os.path.split(os.environ['VIRTUAL_ENV'])[0]
+MOCK_SHIP_JSON_PATH = os.path.join(PROJECT_ROOT, "out/final.json")
+
+
+@pt.fixture(scope="module")
+def ship():
+    with silenced():
+        evaluation = Evaluation(MOCK_SHIP_JSON_PATH)
+        evaluation.request('corrosion')
+        evaluation.ship.evaluate_beff()
+    return evaluation.ship
+
+
+def test_slenderness_requirements(ship):
+    ship = copy.deepcopy(ship)
+    with silenced():
+        csr.buckling_evaluator(ship)
+    checked = 0
+    for st_plate in ship.stiff_plates:
+        if len(st_plate.stiffeners) == 0 or st_plate.tag in (4, 6):
+            continue
+        stiff = st_plate.stiffeners[0]
+        k = math.sqrt(min(MATERIALS[st_plate.plate.material][0], MATERIALS[stiff.material][0]) / 235)
+        assert st_plate.plate.net_thickness_calc >= st_plate.b_eff / 100 * k
+        assert stiff.plates[0].net_thickness_buck == pt.approx(
+            stiff.plates[0].length / csr.SLENDERNESS_CWCF[stiff.type][0] * k, rel=1e-12)
+        if stiff.type in ('tb', 'g'):
+            assert stiff.plates[1].net_thickness_buck == pt.approx(
+                math.dist(stiff.plates[1].end, stiff.plates[0].end) / csr.SLENDERNESS_CWCF[stiff.type][1] * k,
+                rel=1e-12)
+        checked += 1
+    assert checked
+
+
+def test_failures_are_collected_with_one_section_update(ship, monkeypatch):
+    ship = copy.deepcopy(ship)
+    thin = next(i for i in ship.stiff_plates if len(i.stiffeners) > 0 and i.tag not in (4, 6))
+    thin.plate.net_thickness = 1e-4
+    thin.stiffeners[0].plates[0].net_thickness = 1e-4
+    updates = []
+    update = Ship.update
+    monkeypatch.setattr(Ship, 'update', lambda self, *args, **kwargs: updates.append(1) or update(self, *args, **kwargs))
+
+    with silenced():
+        failed = csr.buckling_evaluator(ship)
+    assert set(failed) == set(csr.SLENDERNESS_CHECKS)
+    assert thin.id in failed['tp'] and thin.id in failed['tw']
+    available, required = failed['tp'][thin.id]
+    assert available == 1e-4 and required == thin.plate.net_thickness_calc
+    assert len(updates) == 1
@@ -0,0 +1,79 @@
+import copy
+import os
+
+import pytest as pt
+
+import modules.rules as csr
+from modules.pipeline import Evaluation, RECIPES
+from modules.utils.constants import MATERIALS
+from modules.utils.logger import silenced
+
+PROJECT_ROOT = os.path.split(os.environ['VIRTUAL_ENV'])[0]
+MOCK_SHIP_JSON_PATH = os.path.join(PROJECT_ROOT, "out/final.json")
+
+
+@pt.fixture(scope="module")
+def loaded():
+    with silenced():
+        evaluation = Evaluation(MOCK_SHIP_JSON_PATH).load().evaluate_loads()
+        for case in evaluation.cases:
+            csr.loading_cases_eval(evaluation.ship, case, RECIPES['Full Load Condition'], evaluation.logger,
+                                   evaluation.pressures)
+    return evaluation
+
+
+def stiffened(ship):
+    return [i for i in ship.stiff_plates if not i.null and i.tag != 6 and len(i.stiffeners) != 0]
+
+
+def test_root_pressures_match_local_pressures(loaded):
+    plates = stiffened(loaded.ship)
+    case = loaded.cases[0]
+    expected = [plate.local_P(case.cond, stiff.plates[0].start) for plate in plates for stiff in plate.stiffeners]
+    assert list(csr.root_pressures(plates, case.cond)) == pt.approx(expected, rel=1e-12, abs=1e-12)
+
+
+@pt.mark.parametrize('dynamic', [False, True])
+def test_every_stiffener_is_checked_with_its_own_pressure(loaded, dynamic):
+    ship = copy.deepcopy(loaded.ship)
+    case = loaded.cases[0]
+    plates = stiffened(ship)
+    with silenced():
+        csr.stiffener_net_scantling(plates, case, dynamic=dynamic)
+    for plate in plates:
+        reh = MATERIALS[plate.stiffeners[0].plates[0].material][0]
+        z = []
+        for stiff in plate.stiffeners:
+            p = abs(plate.local_P(case.cond, stiff.plates[0].start))
+            sigma = case.sigma(*stiff.plates[0].start)
+            cs = (0.75 if dynamic else 0.9) if sigma >= 0 else (0.85 if dynamic else 1.0) - abs(sigma) / reh
+            z.append(p * plate.spacing * 1e3 * plate.PSM_spacing ** 2
+                     / (csr.STIFFENER_FBDG * csr.STIFFENER_X[plate.tag] * cs * reh) * 1e-6)
+        assert [i.Z_rule for i in plate.stiffeners] == pt.approx([max(z)] * len(z), rel=1e-12)
+
+
+def test_minimum_thickness_of_flat_bars(loaded):
+    # the girders carry flat bars, which have no flange to check
+    plates = [i for i in copy.deepcopy(loaded.ship).stiff_plates if i.stiffeners and i.stiffeners[0].type == 'fb']
+    assert plates
+    plates[0].stiffeners[0].plates[0].net_thickness_empi = 0
+    csr.minimum_stiff_net_thicknesses(plates, 200)
+    for plate in plates:
+        webs = {i.plates[0].net_thickness_empi for i in plate.stiffeners}
+        assert len(webs) == 1 and webs.pop() > 0
+
+
+def test_single_plate_wrapper_matches_the_bulk_engine(loaded):
+    case = loaded.cases[0]
+    single, bulk = copy.deepcopy(loaded.ship), copy.deepcopy(loaded.ship)
+    with silenced():
+        for a, b in zip(stiffened(single), stiffened(bulk)):
+            csr.stiffener_plating_net_thickness_calculation(a, case, dynamic=True)
+            csr.stiffener_net_scantling([b], case, dynamic=True)
+
+    def state(ship):
+        return [(stiff.Z_rule, [(i.net_thickness_calc, i.net_thickness_empi) for i in stiff.plates])
+                for plate in stiffened(ship) for stiff in plate.stiffeners]
+
+    assert state(single) == state(bulk)
+    assert any(z for z, _ in state(single))
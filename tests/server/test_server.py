@@ -0,0 +1,156 @@
+import asyncio
+import json
+import os
+
+import pytest as pt
+
+from modules.server import EvaluationServer, LRUCache
+
+PROJECT_ROOT = os.path.split(os.environ['VIRTUAL_ENV'])[0]
+MOCK_SHIP_JSON_PATH = os.path.join(PROJECT_ROOT, "out/final.json")
+
+
+@pt.fixture(scope="module")
+def envelope():
+    with open(MOCK_SHIP_JSON_PATH) as file:
+        return json.load(file)
+
+
+async def http(address, method, path, payload=None, raw: bytes = None):
+    """
+    One request per connection; returns the status, the headers and the decoded JSON body.
+    """
+    if isinstance(address, str):
+        reader, writer = await asyncio.open_unix_connection(address)
+    else:
+        reader, writer = await asyncio.open_connection(*address[:2])
+    body = raw if raw is not None else (json.dumps(payload).encode() if payload is not None else b'')
+    writer.write(f'{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n'.encode()
+                 + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    headers = {}
+    while (line := await reader.readline()) not in (b'\r\n', b''):
+        name, _, value = line.decode().partition(':')
+        headers[name.strip().lower()] = value.strip()
+    data = await reader.readexactly(int(headers['content-length']))
+    writer.close()
+    return status, headers, json.loads(data)
+
+
+def run(test, **kwargs):
+    async def main():
+        server = await EvaluationServer(workers=1, **kwargs).start('127.0.0.1', 0)
+        try:
+            return await test(server, server.address)
+        finally:
+            await server.close()
+
+    return asyncio.run(main())
+
+
+def test_lru_cache_evicts_the_least_recently_used():
+    cache = LRUCache(2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    cache.put('c', 3)
+    assert cache.get('b') is None
+    assert (cache.get('a'), cache.get('c')) == (1, 3)
+    assert cache.stats() == {'size': 2, 'capacity': 2, 'hits': 3, 'misses': 1}
+
+
+def test_evaluate_returns_verdicts_and_caches_them(envelope):
+    async def test(server, address):
+        first = await http(address, 'POST', '/evaluate', {'envelope': envelope})
+        second = await http(address, 'POST', '/evaluate', envelope)
+        return first, second, server.stats()
+
+    (status, headers, result), (status2, headers2, result2), stats = run(test)
+    assert status == status2 == 200
+    assert (headers['x-csr-cache'], headers2['x-csr-cache']) == ('miss', 'hit')
+    assert result == result2
+    # the wing tank's sloping plate (210) is short of its rule section modulus, the pressures of its two sides
+    # being summed at the same points
+    assert result['verdict'] is False
+    assert [i['id'] for i in result['plates'] if i['pass'] is False] == [210]
+    assert set(result['section']['checks']) == {'In50', 'Zn50,keel', 'Zn50,Depth'}
+    plate = next(i for i in result['plates'] if i['id'] == envelope['geometry'][0]['id'])
+    assert plate['thickness'] == pt.approx(envelope['geometry'][0]['plate'][2])
+    assert plate['net_thickness'] >= plate['required_net_thickness']
+    assert stats['cache']['hits'] == 1
+
+
+def test_recipes_are_part_of_the_cache_key(envelope):
+    async def test(server, address):
+        full = await http(address, 'POST', '/evaluate', {'envelope': envelope})
+        ballast = await http(address, 'POST', '/evaluate', {
+            'envelope': envelope,
+            'recipes': {'Water Ballast Condition': {'Dynamics': 'S+D', 'max value': '',
+                                                    'skip value': 'DC,LC,OIL,FW,VOID'}},
+        })
+        return full, ballast
+
+    full, ballast = run(test)
+    assert full[0] == ballast[0] == 200
+    assert ballast[1]['x-csr-cache'] == 'miss'
+
+
+def test_invalid_requests_are_rejected(envelope):
+    broken = {key: value for key, value in envelope.items() if key != 'geometry'}
+
+    async def test(server, address):
+        return [(await http(address, *args, **kwargs))[0] for args, kwargs in (
+            (('POST', '/evaluate'), {'raw': b'{not json'}),
+            (('POST', '/evaluate'), {'payload': [1, 2]}),
+            (('GET', '/evaluate'), {}),
+            (('GET', '/nowhere'), {}),
+            (('POST', '/evaluate'), {'payload': broken}),
+        )]
+
+    assert run(test) == [400, 400, 405, 404, 422]
+
+
+def test_invalid_content_lengths_are_rejected():
+    async def request(address, length):
+        reader, writer = await asyncio.open_connection(*address[:2])
+        writer.write(f'POST /evaluate HTTP/1.1\r\nContent-Length: {length}\r\n\r\n{{}}'.encode())
+        await writer.drain()
+        status = int((await reader.readline()).split()[1])
+        # the connection is closed after the response
+        await reader.read()
+        writer.close()
+        return status
+
+    async def test(server, address):
+        statuses = [await request(address, i) for i in ('abc', '-1', '1.5')]
+        return statuses, server.served
+
+    assert run(test) == ([400, 400, 400], 0)
+
+
+def test_a_full_queue_turns_requests_away(envelope):
+    async def test(server, address):
+        bodies = [{'envelope': envelope, 'recipes': {'Recipe': {'Dynamics': 'S+D', 'max value': max_value,
+                                                                'skip value': 'LC,OIL,FW,VOID'}}}
+                  for max_value in ('DC', 'WB', 'DC,WB')]
+        responses = await asyncio.gather(*(http(address, 'POST', '/evaluate', i) for i in bodies))
+        return [i[0] for i in responses], server.stats()
+
+    statuses, stats = run(test, queue_size=1)
+    assert 200 in statuses and 503 in statuses
+    assert statuses.count(503) == stats['rejected']
+    assert stats['queued'] == stats['running'] == 0
+
+
+def test_unix_socket(tmp_path):
+    async def main():
+        path = str(tmp_path / 'csr.sock')
+        server = await EvaluationServer(workers=1).start(path=path)
+        try:
+            return await http(path, 'GET', '/health')
+        finally:
+            await server.close()
+
+    status, _, body = asyncio.run(main())
+    assert (status, body) == (200, {'status': 'ok'})
@@ -1,6 +1,7 @@
 import os
 import pytest as pt
 from cli import main
+from modules.pipeline import Evaluation
 
 PROJECT_ROOT = os.path.split(os.environ['VIRTUAL_ENV'])[0]
 MOCK_SHIP_JSON_PATH = os.path.join(PROJECT_ROOT, "out/final.json")
@@ -14,3 +15,18 @@ def test_dry_cli_run_export_TeX_Code_doesnt_explode():
 
 def test_dry_cli_ship_pressure_plots_run_doesnt_explode():
     main(MOCK_SHIP_JSON_PATH, True, True, False)
+
+def test_dry_cli_screen_run_skips_the_pressures():
+    evaluation = main(MOCK_SHIP_JSON_PATH, False, False, False, screen=True)
+    assert 'section properties' in evaluation.outputs and 'static' not in evaluation.outputs
+
+def test_checkpoint_of_another_envelope_is_not_resumed(tmp_path):
+    checkpoint = str(tmp_path / 'evaluation.pkl')
+    main(MOCK_SHIP_JSON_PATH, False, False, False, screen=True, checkpoint=checkpoint)
+    assert main(MOCK_SHIP_JSON_PATH, False, False, False, screen=True, checkpoint=checkpoint).filepath == \
+           MOCK_SHIP_JSON_PATH
+    other = tmp_path / 'other.json'
+    other.write_bytes(open(MOCK_SHIP_JSON_PATH, 'rb').read())
+    evaluation = main(str(other), False, False, False, screen=True, checkpoint=checkpoint)
+    assert evaluation.filepath == str(other)
+    assert Evaluation.resume(checkpoint).filepath == str(other)